@@ -23,14 +23,24 @@ This module provides the base implementation for pyRFXtrx
 # pylint: disable=R0903, invalid-name
 # pylint: disable= too-many-lines
 
+import asyncio
 import functools
+import gc
 import glob
+import heapq
+import io
+import queue
+import random
+import selectors
 import socket
 import threading
 import logging
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import suppress
 
-from time import sleep
+from time import monotonic, sleep
 
 import serial
 
@@ -44,15 +54,46 @@ _LOGGER = logging.getLogger(__name__)
 ###############################################################################
 
 class RFXtrxDevice:
-    """ Superclass for all devices """
+    """ Superclass for all devices.
+
+    The type_string and id_string of a received packet are taken from it on
+    first use, so the packet must not be reloaded before that (see
+    :meth:`_take_strings`).
+    """
+
+    __slots__ = ('packettype', 'subtype', '_type_string', '_id_string',
+                 '_pkt', 'known_to_be_dimmable', 'known_to_be_rollershutter')
 
     def __init__(self, pkt):
         self.packettype = pkt.packettype
         self.subtype = pkt.subtype
-        self.type_string = pkt.type_string
-        self.id_string = pkt.id_string
+        self._pkt = pkt
+        self._type_string = None
+        self._id_string = None
         self.known_to_be_dimmable = False
         self.known_to_be_rollershutter = False
+        #  pylint: disable=protected-access
+        if not pkt._strings_pending:
+            self._take_strings()
+
+    @property
+    def type_string(self):
+        """ The device type as a string """
+        self._take_strings()
+        return self._type_string
+
+    @property
+    def id_string(self):
+        """ The device id as a string """
+        self._take_strings()
+        return self._id_string
+
+    def _take_strings(self):
+        """ Take the strings of the packet, once, and let go of it """
+        pkt, self._pkt = self._pkt, None
+        if pkt is not None:
+            self._type_string = pkt.type_string
+            self._id_string = pkt.id_string
 
     def __eq__(self, other):
         if self.packettype != other.packettype:
@@ -72,6 +113,9 @@ class RFXtrxDevice:
 
 class RollerTrolDevice(RFXtrxDevice):
     """ Concrete class for a roller device """
+
+    __slots__ = ('cmndseqnbr', 'id_combined', 'unitcode', 'COMMANDS')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         if isinstance(pkt, lowlevel.RollerTrol):
@@ -92,23 +136,26 @@ class RollerTrolDevice(RFXtrxDevice):
             command
         )
         self.cmndseqnbr = (self.cmndseqnbr + 1) % 5
-        transport.send(pkt.data)
+        return transport.send(pkt.data)
 
     def send_close(self, transport):
         """ Send a 'Close' command using the given transport """
-        self.send_command(transport, 0x01)
+        return self.send_command(transport, 0x01)
 
     def send_open(self, transport):
         """ Send an 'Open' command using the given transport """
-        self.send_command(transport, 0x00)
+        return self.send_command(transport, 0x00)
 
     def send_stop(self, transport):
         """ Send a 'Stop' command using the given transport """
-        self.send_command(transport, 0x02)
+        return self.send_command(transport, 0x02)
 
 
 class DDxxxxDevice(RFXtrxDevice):
     """ Concrete class for a DDxxxx device """
+
+    __slots__ = ('cmndseqnbr', 'id_combined', 'unitcode', 'COMMANDS')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         if isinstance(pkt, lowlevel.DDxxxx):
@@ -136,27 +183,27 @@ class DDxxxxDevice(RFXtrxDevice):
             angle
         )
         self.cmndseqnbr = (self.cmndseqnbr + 1) % 5
-        transport.send(pkt.data)
+        return transport.send(pkt.data)
 
     def send_up(self, transport):
         """ Send an 'Open' command using the given transport """
-        self.send_command(transport, lowlevel.DDxxxx.CMD_UP)
+        return self.send_command(transport, lowlevel.DDxxxx.CMD_UP)
 
     def send_down(self, transport):
         """ Send a 'Close' command using the given transport """
-        self.send_command(transport, lowlevel.DDxxxx.CMD_DOWN)
+        return self.send_command(transport, lowlevel.DDxxxx.CMD_DOWN)
 
     def send_stop(self, transport):
         """ Send a 'Stop' command using the given transport """
-        self.send_command(transport, lowlevel.DDxxxx.CMD_STOP)
+        return self.send_command(transport, lowlevel.DDxxxx.CMD_STOP)
 
     def send_p2(self, transport):
         """ Send a 'P2' command using the given transport """
-        self.send_command(transport, lowlevel.DDxxxx.CMD_P2)
+        return self.send_command(transport, lowlevel.DDxxxx.CMD_P2)
 
     def send_percent(self, transport, percent: int):
         """ Send a 'Percent' command using the given transport """
-        self.send_command(
+        return self.send_command(
             transport,
             lowlevel.DDxxxx.CMD_PERCENT,
             percent=percent
@@ -164,11 +211,12 @@ class DDxxxxDevice(RFXtrxDevice):
 
     def send_angle(self, transport, angle: int):
         """ Send a 'Angle' command using the given transport """
-        self.send_command(transport, lowlevel.DDxxxx.CMD_ANGLE, angle=angle)
+        return self.send_command(transport, lowlevel.DDxxxx.CMD_ANGLE,
+                                 angle=angle)
 
     def send_percent_angle(self, transport, percent: int, angle: int):
         """ Send a 'Angle' command using the given transport """
-        self.send_command(
+        return self.send_command(
             transport,
             lowlevel.DDxxxx.CMD_PERCENT_ANGLE,
             percent=percent,
@@ -178,6 +226,9 @@ class DDxxxxDevice(RFXtrxDevice):
 
 class RfyDevice(RFXtrxDevice):
     """ Concrete class for a roller device """
+
+    __slots__ = ('cmndseqnbr', 'id_combined', 'unitcode', 'COMMANDS')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         if isinstance(pkt, lowlevel.Rfy):
@@ -198,48 +249,50 @@ class RfyDevice(RFXtrxDevice):
             command
         )
         self.cmndseqnbr = (self.cmndseqnbr + 1) % 5
-        transport.send(pkt.data)
+        return transport.send(pkt.data)
 
     def send_close(self, transport):
         """ Send a 'Close' command using the given transport """
-        self.send_command(transport, 0x03)
+        return self.send_command(transport, 0x03)
 
     def send_open(self, transport):
         """ Send an 'Open' command using the given transport """
-        self.send_command(transport, 0x01)
+        return self.send_command(transport, 0x01)
 
     def send_stop(self, transport):
         """ Send a 'Stop' command using the given transport """
-        self.send_command(transport, 0x00)
+        return self.send_command(transport, 0x00)
 
     def send_on(self, transport):
         """ Send an 'Enable Sun Automation' command """
-        self.send_command(transport, 0x13)
+        return self.send_command(transport, 0x13)
 
     def send_off(self, transport):
         """ Send an 'Disable Sun Automation' command """
-        self.send_command(transport, 0x14)
+        return self.send_command(transport, 0x14)
 
     def send_up05sec(self, transport):
         """ Send a '0.5 Seconds Up' command """
-        self.send_command(transport, 0x0F)
+        return self.send_command(transport, 0x0F)
 
     def send_down05sec(self, transport):
         """ Send a '0.5 Seconds Down' command """
-        self.send_command(transport, 0x10)
+        return self.send_command(transport, 0x10)
 
     def send_up2sec(self, transport):
         """ Send a '2 Seconds Up' command """
-        self.send_command(transport, 0x11)
+        return self.send_command(transport, 0x11)
 
     def send_down2sec(self, transport):
         """ Send a '2 Seconds Down' command """
-        self.send_command(transport, 0x12)
+        return self.send_command(transport, 0x12)
 
 
 class FunkDevice(RFXtrxDevice):
     """ Concrete class for a control device """
 
+    __slots__ = ('id_combined', 'groupcode', 'target', 'COMMANDS')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         if isinstance(pkt, lowlevel.Funkbus):
@@ -258,77 +311,80 @@ class FunkDevice(RFXtrxDevice):
                          param if command in [0x00, 0x01, 0x04] else 0x00,
                          command,
                          duration)
-        transport.send(pkt.data)
+        return transport.send(pkt.data)
 
     def send_onoff(self, transport, turn_on):
         """ Send on 'On' or 'Off' command using the given transport """
-        self.send_command(transport,
-                          0x01 if turn_on else 0x00,
-                          self.target,
-                          0x00)
+        return self.send_command(transport,
+                                 0x01 if turn_on else 0x00,
+                                 self.target,
+                                 0x00)
 
     def send_on(self, transport):
         """ Send an 'On' command using the given transport """
-        self.send_onoff(transport, True)
+        return self.send_onoff(transport, True)
 
     def send_off(self, transport):
         """ Send an 'Off' command using the given transport """
-        self.send_onoff(transport, False)
+        return self.send_onoff(transport, False)
 
     def send_dim(self, transport, duration):
         """ Send a 'Dim' command using the given transport """
-        self.send_command(transport,
-                          0x00,
-                          self.target,
-                          duration + 1)
+        return self.send_command(transport,
+                                 0x00,
+                                 self.target,
+                                 duration + 1)
 
     def send_bright(self, transport, duration):
         """ Send a 'Bright' command using the given transport """
-        self.send_command(transport,
-                          0x01,
-                          self.target,
-                          duration + 1)
+        return self.send_command(transport,
+                                 0x01,
+                                 self.target,
+                                 duration + 1)
 
     def send_alloff(self, transport):
         """ Send an 'All OFF' command using the given transport """
-        self.send_command(transport,
-                          0x02,
-                          0x00,
-                          0x03)
+        return self.send_command(transport,
+                                 0x02,
+                                 0x00,
+                                 0x03)
 
     def send_allon(self, transport):
         """ Send a 'All ON' command using the given transport """
-        self.send_command(transport,
-                          0x03,
-                          0x00,
-                          0x03)
+        return self.send_command(transport,
+                                 0x03,
+                                 0x00,
+                                 0x03)
 
     def send_setscene(self, transport, scene):
         """ Send a 'Scene' command using the given transport """
-        self.send_command(transport,
-                          0x04,
-                          scene,
-                          0x01)
+        return self.send_command(transport,
+                                 0x04,
+                                 scene,
+                                 0x01)
 
     def send_masterdim(self, transport, duration):
         """ Send a 'Master Dim' command using the given transport """
-        self.send_command(transport,
-                          0x05,
-                          0x00,
-                          duration + 1)
+        return self.send_command(transport,
+                                 0x05,
+                                 0x00,
+                                 duration + 1)
 
     def send_masterbright(self, transport, duration):
         """ Send a 'Bright' command using the given transport """
-        self.send_command(transport,
-                          0x06,
-                          0x00,
-                          duration + 1)
+        return self.send_command(transport,
+                                 0x06,
+                                 0x00,
+                                 duration + 1)
 
 
 class LightingDevice(RFXtrxDevice):
     """ Concrete class for a control device """
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ('housecode', 'unitcode', 'COMMANDS', 'id_combined', 'system',
+                 'channel', 'cmd', 'pulse', 'groupcode', 'cmndseqnbr')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         if isinstance(pkt, lowlevel.Lighting1):
@@ -373,58 +429,58 @@ class LightingDevice(RFXtrxDevice):
             pkt = lowlevel.Lighting1()
             pkt.set_transmit(self.subtype, 0, self.housecode, self.unitcode,
                              command)
-            transport.send(pkt.data)
         elif self.packettype == 0x11:  # Lighting2
             pkt = lowlevel.Lighting2()
             pkt.set_transmit(self.subtype, 0, self.id_combined, self.unitcode,
                              command, 0x00)
-            transport.send(pkt.data)
         elif self.packettype == 0x12:  # Lighting3
             pkt = lowlevel.Lighting3()
             pkt.set_transmit(self.subtype, 0, self.system, self.channel,
                              command)
-            transport.send(pkt.data)
         elif self.packettype == 0x13:  # Lighting4
             pkt = lowlevel.Lighting4()
             code = self.cmd & ~1
             code |= command
             pkt.set_transmit(self.subtype, 0, code, self.pulse)
-            transport.send(pkt.data)
         elif self.packettype == 0x14:  # Lighting5
             pkt = lowlevel.Lighting5()
             pkt.set_transmit(self.subtype, 0, self.id_combined, self.unitcode,
                              command, 0x00)
-            transport.send(pkt.data)
         elif self.packettype == 0x15:  # Lighting6
             pkt = lowlevel.Lighting6()
             pkt.set_transmit(self.subtype, 0, self.id_combined, self.groupcode,
                              self.unitcode,
                              command, self.cmndseqnbr)
             self.cmndseqnbr = (self.cmndseqnbr + 1) % 5
-            transport.send(pkt.data)
+        else:
+            return None
+        return transport.send(pkt.data)
 
     def send_onoff(self, transport, turn_on):
         """ Send an 'On' or 'Off' command using the given transport """
         if self.packettype == 0x10:  # Lighting1
-            self.send_command(transport, turn_on and 0x01 or 0x00)
+            command = 0x01 if turn_on else 0x00
         elif self.packettype == 0x11:  # Lighting2
-            self.send_command(transport, turn_on and 0x01 or 0x00)
+            command = 0x01 if turn_on else 0x00
         elif self.packettype == 0x12:  # Lighting3
-            self.send_command(transport, turn_on and 0x10 or 0x1a)
+            command = 0x10 if turn_on else 0x1a
         elif self.packettype == 0x13:  # Lighting4
-            self.send_command(transport, 0x1 if turn_on else 0x0)
+            command = 0x1 if turn_on else 0x0
         elif self.packettype == 0x14:  # Lighting5
-            self.send_command(transport, turn_on and 0x01 or 0x00)
+            command = 0x01 if turn_on else 0x00
         elif self.packettype == 0x15:  # Lighting6
-            self.send_command(transport, not turn_on and 0x01 or 0x00)
+            command = 0x00 if turn_on else 0x01
+        else:
+            return None
+        return self.send_command(transport, command)
 
     def send_on(self, transport):
         """ Send an 'On' command using the given transport """
-        self.send_onoff(transport, True)
+        return self.send_onoff(transport, True)
 
     def send_off(self, transport):
         """ Send an 'Off' command using the given transport """
-        self.send_onoff(transport, False)
+        return self.send_onoff(transport, False)
 
     def send_openclosestop(self, transport, command):
         """ Send an 'Open' or a 'Close' or a 'Stop' command
@@ -432,21 +488,20 @@ class LightingDevice(RFXtrxDevice):
         if self.packettype == 0x14:  # Lighting5
             if command not in [0x0d, 0x0e, 0x0f]:
                 raise ValueError(command, "is not a relay packet in Lighting5")
-            self.send_command(transport, command)
-        else:
-            raise ValueError("Unsupported packettype")
+            return self.send_command(transport, command)
+        raise ValueError("Unsupported packettype")
 
     def send_open(self, transport):
         """ Send an 'Open' command using the given transport """
-        self.send_openclosestop(transport, 0x0f)
+        return self.send_openclosestop(transport, 0x0f)
 
     def send_close(self, transport):
         """ Send an 'Close' command using the given transport """
-        self.send_openclosestop(transport, 0x0d)
+        return self.send_openclosestop(transport, 0x0d)
 
     def send_stop(self, transport):
         """ Send an 'Stop' command using the given transport """
-        self.send_openclosestop(transport, 0x0e)
+        return self.send_openclosestop(transport, 0x0e)
 
     def send_dim(self, transport, level):
         """ Send a 'Dim' command with the given level using the given
@@ -462,42 +517,40 @@ class LightingDevice(RFXtrxDevice):
             # RFXtrx does not support sending extended commands
         if self.packettype == 0x11:  # Lighting2
             if level == 0:
-                self.send_off(transport)
-            else:
-                pkt = lowlevel.Lighting2()
-                pkt.set_transmit(self.subtype, 0, self.id_combined,
-                                 self.unitcode, 0x02,
-                                 ((level + 6) * 16 // 100) - 1)
-                transport.send(pkt.data)
+                return self.send_off(transport)
+            pkt = lowlevel.Lighting2()
+            pkt.set_transmit(self.subtype, 0, self.id_combined,
+                             self.unitcode, 0x02,
+                             ((level + 6) * 16 // 100) - 1)
         elif self.packettype == 0x12:  # Lighting3
             if level == 0:
-                self.send_off(transport)
-            elif level == 100:
-                self.send_on(transport)
-            else:
-                pkt = lowlevel.Lighting3()
-                pkt.set_transmit(self.subtype, 0, self.system, self.channel,
-                                 (level * 9 // 100) + 17)
-                transport.send(pkt.data)
+                return self.send_off(transport)
+            if level == 100:
+                return self.send_on(transport)
+            pkt = lowlevel.Lighting3()
+            pkt.set_transmit(self.subtype, 0, self.system, self.channel,
+                             (level * 9 // 100) + 17)
         elif self.packettype == 0x14:  # Lighting5
             if level == 0:
-                self.send_off(transport)
-            else:
-                pkt = lowlevel.Lighting5()
-                pkt.set_transmit(self.subtype, 0, self.id_combined,
-                                 self.unitcode, 0x10,
-                                 ((level + 3) * 32 // 100) - 1)
-                transport.send(pkt.data)
+                return self.send_off(transport)
+            pkt = lowlevel.Lighting5()
+            pkt.set_transmit(self.subtype, 0, self.id_combined,
+                             self.unitcode, 0x10,
+                             ((level + 3) * 32 // 100) - 1)
         elif self.packettype == 0x15:  # Lighting6
             raise ValueError("Dim level unsupported for Lighting6")
         elif self.packettype == 0x1e:  # Funkbus
             raise ValueError("Dim level unsupported for Funkbus")
         else:
             raise ValueError("Unsupported packettype")
+        return transport.send(pkt.data)
 
 
 class ChimeDevice(RFXtrxDevice):
     """ Concrete class for a control device """
+
+    __slots__ = ('id1', 'id2', 'COMMANDS')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         self.id1 = pkt.id1
@@ -508,7 +561,7 @@ class ChimeDevice(RFXtrxDevice):
         """Trigger a chime sound on device."""
         pkt = lowlevel.Chime()
         pkt.set_transmit(self.subtype, 0, self.id1, self.id2, sound)
-        transport.send(pkt.data)
+        return transport.send(pkt.data)
 
 ###############################################################################
 # get_device_from_pkt method
@@ -542,6 +595,8 @@ def get_device_from_pkt(pkt):
 class SecurityDevice(RFXtrxDevice):
     """ Concrete class for a control device """
 
+    __slots__ = ('id_combined', 'cmndseqnbr', 'STATUS')
+
     def __init__(self, pkt):
         super().__init__(pkt)
         self.id_combined = pkt.id_combined
@@ -558,7 +613,7 @@ class SecurityDevice(RFXtrxDevice):
             status
         )
         self.cmndseqnbr = (self.cmndseqnbr + 1) % 5
-        transport.send(pkt.data)
+        return transport.send(pkt.data)
 
 
 ###############################################################################
@@ -581,9 +636,21 @@ def get_device(packettype, subtype, id_string):
 class RFXtrxEvent:
     """ Abstract superclass for all events """
 
+    __slots__ = ('device', 'data')
+
     def __init__(self, device):
         self.device = device
 
+    def copy(self):
+        """ Return an event that later frames leave alone, to keep an event
+        of a :class:`ReceivePool` past the next frame """
+        data = getattr(self, 'data', None)
+        if data is None:
+            return self
+        event = RFXtrxTransport.parse(bytearray(data))
+        event.device = self.device
+        return event
+
 
 ###############################################################################
 # SensorEvent class
@@ -592,99 +659,121 @@ class RFXtrxEvent:
 class SensorEvent(RFXtrxEvent):
     """ Concrete class for sensor events """
 
+    __slots__ = ('pkt', '_values')
+
     def __init__(self, pkt):
-        #  pylint: disable=too-many-branches, too-many-statements
         device = get_device_from_pkt(pkt)
         super().__init__(device)
+        self._load(pkt)
 
-        self.values = {}
+    def _load(self, pkt):
+        """ Take the values of pkt """
         self.pkt = pkt
+        self._values = None
+
+    @property
+    def values(self):
+        """ The values of the packet by name, built on first access """
+        if self._values is None:
+            self._values = self._decode_values(self.pkt)
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+
+    @staticmethod
+    def _decode_values(pkt):
+        """ Return the values of a sensor packet by name """
+        #  pylint: disable=too-many-branches, too-many-statements
+        values = {}
         if isinstance(pkt, lowlevel.Undecoded):
-            self.values['Payload'] = pkt.payload.hex()
+            values['Payload'] = pkt.payload.hex()
         if isinstance(pkt, lowlevel.RfxMeter):
-            self.values['Counter value'] = pkt.value
+            values['Counter value'] = pkt.value
         if isinstance(pkt, (lowlevel.Temp, lowlevel.TempHumid,
                             lowlevel.TempHumidBaro, lowlevel.TempRain)):
-            self.values['Temperature'] = pkt.temp
+            values['Temperature'] = pkt.temp
         if isinstance(pkt, lowlevel.Bbq):
-            self.values['Temperature'] = pkt.temp1
-            self.values['Temperature2'] = pkt.temp2
+            values['Temperature'] = pkt.temp1
+            values['Temperature2'] = pkt.temp2
         if isinstance(pkt, (lowlevel.Humid, lowlevel.TempHumid,
                             lowlevel.TempHumidBaro)):
-            self.values['Humidity'] = pkt.humidity
-            self.values['Humidity status'] = pkt.humidity_status_string
-            self.values['Humidity status numeric'] = pkt.humidity_status
+            values['Humidity'] = pkt.humidity
+            values['Humidity status'] = pkt.humidity_status_string
+            values['Humidity status numeric'] = pkt.humidity_status
         if isinstance(pkt, (lowlevel.Baro, lowlevel.TempHumidBaro)):
-            self.values['Barometer'] = pkt.baro
-            self.values['Forecast'] = pkt.forecast_string
-            self.values['Forecast numeric'] = pkt.forecast
+            values['Barometer'] = pkt.baro
+            values['Forecast'] = pkt.forecast_string
+            values['Forecast numeric'] = pkt.forecast
         if isinstance(pkt, lowlevel.Rain):
-            self.values['Rain rate'] = pkt.rainrate
-            self.values['Rain total'] = pkt.raintotal
+            values['Rain rate'] = pkt.rainrate
+            values['Rain total'] = pkt.raintotal
         if isinstance(pkt, lowlevel.TempRain):
-            self.values['Rain total'] = pkt.raintotal
+            values['Rain total'] = pkt.raintotal
         if isinstance(pkt, lowlevel.Wind):
-            self.values['Wind direction'] = pkt.direction
-            self.values['Wind average speed'] = pkt.average_speed
-            self.values['Wind gust'] = pkt.gust
+            values['Wind direction'] = pkt.direction
+            values['Wind average speed'] = pkt.average_speed
+            values['Wind gust'] = pkt.gust
             if pkt.temperature is not None:
-                self.values['Temperature'] = pkt.temperature
+                values['Temperature'] = pkt.temperature
             if pkt.chill is not None:
-                self.values['Chill'] = pkt.chill
+                values['Chill'] = pkt.chill
         if isinstance(pkt, lowlevel.UV):
-            self.values['UV'] = pkt.uvi
+            values['UV'] = pkt.uvi
         if isinstance(pkt, lowlevel.Energy):
-            self.values['Energy usage'] = pkt.currentwatt
-            self.values['Total usage'] = pkt.totalwatts
-            self.values['Count'] = pkt.count
+            values['Energy usage'] = pkt.currentwatt
+            values['Total usage'] = pkt.totalwatts
+            values['Count'] = pkt.count
         if isinstance(pkt, lowlevel.Energy1):
-            self.values['Current Ch. 1'] = pkt.currentamps1
-            self.values['Current Ch. 2'] = pkt.currentamps2
-            self.values['Current Ch. 3'] = pkt.currentamps3
+            values['Current Ch. 1'] = pkt.currentamps1
+            values['Current Ch. 2'] = pkt.currentamps2
+            values['Current Ch. 3'] = pkt.currentamps3
             # CM113/ELEC1 doesn't have a 'total usage' counter, so provide an
             # aggregated virtual value
-            self.values['Total usage'] = (pkt.currentamps1 + pkt.currentamps2
-                                          + pkt.currentamps3)
-            self.values['Count'] = pkt.count
+            values['Total usage'] = (pkt.currentamps1 + pkt.currentamps2
+                                     + pkt.currentamps3)
+            values['Count'] = pkt.count
         if isinstance(pkt, lowlevel.Energy4):
-            self.values['Current Ch. 1'] = pkt.currentamps1
-            self.values['Current Ch. 2'] = pkt.currentamps2
-            self.values['Current Ch. 3'] = pkt.currentamps3
-            self.values['Total usage'] = pkt.totalwatthours
-            self.values['Count'] = pkt.count
+            values['Current Ch. 1'] = pkt.currentamps1
+            values['Current Ch. 2'] = pkt.currentamps2
+            values['Current Ch. 3'] = pkt.currentamps3
+            values['Total usage'] = pkt.totalwatthours
+            values['Count'] = pkt.count
         if isinstance(pkt, lowlevel.Energy5):
-            self.values['Voltage'] = pkt.voltage
-            self.values['Current'] = pkt.currentamps
-            self.values['Energy usage'] = pkt.currentwatt
-            self.values['Total usage'] = pkt.totalwatthours
+            values['Voltage'] = pkt.voltage
+            values['Current'] = pkt.currentamps
+            values['Energy usage'] = pkt.currentwatt
+            values['Total usage'] = pkt.totalwatthours
         if isinstance(pkt, lowlevel.Cartelectronic):
             if pkt.type_string == 'CARTELECTRONIC_ENCODER':
-                self.values['Counter value'] = pkt.counter1
-                self.values['Count'] = pkt.counter2
+                values['Counter value'] = pkt.counter1
+                values['Count'] = pkt.counter2
             elif pkt.type_string == 'CARTELECTRONIC_LINKY':
                 # Index for current tarif if consummer
-                self.values['Total usage'] = pkt.conswatthours
+                values['Total usage'] = pkt.conswatthours
                 # Index for current tarif if production
-                self.values['Count'] = pkt.prodwatthours
+                values['Count'] = pkt.prodwatthours
                 # Index of current tarif
-                self.values['Counter value'] = pkt.tarif_num
-                self.values['Voltage'] = pkt.voltage
-                self.values['Energy usage'] = pkt.currentwatt
-                self.values['Sensor Status'] = pkt.teleinfo_ok
+                values['Counter value'] = pkt.tarif_num
+                values['Voltage'] = pkt.voltage
+                values['Energy usage'] = pkt.currentwatt
+                values['Sensor Status'] = pkt.teleinfo_ok
             elif pkt.type_string == 'CARTELECTRONIC_TIC':
-                self.values['Counter value'] = pkt.counter1
-                self.values['Count'] = pkt.counter2
-                self.values['Energy usage'] = pkt.currentwatt
-                self.values['Sensor Status'] = pkt.teleinfo_ok
-                self.values['Contract type'] = pkt.contract_type
+                values['Counter value'] = pkt.counter1
+                values['Count'] = pkt.counter2
+                values['Energy usage'] = pkt.currentwatt
+                values['Sensor Status'] = pkt.teleinfo_ok
+                values['Contract type'] = pkt.contract_type
         if isinstance(pkt, lowlevel.Security1):
-            self.values['Sensor Status'] = pkt.security1_status_string
+            values['Sensor Status'] = pkt.security1_status_string
         if not isinstance(pkt, (lowlevel.Energy5,
                                 lowlevel.RfxMeter,
                                 lowlevel.Undecoded)):
-            self.values['Battery numeric'] = pkt.battery
+            values['Battery numeric'] = pkt.battery
         if not isinstance(pkt, lowlevel.Undecoded):
-            self.values["Rssi numeric"] = pkt.rssi
+            values["Rssi numeric"] = pkt.rssi
+        return values
 
     def __str__(self):
         return "{0} device=[{1}] values={2}".format(
@@ -698,10 +787,17 @@ class SensorEvent(RFXtrxEvent):
 class ControlEvent(RFXtrxEvent):
     """ Concrete class for control events """
 
+    __slots__ = ('values',)
+
     def __init__(self, pkt):
         device = get_device_from_pkt(pkt)
         super().__init__(device)
+        self._load(pkt)
+        # _load decoded the strings of pkt already
+        device._take_strings()  # pylint: disable=protected-access
 
+    def _load(self, pkt):
+        """ Take the values of pkt """
         self.values = {}
         self.values['Command'] = pkt.value('cmnd_string')
         if isinstance(pkt, lowlevel.Lighting2) and pkt.cmnd in [2, 5]:
@@ -738,6 +834,19 @@ class ControlEvent(RFXtrxEvent):
 
 class StatusEvent(RFXtrxEvent):
     """ Concrete class for status """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return "{0} device=[{1}]".format(
+            type(self), self.device)
+
+
+class ResponseEvent(RFXtrxEvent):
+    """ Concrete class for a transmitter response (ACK or NAK) """
+
+    __slots__ = ()
+
     def __str__(self):
         return "{0} device=[{1}]".format(
             type(self), self.device)
@@ -745,6 +854,9 @@ class StatusEvent(RFXtrxEvent):
 
 class ConnectionEvent(RFXtrxEvent):
     """ Connection event """
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(None)
 
@@ -752,9 +864,174 @@ class ConnectionEvent(RFXtrxEvent):
 class ConnectionLost(ConnectionEvent):
     """ Connection lost """
 
+    __slots__ = ()
+
 
 class ConnectionDone(ConnectionEvent):
-    """ Connection lost """
+    """ Connection done. After an automatic reconnect, reconnect_latency
+    holds the seconds between losing the link and being connected again.
+    """
+
+    __slots__ = ('reconnect_latency',)
+
+    def __init__(self, reconnect_latency=None):
+        super().__init__()
+        self.reconnect_latency = reconnect_latency
+
+
+###############################################################################
+# EventStream class
+###############################################################################
+
+
+class EventStream:
+    """ Bounded queue of events consumed with ``async for``.
+
+    Events are put from the thread reading the device and taken on the
+    event loop the stream was created on. When the queue is full, the
+    overflow policy decides what happens to a new event:
+
+    * ``block``: the reader waits until the consumer has made room,
+    * ``drop_oldest``: the oldest queued event is discarded,
+    * ``coalesce``: a queued event of the same device is replaced by the
+      new one, otherwise the oldest queued event is discarded.
+
+    The optional packettypes, subtypes and ids (device id_strings) filters
+    are checked before an event is queued. Connection events always pass.
+    """
+    #  pylint: disable=too-many-instance-attributes
+
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    COALESCE = 'coalesce'
+    OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+    #  pylint: disable=too-many-arguments
+    def __init__(self, maxsize=100, overflow=DROP_OLDEST, packettypes=None,
+                 subtypes=None, ids=None, loop=None):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy " + str(overflow))
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.packettypes = None if packettypes is None else set(packettypes)
+        self.subtypes = None if subtypes is None else set(subtypes)
+        self.ids = None if ids is None else set(ids)
+        self.dropped = 0
+        self.on_close = None
+        self.on_drained = None
+        self._loop = loop or asyncio.get_running_loop()
+        self._queue = OrderedDict()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._waiter = None
+        self._paused = False
+        self._closed = False
+
+    def __len__(self):
+        return len(self._queue)
+
+    def accepts(self, event):
+        """ Return True if the event passes the filters of this stream """
+        device = event.device
+        if device is None:
+            return True
+        if (self.packettypes is not None
+                and device.packettype not in self.packettypes):
+            return False
+        if self.subtypes is not None and device.subtype not in self.subtypes:
+            return False
+        return self.ids is None or device.id_string in self.ids
+
+    def _key(self, event):
+        if self.overflow == self.COALESCE and event.device is not None:
+            return (type(event), event.device.packettype,
+                    event.device.subtype, event.device.id_string)
+        return object()
+
+    def put(self, event, wait=True):
+        """ Queue an event, applying the filters and overflow policy.
+
+        With the ``block`` policy and wait set, this blocks until there is
+        room. Without wait (on the event loop itself, which must not
+        block) the event is queued over the limit instead and False is
+        returned, so the caller can stop reading until the consumer has
+        caught up and :attr:`on_drained` is called.
+        """
+        if self._closed or not self.accepts(event):
+            return True
+        key = self._key(event)
+        with self._lock:
+            if key in self._queue:
+                self._queue[key] = event
+                return True
+            room = True
+            if len(self._queue) >= self.maxsize:
+                if self.overflow != self.BLOCK:
+                    self._queue.popitem(last=False)
+                    self.dropped += 1
+                elif wait:
+                    while len(self._queue) >= self.maxsize \
+                            and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        return True
+                else:
+                    self._paused = True
+                    room = False
+            self._queue[key] = event
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._loop.call_soon_threadsafe(self._wake, waiter)
+        return room
+
+    @staticmethod
+    def _wake(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def close(self):
+        """ End the stream, the consumer gets the events already queued """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_full.notify_all()
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._loop.call_soon_threadsafe(self._wake, waiter)
+        if self.on_close:
+            self.on_close(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            with self._lock:
+                if self._queue:
+                    event = self._queue.popitem(last=False)[1]
+                    self._not_full.notify()
+                    drained = (self._paused
+                               and len(self._queue) < self.maxsize)
+                    if drained:
+                        self._paused = False
+                    break
+                if self._closed:
+                    raise StopAsyncIteration
+                self._waiter = self._loop.create_future()
+                waiter = self._waiter
+            await waiter
+        if drained and self.on_drained:
+            self.on_drained(self)
+        return event
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
 
 
 ###############################################################################
@@ -766,7 +1043,10 @@ class _dummySerial:
     """ Dummy class for testing"""
     # pylint: disable=unused-argument
     def __init__(self, *args, **kwargs):
-        self._read_num = 0
+        self._read_num = 2
+        self._started = False
+        self._responses = deque()
+        self.timeout = None
         self._data = {}
         self._data[0] = [0x0D, 0x01, 0x00, 0x01, 0x02, 0x53, 0x45,  # status
                          0x10,  # msg3: rsl
@@ -774,8 +1054,9 @@ class _dummySerial:
                          0x2F,  # msg5: x10 arc ac homeeasy oregon
                          0x01,  # msg6: keeloq
                          0x01, 0x00, 0x00]
-        self._data[1] = [0x00, 0x00, 0x00, 0x00, 0x00,  # response to start
-                         0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
+        self._data[1] = [0x14, 0x01, 0x07, 0x03, 0x07,  # response to start
+                         0x43, 0x6f, 0x70, 0x79, 0x72, 0x69, 0x67, 0x68,
+                         0x74, 0x20, 0x52, 0x46, 0x58, 0x43, 0x4f, 0x4d]
         self._data[2] = [0x0b, 0x15, 0x00, 0x2a, 0x12,
                          0x34, 0x41, 0x05, 0x03, 0x01, 0x00, 0x70]  # light
         self._data[3] = [0x0b, 0x15, 0x00, 0x2a, 0x12,
@@ -790,22 +1071,43 @@ class _dummySerial:
                          0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # sensor2
         self._data[8] = [0x09, 0x03, 0x01, 0x1e,
                          0x28, 0x0a, 0xb7, 0x66, 0x04, 0x74]  # undecoded
+        self._pending = b''
         self._close_event = threading.Event()
 
-    def write(self, *args, **kwargs):
-        """ Dummy function for writing"""
+    def write(self, data, *args, **kwargs):
+        """ Dummy function for writing, answering interface commands """
+        if len(data) > 4 and data[1] == 0x00:
+            if data[4] in (0x02, 0x03):  # get status, set mode
+                self._responses.append(bytes(self._data[0]))
+            elif data[4] == 0x07:  # start receiver
+                self._responses.append(bytes(self._data[1]))
+                self._started = True
 
     # pylint: disable=invalid-name
     def flushInput(self, *args, **kwargs):
         """ Called by PySerialTransport"""
 
-    def read(self, data=None):
+    @property
+    def in_waiting(self):
+        """ Number of bytes left of the packet being read """
+        if not self._pending and self._responses:
+            self._pending = self._responses.popleft()
+        if not self._pending and self._started \
+                and self._read_num < len(self._data):
+            self._pending = bytes(self._data[self._read_num])
+            self._read_num = self._read_num + 1
+        return len(self._pending)
+
+    def read(self, size=1):
         """ Dummy function for reading"""
-        if data is not None or self._read_num >= len(self._data):
+        if not self.in_waiting:
+            if self.timeout is not None:
+                self._close_event.wait(min(self.timeout, 0.1))
+                return b''
             self._close_event.wait(0.1)
-            return [0x00]
-        res = self._data[self._read_num]
-        self._read_num = self._read_num + 1
+            return b'\x00'
+        res = self._pending[:size]
+        self._pending = self._pending[size:]
         return res
 
     def close(self):
@@ -821,6 +1123,362 @@ class _dummySerial:
 class RFXtrxTransportError(Exception):
     """ Connection error """
 
+###############################################################################
+# FrameBuffer class
+###############################################################################
+
+
+class FrameBuffer:
+    """ Preallocated receive buffer that splits a byte stream into frames.
+
+    Bytes are appended at the tail (either with :meth:`feed` or by reading
+    straight into :meth:`writable`) and complete length-prefixed frames are
+    taken from the head with :meth:`pop_frame`. Unconsumed bytes are moved
+    back to the start of the buffer only when the free tail becomes too
+    small to hold a maximum sized frame. When even that leaves too little
+    room, as after a burst read while a frame was pending, the bytes move
+    to a buffer twice the size.
+    """
+
+    MAX_FRAME = 256
+    """ Largest possible frame: a length byte of 0xff plus its payload """
+
+    def __init__(self, size=4096):
+        if size < 2 * self.MAX_FRAME:
+            raise ValueError("Buffer must hold at least two frames")
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def clear(self):
+        """ Drop all buffered bytes """
+        self._start = 0
+        self._end = 0
+
+    def writable(self):
+        """ Return a writable view of the free tail of the buffer """
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif len(self._buffer) - self._end < self.MAX_FRAME:
+            pending = self._end - self._start
+            buffer = self._buffer
+            if len(buffer) - pending < self.MAX_FRAME:
+                # A new buffer, as views of popped frames may still exist
+                buffer = bytearray(2 * len(buffer))
+            buffer[:pending] = self._buffer[self._start:self._end]
+            if buffer is not self._buffer:
+                self._buffer = buffer
+                self._view = memoryview(buffer)
+            self._start = 0
+            self._end = pending
+        return self._view[self._end:]
+
+    def commit(self, count):
+        """ Mark count bytes written into :meth:`writable` as received """
+        self._end += count
+
+    def feed(self, data):
+        """ Append received bytes to the buffer """
+        data = memoryview(data)
+        while data:
+            view = self.writable()
+            count = min(len(view), len(data))
+            view[:count] = data[:count]
+            self.commit(count)
+            data = data[count:]
+
+    def needed(self):
+        """ Return the number of bytes missing from the next frame """
+        pending = self._end - self._start
+        if pending == 0:
+            return 1
+        return max(self._buffer[self._start] + 1 - pending, 0)
+
+    def pop_frame(self):
+        """ Return the next complete frame as a bytearray, or None """
+        start = self._start
+        if start == self._end:
+            return None
+        end = start + self._buffer[start] + 1
+        if end > self._end:
+            return None
+        self._start = end
+        return self._buffer[start:end]
+
+    def pop_view(self):
+        """ Return the next complete frame as a view into the buffer, valid
+        until more bytes are added, or None """
+        start = self._start
+        if start == self._end:
+            return None
+        end = start + self._buffer[start] + 1
+        if end > self._end:
+            return None
+        self._start = end
+        return self._view[start:end]
+
+###############################################################################
+# ReceivePool class
+###############################################################################
+
+
+class ReceivePool:
+    """ Reuses the frame buffer, packet and event of every (packettype,
+    subtype), and the device of every sensor, for the frames received in
+    the low allocation mode of :class:`Connect`.
+
+    An event it returns is a view that the next frame of the same
+    (packettype, subtype) overwrites: call :meth:`RFXtrxEvent.copy` to
+    keep one. Status and transmitter response events are not reused.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._devices = {}
+
+    def parse(self, frame):
+        """ Return the event of a received frame, or None """
+        #  pylint: disable=protected-access
+        if len(frame) < 3:
+            return None
+        entry = self._entries.get((frame[1], frame[2]))
+        if entry is None:
+            return self._add(frame)
+        pkt, event = entry
+        data = event.data
+        data[:] = frame
+        if lowlevel.parse_into(pkt, data) is None:
+            return None
+        event.device = self._device(pkt)
+        event._load(pkt)
+        return event
+
+    # pylint: disable=attribute-defined-outside-init
+    def _add(self, frame):
+        """ Parse the first frame of a (packettype, subtype) """
+        data = bytearray(frame)
+        pkt = lowlevel.parse(data)
+        if pkt is None:
+            return None
+        if isinstance(pkt, (lowlevel.Status, lowlevel.RecTransMessage)):
+            # Rare, and kept by whoever waits for them
+            return RFXtrxTransport.parse(data)
+        if isinstance(pkt, lowlevel.SensorPacket):
+            event = SensorEvent(pkt)
+        else:
+            event = ControlEvent(pkt)
+        event.data = data
+        event.device = self._device(pkt, event.device)
+        self._entries[pkt.packettype, pkt.subtype] = (pkt, event)
+        return event
+
+    def _device(self, pkt, device=None):
+        """ Return the device of pkt, the same for every frame of it """
+        #  pylint: disable=protected-access
+        start, end = lowlevel.id_bytes(pkt.packettype, pkt.subtype)
+        key = (pkt.packettype, pkt.subtype, bytes(pkt.data[start:end]))
+        known = self._devices.get(key)
+        if known is None:
+            known = self._devices[key] = \
+                device or get_device_from_pkt(pkt)
+            # Before the next frame reloads the packet
+            known._take_strings()
+        return known
+
+###############################################################################
+# TransportWriter class
+###############################################################################
+
+
+class TransportWriter:
+    """ Writer thread sending queued packets in order.
+
+    :meth:`submit` only queues the packet, so callers never wait for the
+    link. Packets queued back-to-back are merged into a single write when
+    coalesce is set, up to MAX_BATCH bytes.
+    """
+
+    MAX_BATCH = 4096
+    """ Largest number of bytes merged into one write """
+
+    def __init__(self, write, coalesce=True):
+        self._write = write
+        self._coalesce = coalesce
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, pkt):
+        """ Queue a packet, return a Future completing once it is written """
+        future = Future()
+        self._queue.put((pkt, future))
+        return future
+
+    def stop(self, timeout=None):
+        """ Write what is still queued, then stop the thread """
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _next_batch(self):
+        """ Wait for a packet, then take whatever else is queued with it """
+        item = self._queue.get()
+        if item is None:
+            return None, True
+        batch = [item]
+        size = len(item[0])
+        while self._coalesce and size < self.MAX_BATCH:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+            size += len(item[0])
+        return batch, False
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if not batch:
+                continue
+            batch = [(pkt, future) for pkt, future in batch
+                     if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            if len(batch) == 1:
+                data = batch[0][0]
+            else:
+                data = b''.join(pkt for pkt, _ in batch)
+            try:
+                self._write(data)
+            except Exception as exception:  # pylint: disable=broad-except
+                _LOGGER.debug("Queued send failed: %s", exception)
+                for _, future in batch:
+                    future.set_exception(exception)
+            else:
+                for _, future in batch:
+                    future.set_result(None)
+
+###############################################################################
+# TransmitTracker class
+###############################################################################
+
+
+class TransmitTracker:
+    """ Match transmitter responses (packet type 0x02) to the RF commands
+    they answer.
+
+    Every tracked command gets its own seqnbr, which the RFXtrx copies into
+    its response. The Future returned by :meth:`register` resolves to the
+    :class:`lowlevel.RecTransMessage` (check its ack attribute), or fails
+    with TimeoutError when no response arrived in time. The deadlines of
+    all outstanding commands are kept in one heap, served by a single
+    timer thread.
+    """
+
+    def __init__(self, timeout=2.0):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._seqnbr = 0
+        self._pending = {}
+        self._deadlines = []
+        self._timer = None
+        self._timer_deadline = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    @staticmethod
+    def tracks(data):
+        """ Return True for an RF command, which the RFXtrx answers with a
+        transmitter response """
+        return isinstance(data, (bytes, bytearray)) and len(data) > 3 \
+            and data[1] >= 0x10
+
+    def register(self, pkt):
+        """ Write a free seqnbr into the packet (a bytearray) and return the
+        Future of its response """
+        future = Future()
+        with self._lock:
+            if len(self._pending) >= 255:
+                raise RFXtrxTransportError("Too many unanswered transmits")
+            self._seqnbr = self._seqnbr % 255 + 1
+            while self._seqnbr in self._pending:
+                self._seqnbr = self._seqnbr % 255 + 1
+            seqnbr = self._seqnbr
+            self._pending[seqnbr] = future
+            deadline = monotonic() + self.timeout
+            heapq.heappush(self._deadlines, (deadline, id(future), seqnbr,
+                                             future))
+            self._schedule(deadline)
+        pkt[3] = seqnbr
+        return future
+
+    def resolve(self, pkt):
+        """ Complete the Future waiting for the given response, return False
+        if nothing was waiting for it """
+        with self._lock:
+            future = self._pending.pop(pkt.seqnbr, None)
+        if future is None:
+            return False
+        if future.set_running_or_notify_cancel():
+            future.set_result(pkt)
+        return True
+
+    def fail(self, seqnbr, exception):
+        """ Fail the Future of a command that could not be sent """
+        with self._lock:
+            future = self._pending.pop(seqnbr, None)
+        if future is not None and future.set_running_or_notify_cancel():
+            future.set_exception(exception)
+
+    def fail_all(self, exception):
+        """ Fail every outstanding Future, e.g. when the link is closed """
+        for seqnbr in list(self._pending):
+            self.fail(seqnbr, exception)
+
+    def _schedule(self, deadline):
+        """ Make the timer fire at deadline at the latest, with the lock
+        held """
+        if self._timer is not None:
+            if self._timer_deadline <= deadline:
+                return
+            self._timer.cancel()
+        self._timer = threading.Timer(max(deadline - monotonic(), 0),
+                                      self._expire)
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _expire(self):
+        """ Fail the Futures whose deadline passed, then wait for the next
+        deadline """
+        expired = []
+        with self._lock:
+            if threading.current_thread() is not self._timer:
+                # Replaced by a timer for an earlier deadline
+                return
+            self._timer = None
+            now = monotonic()
+            while self._deadlines and self._deadlines[0][0] <= now:
+                _, _, seqnbr, future = heapq.heappop(self._deadlines)
+                # Answered commands are left in the heap until they are due
+                if self._pending.get(seqnbr) is future:
+                    del self._pending[seqnbr]
+                    expired.append((seqnbr, future))
+            if self._deadlines:
+                self._schedule(self._deadlines[0][0])
+        for seqnbr, future in expired:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(TimeoutError(
+                    "No response to transmit {0}".format(seqnbr)))
+
 ###############################################################################
 # RFXtrxTransport class
 ###############################################################################
@@ -829,6 +1487,26 @@ class RFXtrxTransportError(Exception):
 class RFXtrxTransport:
     """ Abstract superclass for all transport mechanisms """
 
+    RESET_QUIET = 0.05
+    """ Seconds without input after which a reset is considered done """
+    RESET_TIMEOUT = 1.0
+    """ Upper bound in seconds of a reset """
+
+    _writer = None
+    _frames = None
+    _selector = None
+    _wakeup = None
+    _waiting = False
+    _unwatched = ()
+    _watch_lock: threading.Lock  # Set per instance by those using _watch
+    tracker = None
+    frame_hook = None
+    """ Optional callable(frame, sent) seeing every raw frame sent to and
+    received from the device, e.g. to record them """
+    pool = None
+    """ Optional :class:`ReceivePool` reusing the events of received
+    frames """
+
     # pylint: disable=attribute-defined-outside-init
     @staticmethod
     def parse(data):
@@ -841,6 +1519,8 @@ class RFXtrxTransport:
                 obj = SensorEvent(pkt)
             elif isinstance(pkt, lowlevel.Status):
                 obj = StatusEvent(pkt)
+            elif isinstance(pkt, lowlevel.RecTransMessage):
+                obj = ResponseEvent(pkt)
             else:
                 obj = ControlEvent(pkt)
 
@@ -849,20 +1529,219 @@ class RFXtrxTransport:
             return obj
         return None
 
+    @staticmethod
+    def prepare(data):
+        """ Check and log a packet about to be sent, return it as a
+        bytearray """
+        if isinstance(data, bytearray):
+            pkt = data
+        elif isinstance(data, (bytes, str)):
+            pkt = bytearray(data)
+        else:
+            raise ValueError("Invalid type")
+        _LOGGER.debug(
+            "Send: %s",
+            " ".join("0x{0:02x}".format(x) for x in pkt)
+        )
+        return pkt
+
     def connect(self, timeout=None):
         """ connect to device """
 
     def reset(self):
         """ reset the rfxtrx device """
 
+    def _reset(self):
+        """ Send the reset command, then discard what the device sends until
+        the line has been quiet for RESET_QUIET seconds, or RESET_TIMEOUT
+        seconds have passed. Return the seconds the reset took. """
+        start = monotonic()
+        pkt = self.prepare(b'\x0D\x00\x00\x00\x00\x00\x00'
+                           b'\x00\x00\x00\x00\x00\x00\x00')
+        if self.frame_hook is not None:
+            self.frame_hook(pkt, True)
+        self._write(pkt)
+        deadline = start + self.RESET_TIMEOUT
+        remaining = self.RESET_TIMEOUT
+        while remaining > 0 and \
+                self._discard_input(min(self.RESET_QUIET, remaining)):
+            remaining = deadline - monotonic()
+        return monotonic() - start
+
+    def _discard_input(self, timeout):
+        """ Wait at most timeout seconds for input and throw it away.
+        Return False if nothing arrived. """
+        sleep(timeout)
+        return False
+
     def close(self):
         """ close connection to rfxtrx device """
 
-    def receive_blocking(self):
-        """ Wait until a packet is received and return with an RFXtrxEvent """
+    def receive_blocking(self, timeout=None):
+        """ Wait until a packet is received and return with an RFXtrxEvent.
+        Return None when no packet arrived within timeout seconds. """
+
+    def _receive_packet(self, timeout=None):
+        """ Wait until a packet is received and return with an RFXtrxEvent,
+        or None when timeout seconds passed first """
+        deadline = None if timeout is None else monotonic() + timeout
+        # Pooled events copy the frame, so it can stay in the buffer
+        pop = self._frames.pop_frame if self.pool is None \
+            else self._frames.pop_view
+        pkt = pop()
+        while pkt is None:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - monotonic(), 0)
+            if not self._wait_readable(remaining):
+                return None
+            self._fill(remaining)
+            pkt = pop()
+        return self._received(pkt)
+
+    def _received(self, pkt):
+        """ Log, hook and parse a received frame """
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Recv: %s",
+                " ".join("0x{0:02x}".format(x) for x in pkt)
+            )
+        if self.frame_hook is not None:
+            self.frame_hook(pkt, False)
+        return self._responded(self._parse(pkt))
+
+    def _parse(self, pkt):
+        """ Return the event of a received frame, from the pool if any """
+        if self.pool is None:
+            return self.parse(pkt)
+        return self.pool.parse(pkt)
+
+    def _fill(self, timeout):
+        """ Read what has arrived into the frame buffer """
+
+    def _watch(self, fileobj):
+        """ Wait for input from fileobj in a selector, which :meth:`close`
+        can wake up through a socket pair """
+        self._unwatch()
+        self._wakeup = socket.socketpair()
+        self._wakeup[0].setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fileobj, selectors.EVENT_READ)
+        self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+
+    def _unwatch(self):
+        """ Close the selector and socket pair of :meth:`_watch`. A reader
+        waiting in the selector closes them itself once it wakes up, as
+        closing the socket pair under it would lose the wakeup. """
+        with self._watch_lock:
+            watched = (self._selector, self._wakeup)
+            self._selector = self._wakeup = None
+            if watched[0] is not None and self._waiting:
+                self._unwatched = self._unwatched + (watched,)
+                return
+        self._close_watched(watched)
+
+    @staticmethod
+    def _close_watched(watched):
+        selector, wakeup = watched
+        if selector is not None:
+            selector.close()
+        if wakeup is not None:
+            for sock in wakeup:
+                sock.close()
+
+    def _wait_readable(self, timeout):
+        """ Wait at most timeout seconds for input, return False if none
+        arrived. Raise RFXtrxTransportError when woken up by close(). """
+        with self._watch_lock:
+            selector, wakeup = self._selector, self._wakeup
+            if selector is None:
+                # Nothing to select on, the read itself waits
+                return True
+            self._waiting = True
+        try:
+            ready = selector.select(timeout)
+        finally:
+            with self._watch_lock:
+                self._waiting = False
+                unwatched, self._unwatched = self._unwatched, ()
+            for watched in unwatched:
+                self._close_watched(watched)
+        for key, _ in ready:
+            if key.fileobj is wakeup[0]:
+                raise RFXtrxTransportError("Transport was closed")
+        return bool(ready)
+
+    def _wakeup_reader(self):
+        """ Make a reader waiting for input return at once """
+        if self._wakeup is not None:
+            with suppress(OSError):
+                self._wakeup[1].send(b'\x00')
 
     def send(self, data):
-        """ Send the given packet """
+        """ Send the given packet.
+
+        When the transport tracks transmits (see :meth:`track_transmits`)
+        an RF command returns the :class:`concurrent.futures.Future` of
+        its ACK or NAK. Otherwise, when the transport has a writer (see
+        :meth:`start_writer`) the packet is only queued, and a Future is
+        returned that completes once it has been written.
+        """
+        response = None
+        if self.tracker is not None and self.tracker.tracks(data):
+            data = bytearray(data)
+            response = self.tracker.register(data)
+        pkt = self.prepare(data)
+        if self.frame_hook is not None:
+            self.frame_hook(pkt, True)
+        if self._writer is not None:
+            written = self._writer.submit(pkt)
+            if response is None:
+                return written
+            written.add_done_callback(
+                functools.partial(self._check_written, pkt[3]))
+            return response
+        try:
+            self._write(pkt)
+        except RFXtrxTransportError as exception:
+            if response is not None:
+                self.tracker.fail(pkt[3], exception)
+            raise
+        return response
+
+    def _check_written(self, seqnbr, written):
+        exception = written.exception()
+        if exception is not None and self.tracker is not None:
+            self.tracker.fail(seqnbr, exception)
+
+    def track_transmits(self, timeout=2.0):
+        """ Give RF commands their own seqnbr and make :meth:`send` return
+        the Future of the transmitter response """
+        if self.tracker is None:
+            self.tracker = TransmitTracker(timeout)
+        return self.tracker
+
+    def _responded(self, event):
+        """ Hand a transmitter response to the Future waiting for it.
+        Return the event, or None once it has been consumed that way. """
+        if isinstance(event, ResponseEvent) and self.tracker is not None \
+                and self.tracker.resolve(event.device):
+            return None
+        return event
+
+    def _write(self, pkt):
+        """ Write the whole packet to the device """
+
+    def start_writer(self, coalesce=True):
+        """ Send through a writer thread from now on """
+        if self._writer is None:
+            self._writer = TransportWriter(self._write, coalesce)
+
+    def stop_writer(self, timeout=1.0):
+        """ Write what is still queued and send directly again """
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop(timeout)
 
 
 def transport_errors(message):
@@ -883,75 +1762,110 @@ def transport_errors(message):
         return __errors
     return _errors
 
+
+def open_serial(port, **kwargs):
+    """ Open the serial port of an RFXtrx, falling back to the first
+    RFXCOM device found by id if the given port cannot be opened """
+    try:
+        return serial.Serial(port, 38400, **kwargs)
+    except serial.SerialException:
+        ports = glob.glob('/dev/serial/by-id/usb-RFXCOM_*-port0')
+        if len(ports) < 1:
+            raise
+        _LOGGER.debug("Attempting connection by name %s", ports)
+        return serial.Serial(ports[0], 38400, **kwargs)
+
 ###############################################################################
 # PySerialTransport class
 ###############################################################################
 
 
 class PySerialTransport(RFXtrxTransport):
-    """ Implementation of a transport using PySerial """
+    """ Implementation of a transport using PySerial.
+
+    With queued_send, :meth:`send` queues the packet for a writer thread
+    and returns a Future instead of writing to the port itself.
+    """
 
-    def __init__(self, port):
+    def __init__(self, port, queued_send=False):
         self.port = port
         self.serial = None
+        self.queued_send = queued_send
+        self._frames = FrameBuffer()
+        self._watch_lock = threading.Lock()
 
     @transport_errors("connect")
     def connect(self, timeout=None):
         """ Open a serial connexion """
+        self.serial = open_serial(self.port)
+        self._frames.clear()
         try:
-            self.serial = serial.Serial(self.port, 38400)
-        except serial.SerialException:
-            port = glob.glob('/dev/serial/by-id/usb-RFXCOM_*-port0')
-            if len(port) < 1:
-                raise
-            _LOGGER.debug("Attempting connection by name %s", port)
-            self.serial = serial.Serial(port[0], 38400)
+            self.serial.fileno()
+        except (OSError, io.UnsupportedOperation):
+            # Windows, where reads wait with the read timeout as before
+            self._unwatch()
+        else:
+            self._watch(self.serial)
+        if self.queued_send:
+            self.start_writer()
 
     @transport_errors("receive")
-    def receive_blocking(self):
-        return self._receive_packet()
+    def receive_blocking(self, timeout=None):
+        """ Wait until a packet is received and return with an RFXtrxEvent.
+        Return None when no packet arrived within timeout seconds. """
+        return self._receive_packet(timeout)
+
+    def _fill(self, timeout):
+        """ Read everything the port holds into the frame buffer. Without a
+        selector, wait for at least the missing bytes of the pending frame
+        """
+        if self._selector is not None:
+            # The port is readable, so this does not block
+            count = max(self.serial.in_waiting, 1)
+            self._frames.feed(self.serial.read(count))
+            return
+        # Never ask for more than is known to be waiting or still missing
+        # from the current frame, as a read without timeout blocks until
+        # the requested count has arrived.
+        count = max(self.serial.in_waiting, self._frames.needed())
+        if timeout is None:
+            self._frames.feed(self.serial.read(count))
+        else:
+            self._frames.feed(self._read(count, timeout))
 
-    def _receive_packet(self):
-        """ Wait until a packet is received and return with an RFXtrxEvent """
-        data = self.serial.read()
-        if data == '\x00':
-            return None
-        pkt = bytearray(data)
-        while len(pkt) < pkt[0]+1:
-            data = self.serial.read(pkt[0]+1 - len(pkt))
-            pkt.extend(bytearray(data))
-        _LOGGER.debug(
-            "Recv: %s",
-            " ".join("0x{0:02x}".format(x) for x in pkt)
-        )
-        return self.parse(pkt)
+    def _read(self, count, timeout):
+        """ Read up to count bytes, waiting at most timeout seconds """
+        previous = self.serial.timeout
+        self.serial.timeout = timeout
+        try:
+            return self.serial.read(count)
+        finally:
+            self.serial.timeout = previous
 
     @transport_errors("send")
-    def send(self, data):
-        """ Send the given packet """
-        if isinstance(data, bytearray):
-            pkt = data
-        elif isinstance(data, (bytes, str)):
-            pkt = bytearray(data)
-        else:
-            raise ValueError("Invalid type")
-        _LOGGER.debug(
-            "Send: %s",
-            " ".join("0x{0:02x}".format(x) for x in pkt)
-        )
+    def _write(self, pkt):
+        """ Write the whole packet to the port """
         self.serial.write(pkt)
 
     @transport_errors("reset")
     def reset(self):
-        """ Reset the RFXtrx """
-        self.send(b'\x0D\x00\x00\x00\x00\x00\x00'
-                  b'\x00\x00\x00\x00\x00\x00\x00')
-        sleep(0.3)  # Should work with 0.05, but not for me
+        """ Reset the RFXtrx, return the seconds it took """
+        duration = self._reset()
         self.serial.flushInput()
+        self._frames.clear()
+        return duration
+
+    def _discard_input(self, timeout):
+        return bool(self._read(max(self.serial.in_waiting, 1), timeout))
 
     @transport_errors("close")
     def close(self):
         """ close connection to rfxtrx device """
+        self._wakeup_reader()
+        self._unwatch()
+        self.stop_writer()
+        if self.tracker is not None:
+            self.tracker.fail_all(RFXtrxTransportError("Connection closed"))
         with suppress(serial.SerialException):
             self.serial.close()
 
@@ -961,77 +1875,89 @@ class PySerialTransport(RFXtrxTransport):
 
 
 class PyNetworkTransport(RFXtrxTransport):
-    """ Implementation of a transport using sockets """
+    """ Implementation of a transport using sockets.
+
+    With queued_send, :meth:`send` queues the packet for a writer thread
+    and returns a Future instead of writing to the socket itself.
+    """
 
-    def __init__(self, hostport):
+    def __init__(self, hostport, queued_send=False):
         self.hostport = hostport    # must be a (host, port) tuple
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.queued_send = queued_send
+        self._frames = FrameBuffer()
+        self._watch_lock = threading.Lock()
 
     @transport_errors("connect")
     def connect(self, timeout=None):
         """ Open a socket connection """
+        if self.sock.fileno() == -1:
+            # Closed before, e.g. when reconnecting
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._frames.clear()
         self.sock.settimeout(timeout)
         self.sock.connect(self.hostport)
         self.sock.settimeout(None)
         _LOGGER.debug("Connected to network socket")
+        self._watch(self.sock)
+        if self.queued_send:
+            self.start_writer()
 
     @transport_errors("receive")
-    def receive_blocking(self):
-        """ Wait until a packet is received and return with an RFXtrxEvent """
-        return self._receive_packet()
-
-    def _receive_packet(self):
-        """ Wait until a packet is received and return with an RFXtrxEvent """
-        data = self.sock.recv(1)
-        if data == b'':
+    def receive_blocking(self, timeout=None):
+        """ Wait until a packet is received and return with an RFXtrxEvent.
+        Return None when no packet arrived within timeout seconds. """
+        return self._receive_packet(timeout)
+
+    def _fill(self, timeout):
+        """ Receive whatever the socket holds straight into the frame
+        buffer """
+        count = self.sock.recv_into(self._frames.writable())
+        if count == 0:
             raise RFXtrxTransportError("Server was shutdown")
-        if data == '\x00':
-            return None
-        pkt = bytearray(data)
-        while len(pkt) < pkt[0]+1:
-            data = self.sock.recv(pkt[0]+1 - len(pkt))
-            if data == b'':
-                raise RFXtrxTransportError("Server was shutdown")
-            pkt.extend(bytearray(data))
-        _LOGGER.debug(
-            "Recv: %s",
-            " ".join("0x{0:02x}".format(x) for x in pkt)
-        )
-        return self.parse(pkt)
+        self._frames.commit(count)
 
     @transport_errors("send")
-    def send(self, data):
-        """ Send the given packet """
-        if isinstance(data, bytearray):
-            pkt = data
-        elif isinstance(data, (bytes, str)):
-            pkt = bytearray(data)
-        else:
-            raise ValueError("Invalid type")
-        _LOGGER.debug(
-            "Send: %s",
-            " ".join("0x{0:02x}".format(x) for x in pkt)
-        )
-        self.sock.send(pkt)
+    def _write(self, pkt):
+        """ Write the whole packet to the socket """
+        self.sock.sendall(pkt)
 
     @transport_errors("reset")
     def reset(self):
-        """ Reset the RFXtrx """
+        """ Reset the RFXtrx, return the seconds it took """
         try:
-            self.send(b'\x0D\x00\x00\x00\x00\x00\x00'
-                      b'\x00\x00\x00\x00\x00\x00\x00')
-            sleep(0.3)
-            self.sock.sendall(b'')
+            duration = self._reset()
         except socket.error as exception:
             raise RFXtrxTransportError(
                 "Reset failed: {0}".format(exception)) from exception
+        self._frames.clear()
+        return duration
+
+    def _discard_input(self, timeout):
+        self.sock.settimeout(timeout)
+        try:
+            # Received into the free part of the buffer, never committed
+            count = self.sock.recv_into(self._frames.writable())
+        except socket.timeout:
+            return False
+        finally:
+            self.sock.settimeout(None)
+        if count == 0:
+            raise RFXtrxTransportError("Server was shutdown")
+        return True
 
     @transport_errors("close")
     def close(self):
         """ close connection to rfxtrx device """
+        self._wakeup_reader()
+        self._unwatch()
+        self.stop_writer()
+        if self.tracker is not None:
+            self.tracker.fail_all(RFXtrxTransportError("Connection closed"))
         with suppress(socket.error):
+            # Fails when the peer hung up already
             self.sock.shutdown(socket.SHUT_RDWR)
-            self.sock.close()
+        self.sock.close()
 
 
 class DummyTransport(RFXtrxTransport):
@@ -1040,34 +1966,56 @@ class DummyTransport(RFXtrxTransport):
     def __init__(self, device=""):
         self.device = device
         self._close_event = threading.Event()
+        self._responses = deque()
+        self._status = bytearray(b'\x0D\x01\x00\x01\x02\x53\x45'
+                                 b'\x10\x0C\x2F\x01\x01\x00\x00')
 
     def connect(self, timeout=None):
         pass
 
-    def receive(self, data=None):
-        """ Emulate a receive by parsing the given data """
+    def receive(self, data=None, timeout=None):
+        """ Emulate a receive by parsing the given data, or the response to
+        the last interface command sent """
+        if data is None and self._responses:
+            data = self._responses.popleft()
         if data is None:
-            self._close_event.wait(0.1)
+            self._close_event.wait(0.1 if timeout is None
+                                   else min(timeout, 0.1))
             return None
         pkt = bytearray(data)
         _LOGGER.debug(
             "Recv: %s",
             " ".join("0x{0:02x}".format(x) for x in pkt)
         )
-        return self.parse(pkt)
+        return self._responded(self._parse(pkt))
 
-    def receive_blocking(self, data=None):
+    def receive_blocking(self, data=None, timeout=None):
         """ Emulate a receive by parsing the given data """
-        return self.receive(data)
+        #  pylint: disable=arguments-renamed
+        return self.receive(data, timeout)
 
     def send(self, data):
         """ Emulate a send by doing nothing (except printing debug info if
-            requested) """
+            requested and answering interface commands) """
         pkt = bytearray(data)
         _LOGGER.debug(
             "Send: %s",
             " ".join("0x{0:02x}".format(x) for x in pkt)
         )
+        if len(pkt) == 14 and pkt[1] == 0x00:
+            self._respond(pkt)
+
+    def _respond(self, pkt):
+        """ Queue the response of the RFXtrx to an interface command """
+        if pkt[4] in (0x02, 0x03):  # get status, set mode
+            if pkt[4] == 0x03:
+                self._status[7:11] = pkt[7:11]
+                self._status[13] = pkt[6]
+            self._status[3:5] = pkt[3:5]
+            self._responses.append(bytearray(self._status))
+        elif pkt[4] == 0x07:  # start receiver
+            self._responses.append(bytearray(
+                b'\x14\x01\x07\x03\x07Copyright RFXCOM'))
 
     def close(self):
         """Close."""
@@ -1076,8 +2024,8 @@ class DummyTransport(RFXtrxTransport):
 
 class DummyTransport2(PySerialTransport):
     """ Dummy transport for testing purposes """
-    #  pylint: disable=super-init-not-called
     def __init__(self, device=""):
+        super().__init__(device)
         self.serial = _dummySerial(device, 38400, timeout=0.1)
         self._run_event = threading.Event()
 
@@ -1088,41 +2036,130 @@ class DummyTransport2(PySerialTransport):
 class Connect:
     """ The main class for rfxcom-py.
     Has methods for sensors.
+
+    With auto_reconnect, a lost connection is reopened with exponential
+    backoff (plus jitter) instead of ending the reader thread. The sensors,
+    modes and status are kept, and :class:`ConnectionDone` reports how
+    long the outage took.
+
+    The modes are only written to the device when its status reports
+    different ones.
+
+    With low_allocation, the transport reuses the buffers, packets and
+    events of received frames through a :class:`ReceivePool`, and the
+    objects created during start up are moved out of the garbage
+    collector's way with gc.freeze(). The callback then gets events that
+    the next frame of the same kind overwrites, so it has to call
+    :meth:`RFXtrxEvent.copy` on any event it keeps. Event streams get
+    copies.
     """
     #  pylint: disable=too-many-instance-attributes, too-many-arguments
+
+    RESPONSE_TIMEOUT = 5.0
+    """ Seconds to wait for the response to an interface command """
+    STATUS_RETRY = 0.25
+    """ Seconds to wait for the first status after a reset before asking
+    again, as the device ignores commands until the reset has finished """
+    MAX_DEFERRED = 100
+    """ Events kept while the reader thread waits for a response, older
+    ones are dropped """
+
+    RECONNECT_MIN_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 60.0
+    """ Bounds in seconds of the backoff between reconnect attempts """
+
     def __init__(self, transport, event_callback=None,
-                 modes=None):
+                 modes=None, auto_reconnect=False, low_allocation=False):
+        self.auto_reconnect = auto_reconnect
+        self.low_allocation = low_allocation
+        self._online = False
+        self._close_event = threading.Event()
         self._run_event = threading.Event()
+        self._settled_event = threading.Event()
         self._sensors = {}
         self._status = None
         self._modes = modes
+        self._streams = []
+        self._response = None
+        self._request_lock = threading.Lock()
+        self._deferred = []
+        self._reconnect_delay = self.RECONNECT_MIN_DELAY
         self._thread = threading.Thread(target=self._connect, daemon=True)
         self.event_callback = event_callback
         self.transport: RFXtrxTransport = transport
+        if low_allocation:
+            self.transport.pool = ReceivePool()
 
     def connect(self, timeout=None):
         """Connect to device."""
         self.transport.connect(timeout)
         self._thread.start()
-        if not self._run_event.wait(timeout):
+        # Settled once the handshake is done or the reader thread ended
+        self._settled_event.wait(timeout)
+        if not self._run_event.is_set():
             self.close_connection()
             raise TimeoutError()
 
     def _connect(self):
-        try:
-            self._connect_internal()
-        except RFXtrxTransportError as exception:
-            _LOGGER.info("Connection lost %s", exception)
-        finally:
-            if self.event_callback and self._run_event.is_set():
-                self.event_callback(ConnectionLost())
-
-    def _connect_internal(self):
-        """Connect """
-        self.transport.reset()
-        self._status = self.send_get_status()
-
-        if self._modes is not None:
+        lost_at = None
+        self._reconnect_delay = self.RECONNECT_MIN_DELAY
+        while True:
+            try:
+                self._connect_internal(lost_at)
+            except (RFXtrxTransportError, TimeoutError) as exception:
+                _LOGGER.info("Connection lost %s", exception)
+            finally:
+                future, self._response = self._response, None
+                if future is not None \
+                        and future.set_running_or_notify_cancel():
+                    future.set_exception(
+                        RFXtrxTransportError("Connection lost"))
+                if self._online:
+                    self._online = False
+                    lost_at = monotonic()
+                    if self.event_callback and self._run_event.is_set():
+                        self.event_callback(ConnectionLost())
+            if lost_at is None or not self.auto_reconnect \
+                    or not self._reconnect():
+                self._settled_event.set()
+                return
+
+    def _reconnect(self):
+        """ Reopen the transport, backing off between attempts until one
+        gets through the handshake. Return False when the connection was
+        closed meanwhile. """
+        while not self._close_event.wait(
+                random.uniform(0.5, 1.0) * self._reconnect_delay):
+            # Only a ConnectionDone resets the delay, so a peer that
+            # accepts and then fails the handshake is backed off as well
+            self._reconnect_delay = min(self._reconnect_delay * 2,
+                                        self.RECONNECT_MAX_DELAY)
+            try:
+                with suppress(RFXtrxTransportError):
+                    self.transport.close()
+                self.transport.connect(self.RECONNECT_MAX_DELAY)
+            except RFXtrxTransportError as exception:
+                _LOGGER.info("Reconnect failed %s", exception)
+                continue
+            if self._close_event.is_set():
+                self.transport.close()
+                return False
+            return True
+        return False
+
+    def _modes_changed(self):
+        """ Return True if the status does not report the wanted modes """
+        return self._status is None or self._status.device.recmodes_mask \
+            != lowlevel.get_recmodes_mask(self._modes)
+
+    def _connect_internal(self, lost_at=None):
+        """Connect, or reconnect when the connection was lost at lost_at """
+        duration = self.transport.reset()
+        if duration is not None:
+            _LOGGER.info("Reset took %.3f s", duration)
+        self._status = self._get_status_after_reset()
+
+        if self._modes is not None and self._modes_changed():
             self.set_recmodes(self._modes)
             self._status = self.send_get_status()
 
@@ -1133,17 +2170,118 @@ class Connect:
 
         self.send_start()
 
+        latency = None
+        if lost_at is not None:
+            latency = monotonic() - lost_at
+            _LOGGER.info("Reconnected after %.3f s", latency)
+        if self._close_event.is_set():
+            return
+        self._online = True
+        self._reconnect_delay = self.RECONNECT_MIN_DELAY
         self._run_event.set()
+        self._settled_event.set()
         if self.event_callback:
-            self.event_callback(ConnectionDone())
+            self.event_callback(ConnectionDone(latency))
+        if self.low_allocation:
+            gc.freeze()
 
         while self._run_event.is_set():
+            # Events read while waiting for a response on this thread
+            deferred, self._deferred = self._deferred, []
+            for event in deferred:
+                self._dispatch(event)
             event = self.transport.receive_blocking()
-            if isinstance(event, RFXtrxEvent):
-                if self.event_callback:
-                    self.event_callback(event)
-                if isinstance(event, SensorEvent):
-                    self._sensors[event.device.id_string] = event.device
+            if isinstance(event, RFXtrxEvent) \
+                    and not self._response_received(event):
+                self._dispatch(event)
+
+    def _get_status_after_reset(self):
+        """ Ask for the status every STATUS_RETRY seconds until the device
+        answers, for at most the RESET_TIMEOUT of the transport, then once
+        more with the full RESPONSE_TIMEOUT """
+        deadline = monotonic() + self.transport.RESET_TIMEOUT
+        while monotonic() < deadline:
+            try:
+                return self.send_get_status(self.STATUS_RETRY)
+            except TimeoutError:
+                _LOGGER.debug("No status yet, the device is still resetting")
+        return self.send_get_status()
+
+    def _dispatch(self, event):
+        """ Hand a received event to the callback and the streams """
+        if self.event_callback:
+            self.event_callback(event)
+        if self._streams and self.low_allocation:
+            event = event.copy()
+        for stream in self._streams:
+            stream.put(event)
+        if isinstance(event, SensorEvent):
+            self._sensors[event.device.id_string] = event.device
+
+    def _response_received(self, event):
+        """ Hand an interface or transmitter response to the caller waiting
+        for it. Return False for any other event. """
+        if isinstance(event, ResponseEvent):
+            # Tracked transmits were matched by the transport already
+            _LOGGER.debug("Unmatched transmitter response: %s", event.device)
+            return True
+        if not isinstance(event, StatusEvent):
+            return False
+        future, self._response = self._response, None
+        if future is None or not future.set_running_or_notify_cancel():
+            _LOGGER.debug("Unsolicited response: %s", event.device)
+        else:
+            future.set_result(event)
+        return True
+
+    def _request(self, data, timeout=None):
+        """ Send an interface command and return the response to it.
+
+        On the reader thread itself (during the start up handshake or from
+        the event callback) the response is read here, and the events read
+        meanwhile are dispatched afterwards. Any other thread waits until
+        the reader thread has received the response.
+
+        Raise TimeoutError when no response arrived within timeout seconds
+        (RESPONSE_TIMEOUT by default), and RFXtrxTransportError when the
+        connection was closed meanwhile.
+        """
+        if timeout is None:
+            timeout = self.RESPONSE_TIMEOUT
+        if threading.current_thread() is self._thread:
+            return self._read_response(data, timeout)
+        with self._request_lock:
+            future = Future()
+            self._response = future
+            try:
+                self.transport.send(data)
+                return future.result(timeout)
+            except FutureTimeoutError:
+                raise TimeoutError("No response to interface command") \
+                    from None
+            finally:
+                self._response = None
+
+    def _read_response(self, data, timeout):
+        """ Send an interface command and read the response to it on the
+        reader thread, deferring the events read meanwhile """
+        self.transport.send(data)
+        deadline = monotonic() + timeout
+        while not self._close_event.is_set():
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise TimeoutError("No response to interface command")
+            event = self.transport.receive_blocking(timeout=remaining)
+            if isinstance(event, StatusEvent):
+                return event
+            if isinstance(event, RFXtrxEvent) \
+                    and not isinstance(event, ResponseEvent):
+                if len(self._deferred) >= self.MAX_DEFERRED:
+                    _LOGGER.debug("Dropped deferred event: %s",
+                                  self._deferred.pop(0))
+                self._deferred.append(
+                    event.copy() if self.low_allocation else event)
+        raise RFXtrxTransportError("Connection closed")
 
     def sensors(self):
         """ Return all found sensors.
@@ -1151,44 +2289,54 @@ class Connect:
         """
         return self._sensors
 
+    def events(self, maxsize=100, overflow=EventStream.DROP_OLDEST,
+               packettypes=None, subtypes=None, ids=None):
+        """ Return an :class:`EventStream` of received events, to be
+        consumed on the running event loop with ``async for``.
+
+        Each stream has its own queue of at most maxsize events; see
+        :class:`EventStream` for the overflow policies and filters.
+        """
+        #  pylint: disable=too-many-arguments
+        stream = EventStream(maxsize, overflow, packettypes, subtypes, ids)
+        stream.on_close = self._remove_stream
+        self._streams = self._streams + [stream]
+        return stream
+
+    def _remove_stream(self, stream):
+        self._streams = [item for item in self._streams if item is not stream]
+
     def close_connection(self):
         """ Close connection to rfxtrx device """
+        self._close_event.set()
         self._run_event.clear()
+        for stream in self._streams:
+            stream.close()
         self.transport.close()
         self._thread.join()
 
     def set_recmodes(self, modenames):
         """ Sets the device modes (which protocols to decode) """
-        data = bytearray([0x0D, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00,
-                          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
-
         # Keep the values read during init.
-        data[5] = self._status.device.tranceiver_type
-        data[6] = self._status.device.output_power
+        data = lowlevel.get_recmodes_packet(
+            self._status.device.tranceiver_type,
+            self._status.device.output_power,
+            modenames)
 
-        # Build the mode data bytes from the mode names
-        for mode in modenames:
-            byteno, bitno = lowlevel.get_recmode_tuple(mode)
-            if byteno is None:
-                raise ValueError('Unknown mode name '+mode)
-
-            data[7 + byteno] |= 1 << bitno
-
-        self.transport.send(data)
+        response = self._request(data)
         self._modes = modenames
-        return self.transport.receive_blocking()
+        return response
 
     def send_start(self):
         """ Sends the Start RFXtrx transceiver command """
-        self.transport.send(b'\x0D\x00\x00\x03\x07\x00\x00'
-                            b'\x00\x00\x00\x00\x00\x00\x00')
-        return self.transport.receive_blocking()
-
-    def send_get_status(self):
-        """ Sends the Get Status command """
-        self.transport.send(b'\x0D\x00\x00\x01\x02\x00\x00'
-                            b'\x00\x00\x00\x00\x00\x00\x00')
-        return self.transport.receive_blocking()
+        return self._request(b'\x0D\x00\x00\x03\x07\x00\x00'
+                             b'\x00\x00\x00\x00\x00\x00\x00')
+
+    def send_get_status(self, timeout=None):
+        """ Sends the Get Status command, waiting at most timeout seconds
+        (RESPONSE_TIMEOUT by default) for the response """
+        return self._request(b'\x0D\x00\x00\x01\x02\x00\x00'
+                             b'\x00\x00\x00\x00\x00\x00\x00', timeout)
 
 
 class Core(Connect):
@@ -0,0 +1,565 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module provides an asyncio implementation of the RFXtrx connection.
+
+Frames are read on the event loop (through a file descriptor reader for
+serial ports and a buffered protocol for TCP) and event callbacks run on
+the loop as well, so no thread is involved.
+"""
+
+import asyncio
+import logging
+import os
+
+import serial
+
+from . import (Connect, ConnectionDone, ConnectionLost, EventStream,
+               FrameBuffer, ResponseEvent, RFXtrxEvent, RFXtrxTransport,
+               RFXtrxTransportError, SensorEvent, StatusEvent, lowlevel,
+               open_serial)
+
+_LOGGER = logging.getLogger(__name__)
+
+RESET = (b'\x0D\x00\x00\x00\x00\x00\x00'
+         b'\x00\x00\x00\x00\x00\x00\x00')
+GET_STATUS = (b'\x0D\x00\x00\x01\x02\x00\x00'
+              b'\x00\x00\x00\x00\x00\x00\x00')
+START = (b'\x0D\x00\x00\x03\x07\x00\x00'
+         b'\x00\x00\x00\x00\x00\x00\x00')
+
+
+###############################################################################
+# AsyncTransport class
+###############################################################################
+
+class AsyncTransport:
+    """ Abstract superclass for all asyncio transport mechanisms.
+
+    Received frames are passed to :attr:`frame_callback` on the event loop
+    and a lost connection is reported through :attr:`lost_callback`.
+    """
+
+    parse = staticmethod(RFXtrxTransport.parse)
+    track_transmits = RFXtrxTransport.track_transmits
+    tracker = None
+    RESET_QUIET = RFXtrxTransport.RESET_QUIET
+    RESET_TIMEOUT = RFXtrxTransport.RESET_TIMEOUT
+
+    def __init__(self):
+        self.frame_callback = None
+        self.lost_callback = None
+        self._frames = FrameBuffer()
+        self._resetting = False
+        self._last_input = 0.0
+
+    async def connect(self, timeout=None):
+        """ connect to device """
+
+    async def reset(self):
+        """ Reset the RFXtrx and discard its input until the line has been
+        quiet for RESET_QUIET seconds (at most RESET_TIMEOUT seconds).
+        Return the seconds the reset took. """
+        loop = asyncio.get_running_loop()
+        start = self._last_input = loop.time()
+        deadline = start + self.RESET_TIMEOUT
+        self._resetting = True
+        try:
+            self.send(RESET)
+            while True:
+                wakeup = min(self._last_input + self.RESET_QUIET, deadline)
+                if loop.time() >= wakeup:
+                    break
+                await asyncio.sleep(wakeup - loop.time())
+        finally:
+            self._resetting = False
+            self._frames.clear()
+        return loop.time() - start
+
+    async def close(self):
+        """ close connection to rfxtrx device """
+
+    def send(self, data):
+        """ Queue the given packet for writing, without blocking.
+
+        When transmits are tracked (see :meth:`track_transmits`) an RF
+        command returns the :class:`concurrent.futures.Future` of its ACK
+        or NAK.
+        """
+        response = None
+        if self.tracker is not None and self.tracker.tracks(data):
+            data = bytearray(data)
+            response = self.tracker.register(data)
+        pkt = RFXtrxTransport.prepare(data)
+        self._write(pkt)
+        return response
+
+    async def drain(self):
+        """ Wait until the written data has been handed to the device """
+
+    def pause_reading(self):
+        """ Stop reading from the device until :meth:`resume_reading` """
+
+    def resume_reading(self):
+        """ Resume reading from the device """
+
+    def _write(self, pkt):
+        """ Queue the whole packet for writing to the device """
+
+    def _frames_received(self):
+        """ Hand every complete frame in the buffer to the callback """
+        if self._resetting:
+            self._last_input = asyncio.get_running_loop().time()
+            self._frames.clear()
+            return
+        pkt = self._frames.pop_frame()
+        while pkt is not None:
+            _LOGGER.debug(
+                "Recv: %s",
+                " ".join("0x{0:02x}".format(x) for x in pkt)
+            )
+            if self.frame_callback:
+                self.frame_callback(pkt)
+            pkt = self._frames.pop_frame()
+
+    def _connection_lost(self, exception):
+        if self.tracker is not None:
+            self.tracker.fail_all(RFXtrxTransportError(
+                "Connection lost: {0}".format(exception)))
+        if self.lost_callback:
+            self.lost_callback(exception)
+
+
+###############################################################################
+# AsyncSerialTransport class
+###############################################################################
+
+class AsyncSerialTransport(AsyncTransport):
+    """ Implementation of an asyncio transport using PySerial.
+
+    The port is opened in non-blocking mode and read from an event loop
+    reader on its file descriptor, which requires a POSIX system. What the
+    port does not take at once is written by an event loop writer.
+    """
+
+    def __init__(self, port):
+        super().__init__()
+        self.port = port
+        self.serial = None
+        self._loop = None
+        self._outgoing = bytearray()
+        self._drained = None
+
+    async def connect(self, timeout=None):
+        """ Open a serial connexion """
+        try:
+            self.serial = open_serial(self.port, timeout=0)
+        except serial.SerialException as exception:
+            raise RFXtrxTransportError(
+                "connect failed: {0}".format(exception)) from exception
+        os.set_blocking(self.serial.fileno(), False)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self.serial.fileno(), self._on_readable)
+
+    def pause_reading(self):
+        """ Stop reading from the device until :meth:`resume_reading` """
+        self._loop.remove_reader(self.serial.fileno())
+
+    def resume_reading(self):
+        """ Resume reading from the device """
+        if self.serial.is_open:
+            self._loop.add_reader(self.serial.fileno(), self._on_readable)
+
+    def _on_readable(self):
+        try:
+            data = self.serial.read(max(self.serial.in_waiting, 1))
+        except (serial.SerialException, OSError) as exception:
+            self._loop.remove_reader(self.serial.fileno())
+            self._connection_lost(exception)
+            return
+        self._frames.feed(data)
+        self._frames_received()
+
+    async def reset(self):
+        """ Reset the RFXtrx, return the seconds it took """
+        duration = await super().reset()
+        self.serial.reset_input_buffer()
+        return duration
+
+    def _write(self, pkt):
+        if self.serial is None or not self.serial.is_open:
+            raise RFXtrxTransportError("send failed: not connected")
+        if not self._outgoing:
+            pkt = pkt[self._write_some(pkt):]
+            if not pkt:
+                return
+            self._loop.add_writer(self.serial.fileno(), self._on_writable)
+        self._outgoing += pkt
+
+    def _write_some(self, data):
+        """ Write what the port takes without blocking, return the count """
+        try:
+            return os.write(self.serial.fileno(), data)
+        except BlockingIOError:
+            return 0
+        except OSError as exception:
+            raise RFXtrxTransportError(
+                "send failed: {0}".format(exception)) from exception
+
+    def _on_writable(self):
+        try:
+            count = self._write_some(self._outgoing)
+        except RFXtrxTransportError as exception:
+            self._stop_writing()
+            self._connection_lost(exception)
+            return
+        del self._outgoing[:count]
+        if not self._outgoing:
+            self._stop_writing()
+
+    def _stop_writing(self):
+        """ Drop what is left to write and wake up :meth:`drain` """
+        self._loop.remove_writer(self.serial.fileno())
+        self._outgoing.clear()
+        drained, self._drained = self._drained, None
+        if drained is not None and not drained.done():
+            drained.set_result(None)
+
+    async def drain(self):
+        """ Wait until the written data has been handed to the port """
+        if self._outgoing:
+            if self._drained is None:
+                self._drained = self._loop.create_future()
+            await self._drained
+
+    async def close(self):
+        """ close connection to rfxtrx device """
+        if self.serial is None:
+            return
+        if self._loop is not None and self.serial.is_open:
+            self._loop.remove_reader(self.serial.fileno())
+            self._stop_writing()
+        self.serial.close()
+
+
+###############################################################################
+# AsyncNetworkTransport class
+###############################################################################
+
+class _FrameProtocol(asyncio.BufferedProtocol):
+    """ Protocol receiving straight into the transport's frame buffer """
+
+    def __init__(self, owner):
+        self._owner = owner
+        self._paused = None
+
+    def get_buffer(self, sizehint):
+        # pylint: disable=protected-access
+        return self._owner._frames.writable()
+
+    def buffer_updated(self, nbytes):
+        # pylint: disable=protected-access
+        self._owner._frames.commit(nbytes)
+        self._owner._frames_received()
+
+    def eof_received(self):
+        return False
+
+    def connection_lost(self, exc):
+        # pylint: disable=protected-access
+        if self._paused is not None and not self._paused.done():
+            self._paused.set_result(None)
+        self._owner._connection_lost(
+            exc or RFXtrxTransportError("Server was shutdown"))
+
+    def pause_writing(self):
+        self._paused = asyncio.get_running_loop().create_future()
+
+    def resume_writing(self):
+        if self._paused is not None and not self._paused.done():
+            self._paused.set_result(None)
+        self._paused = None
+
+    async def drain(self):
+        """ Wait while the write buffer is above its high water mark """
+        if self._paused is not None:
+            await self._paused
+
+
+class AsyncNetworkTransport(AsyncTransport):
+    """ Implementation of an asyncio transport using TCP """
+
+    def __init__(self, hostport):
+        super().__init__()
+        self.hostport = hostport    # must be a (host, port) tuple
+        self._transport = None
+        self._protocol = None
+
+    async def connect(self, timeout=None):
+        """ Open a socket connection """
+        loop = asyncio.get_running_loop()
+        try:
+            self._transport, self._protocol = await asyncio.wait_for(
+                loop.create_connection(lambda: _FrameProtocol(self),
+                                       *self.hostport),
+                timeout)
+        except OSError as exception:
+            raise RFXtrxTransportError(
+                "connect failed: {0}".format(exception)) from exception
+        _LOGGER.debug("Connected to network socket")
+
+    def _write(self, pkt):
+        if self._transport is None or self._transport.is_closing():
+            raise RFXtrxTransportError("send failed: not connected")
+        self._transport.write(pkt)
+
+    async def drain(self):
+        """ Wait until the written data has been handed to the socket """
+        await self._protocol.drain()
+
+    def pause_reading(self):
+        """ Stop reading from the device until :meth:`resume_reading` """
+        self._transport.pause_reading()
+
+    def resume_reading(self):
+        """ Resume reading from the device """
+        if not self._transport.is_closing():
+            self._transport.resume_reading()
+
+    async def close(self):
+        """ close connection to rfxtrx device """
+        if self._transport is not None:
+            self._transport.close()
+
+
+###############################################################################
+# AsyncConnect class
+###############################################################################
+
+class AsyncConnect:
+    """ The asyncio counterpart of :class:`RFXtrx.Connect`.
+
+    The event callback is called on the event loop for every received
+    event, without any thread in between.
+    """
+    #  pylint: disable=too-many-instance-attributes
+
+    RESPONSE_TIMEOUT = Connect.RESPONSE_TIMEOUT
+    STATUS_RETRY = Connect.STATUS_RETRY
+
+    def __init__(self, transport, event_callback=None, modes=None):
+        self._sensors = {}
+        self._status = None
+        self._modes = modes
+        self._response = None
+        self._lock = asyncio.Lock()
+        self._running = False
+        self._early_events = []
+        self._streams = []
+        self._full_streams = set()
+        self.event_callback = event_callback
+        self.transport: AsyncTransport = transport
+
+    async def connect(self, timeout=None):
+        """ Connect to the device and run the start up handshake """
+        self.transport.frame_callback = self._frame_received
+        self.transport.lost_callback = self._connection_lost
+        try:
+            await asyncio.wait_for(self._connect_internal(timeout), timeout)
+        except asyncio.TimeoutError:
+            await self.transport.close()
+            raise TimeoutError() from None
+
+    async def _connect_internal(self, timeout):
+        await self.transport.connect(timeout)
+        duration = await self.transport.reset()
+        _LOGGER.info("Reset took %.3f s", duration)
+        self._status = await self._get_status_after_reset()
+
+        if self._modes is not None and \
+                self._status.device.recmodes_mask != \
+                lowlevel.get_recmodes_mask(self._modes):
+            await self.set_recmodes(self._modes)
+            self._status = await self.send_get_status()
+
+        if self._status:
+            _LOGGER.debug(
+                "Status: %s", self._status.device
+            )
+
+        await self.send_start()
+
+        self._running = True
+        if self.event_callback:
+            self.event_callback(ConnectionDone())
+
+        # Deliver what arrived while the handshake was still running
+        early_events, self._early_events = self._early_events, []
+        for event in early_events:
+            self._dispatch(event)
+
+    async def _get_status_after_reset(self):
+        """ Ask for the status every STATUS_RETRY seconds until the device
+        answers, for at most the RESET_TIMEOUT of the transport """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.transport.RESET_TIMEOUT
+        while loop.time() < deadline:
+            try:
+                return await self._request(GET_STATUS, self.STATUS_RETRY)
+            except TimeoutError:
+                _LOGGER.debug("No status yet, the device is still resetting")
+        return await self.send_get_status()
+
+    def _frame_received(self, data):
+        event = self.transport.parse(data)
+        if not isinstance(event, RFXtrxEvent):
+            return
+        if isinstance(event, StatusEvent):
+            if self._response is not None and not self._response.done():
+                self._response.set_result(event)
+            else:
+                _LOGGER.debug("Unsolicited response: %s", event.device)
+            return
+        if isinstance(event, ResponseEvent):
+            tracker = self.transport.tracker
+            if tracker is None or not tracker.resolve(event.device):
+                _LOGGER.debug("Unmatched transmitter response: %s",
+                              event.device)
+            return
+        if not self._running:
+            self._early_events.append(event)
+            return
+        self._dispatch(event)
+
+    def _dispatch(self, event):
+        if self.event_callback:
+            self.event_callback(event)
+        for stream in self._streams:
+            if not stream.put(event, wait=False):
+                if not self._full_streams:
+                    self.transport.pause_reading()
+                self._full_streams.add(stream)
+        if isinstance(event, SensorEvent):
+            self._sensors[event.device.id_string] = event.device
+
+    def _connection_lost(self, exception):
+        _LOGGER.info("Connection lost %s", exception)
+        self._fail_response(RFXtrxTransportError(
+            "Connection lost: {0}".format(exception)))
+        if self._running and self.event_callback:
+            self.event_callback(ConnectionLost())
+        self._running = False
+
+    def _fail_response(self, exception):
+        """ Fail the request waiting for a response, if any """
+        if self._response is not None and not self._response.done():
+            self._response.set_exception(exception)
+
+    async def _request(self, data, timeout=None):
+        """ Send an interface command and return the response to it.
+
+        Raise TimeoutError when no response arrived within timeout seconds
+        (RESPONSE_TIMEOUT by default), and RFXtrxTransportError when the
+        connection was lost or closed meanwhile.
+        """
+        if timeout is None:
+            timeout = self.RESPONSE_TIMEOUT
+        async with self._lock:
+            self._response = asyncio.get_running_loop().create_future()
+            try:
+                self.transport.send(data)
+                await self.transport.drain()
+                return await asyncio.wait_for(self._response, timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError("No response to interface command") \
+                    from None
+            finally:
+                self._response = None
+
+    def events(self, maxsize=100, overflow=EventStream.DROP_OLDEST,
+               packettypes=None, subtypes=None, ids=None):
+        """ Return an :class:`RFXtrx.EventStream` of received events.
+
+        With the ``block`` policy, reading from the device is paused while
+        the queue is full instead of blocking the event loop.
+        """
+        #  pylint: disable=too-many-arguments
+        stream = EventStream(maxsize, overflow, packettypes, subtypes, ids)
+        stream.on_close = self._remove_stream
+        stream.on_drained = self._stream_drained
+        self._streams = self._streams + [stream]
+        return stream
+
+    def _stream_drained(self, stream):
+        if stream in self._full_streams:
+            self._full_streams.discard(stream)
+            if not self._full_streams:
+                self.transport.resume_reading()
+
+    def _remove_stream(self, stream):
+        self._streams = [item for item in self._streams if item is not stream]
+        self._stream_drained(stream)
+
+    def sensors(self):
+        """ Return all found sensors.
+        :return: dict of :class:`Sensor` instances.
+        """
+        return self._sensors
+
+    async def send(self, data):
+        """ Send the given packet and wait until it has been written.
+
+        When the transport tracks transmits, an RF command also waits for
+        the transmitter response and returns it.
+        """
+        response = self.transport.send(data)
+        await self.transport.drain()
+        if response is None:
+            return None
+        return await asyncio.wrap_future(response)
+
+    async def close(self):
+        """ Close connection to rfxtrx device """
+        self._running = False
+        for stream in self._streams:
+            stream.close()
+        self._fail_response(RFXtrxTransportError("Connection closed"))
+        await self.transport.close()
+        if self.transport.tracker is not None:
+            self.transport.tracker.fail_all(
+                RFXtrxTransportError("Connection closed"))
+
+    async def set_recmodes(self, modenames):
+        """ Sets the device modes (which protocols to decode) """
+        # Keep the values read during init.
+        data = lowlevel.get_recmodes_packet(
+            self._status.device.tranceiver_type,
+            self._status.device.output_power,
+            modenames)
+
+        response = await self._request(data)
+        self._modes = modenames
+        return response
+
+    async def send_start(self):
+        """ Sends the Start RFXtrx transceiver command """
+        return await self._request(START)
+
+    async def send_get_status(self):
+        """ Sends the Get Status command """
+        return await self._request(GET_STATUS)
@@ -0,0 +1,215 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module generates synthetic sensor traffic and measures how a Connect
+keeps up with it. The traffic is sent by an :class:`Emulator` over TCP or a
+pty, so the real transport and reader loop are measured::
+
+    python -m RFXtrx.benchmark --sensors 500 --rate 2000 --burst 20
+"""
+
+import argparse
+import random
+import threading
+from collections import deque
+from time import perf_counter, sleep, thread_time
+
+from . import Connect, PyNetworkTransport, PySerialTransport, lowlevel
+from .emulator import Emulator
+from .microbench import SAMPLES
+
+
+###############################################################################
+# LoadGenerator class
+###############################################################################
+
+class LoadGenerator:
+    """ Simulates sensors of the given packettypes (all of SAMPLES by
+    default) sending rate frames per second in total.
+
+    The frames come in bursts of burst frames sent back to back, with the
+    bursts spread as a Poisson process, so a larger burst at the same rate
+    means the same load in fewer, bigger spikes.
+    """
+    #  pylint: disable=too-few-public-methods
+
+    def __init__(self, sensors=100, rate=1000.0, burst=1, packettypes=None,
+                 seed=None):
+        #  pylint: disable=too-many-arguments
+        packettypes = sorted(packettypes or SAMPLES)
+        self.rate = rate
+        self.burst = burst
+        self.sensors = []
+        for i in range(sensors):
+            packettype = packettypes[i % len(packettypes)]
+            frame = bytearray.fromhex(SAMPLES[packettype])
+            # Vary the id of the sensor by the last id bytes
+            start, end = lowlevel.id_bytes(frame[1], frame[2])
+            count = i // len(packettypes)
+            if end > start:
+                frame[end - 1] ^= count & 0xff
+            if end - start > 1:
+                frame[end - 2] ^= (count >> 8) & 0xff
+            self.sensors.append(bytes(frame))
+        self._random = random.Random(seed)
+
+    def schedule(self):
+        """ Yield (seconds since the start, frame) forever, the frames
+        numbered with consecutive seqnbrs """
+        offset = 0.0
+        seqnbr = 0
+        while True:
+            offset += self._random.expovariate(self.rate / self.burst)
+            for _ in range(self.burst):
+                frame = bytearray(self._random.choice(self.sensors))
+                frame[3] = seqnbr
+                seqnbr = (seqnbr + 1) % 256
+                yield offset, frame
+
+
+###############################################################################
+# Benchmark
+###############################################################################
+
+def percentile(values, fraction):
+    """ Return the nearest-rank percentile of sorted values """
+    if not values:
+        return None
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+def run(generator, duration=10.0, transport='tcp', drain=5.0):
+    """ Send the traffic of generator to a Connect for duration seconds.
+
+    Return a report dict: the frames sent, the events received, the
+    frames dropped on the way, the events per second, the latency
+    percentiles from sending a frame to its callback in seconds, and the
+    CPU time the reader thread used per event in seconds.
+    """
+    #  pylint: disable=too-many-locals
+    emulator = Emulator()
+    if transport == 'pty':
+        rfx = PySerialTransport(emulator.open_pty())
+    else:
+        rfx = PyNetworkTransport(emulator.open_tcp())
+    sent = deque()
+    latencies = []
+    cpu = []
+    lost = [0]
+    finished = threading.Event()
+    done = threading.Event()
+
+    def callback(event):
+        data = getattr(event, 'data', None)
+        if data is None or not sent:
+            return
+        now = perf_counter()
+        # Frames the pty dropped when its buffer ran full never arrive
+        sent_at, seqnbr = sent.popleft()
+        while seqnbr != data[3] and sent:
+            lost[0] += 1
+            sent_at, seqnbr = sent.popleft()
+        latencies.append(now - sent_at)
+        cpu.append(thread_time())
+        if not sent and finished.is_set():
+            done.set()
+
+    core = Connect(rfx, callback)
+    core.connect(10)
+    count = 0
+    start = perf_counter()
+    for offset, frame in generator.schedule():
+        if offset >= duration:
+            break
+        delay = start + offset - perf_counter()
+        if delay > 0:
+            sleep(delay)
+        sent.append((perf_counter(), frame[3]))
+        emulator.inject(frame)
+        count += 1
+    finished.set()
+    if sent:
+        done.wait(drain)
+    elapsed = perf_counter() - start
+    core.close_connection()
+    emulator.close()
+
+    latencies.sort()
+    cpu_per_event = None
+    if len(cpu) > 1:
+        cpu_per_event = (cpu[-1] - cpu[0]) / (len(cpu) - 1)
+    return {
+        'sent': count,
+        'events': len(latencies),
+        'dropped': lost[0] + len(sent),
+        'events_per_sec': len(latencies) / elapsed,
+        'latency_p50': percentile(latencies, 0.50),
+        'latency_p99': percentile(latencies, 0.99),
+        'latency_p999': percentile(latencies, 0.999),
+        'cpu_per_event': cpu_per_event,
+    }
+
+
+def _packettype(value):
+    packettype = int(value, 0)
+    if packettype not in SAMPLES:
+        raise argparse.ArgumentTypeError(
+            "no sample for packettype {0}".format(value))
+    return packettype
+
+
+def main(argv=None):
+    """ Run the benchmark from the command line """
+    parser = argparse.ArgumentParser(
+        prog='python -m RFXtrx.benchmark',
+        description="Measure the throughput and latency of the reader loop")
+    parser.add_argument('--sensors', type=int, default=100,
+                        help="number of simulated sensors")
+    parser.add_argument('--rate', type=float, default=1000.0,
+                        help="frames per second from all sensors together")
+    parser.add_argument('--burst', type=int, default=1,
+                        help="frames sent back to back in each burst")
+    parser.add_argument('--duration', type=float, default=10.0,
+                        help="seconds to send traffic")
+    parser.add_argument('--packettype', type=_packettype, action='append',
+                        dest='packettypes',
+                        help="simulate this packettype only (repeatable)")
+    parser.add_argument('--transport', choices=('tcp', 'pty'),
+                        default='tcp')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    generator = LoadGenerator(args.sensors, args.rate, args.burst,
+                              args.packettypes, args.seed)
+    report = run(generator, args.duration, args.transport)
+    print("frames sent:      {0}".format(report['sent']))
+    print("events received:  {0}".format(report['events']))
+    print("frames dropped:   {0}".format(report['dropped']))
+    print("events/sec:       {0:.0f}".format(report['events_per_sec']))
+    for name in ('p50', 'p99', 'p999'):
+        value = report['latency_' + name]
+        if value is not None:
+            print("latency {0:<9}{1:.3f} ms".format(name + ':', value * 1e3))
+    if report['cpu_per_event'] is not None:
+        print("CPU per event:    {0:.1f} us".format(
+            report['cpu_per_event'] * 1e6))
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module records the frames of an RFXtrx connection to capture files
+and replays them.
+
+A capture file starts with a header holding the magic bytes, the format
+version and the wall clock time the recording started (ns since the
+epoch). Every frame follows as a record: the monotonic time since the
+start in ns, the direction (RECEIVED or SENT) and the raw frame, whose
+first byte is its own length.
+"""
+
+import bisect
+import heapq
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+
+from . import RFXtrxTransport, RFXtrxTransportError, lowlevel
+
+MAGIC = b'RFXCAP'
+VERSION = 1
+HEADER = struct.Struct('<6sBxQ')
+RECORD = struct.Struct('<QB')
+
+RECEIVED = 0
+SENT = 1
+
+INDEX_MAGIC = b'RFXIDX'
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct('<6sBxQQI')
+INDEX_KEY = struct.Struct('<BBBI')
+
+
+def read_header(fileobj):
+    """ Read the header of a capture file, return the wall clock time the
+    recording started in ns since the epoch """
+    header = fileobj.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError("Not an RFXtrx capture file")
+    magic, version, start_ns = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not an RFXtrx capture file")
+    if version != VERSION:
+        raise ValueError("Unsupported capture version {0}".format(version))
+    return start_ns
+
+
+def iter_capture(fileobj):
+    """ Yield the (offset_ns, direction, frame) records of a capture file.
+    A record cut short at the end of the file, as left by a recording that
+    is still running, is not returned. """
+    read_header(fileobj)
+    while True:
+        head = fileobj.read(RECORD.size + 1)
+        if len(head) < RECORD.size + 1:
+            return
+        offset, direction = RECORD.unpack_from(head)
+        rest = fileobj.read(head[-1])
+        if len(rest) < head[-1]:
+            return
+        yield offset, direction, head[RECORD.size:] + rest
+
+
+def device_key(frame):
+    """ Return the (packettype, subtype, id bytes) index key of a frame """
+    start, end = lowlevel.id_bytes(frame[1], frame[2])
+    return frame[1], frame[2], bytes(frame[start:end])
+
+
+###############################################################################
+# CaptureWriter class
+###############################################################################
+
+class CaptureWriter:
+    """ Write frames to a new capture file. Safe to use from the reader
+    thread and the sending threads at once. """
+
+    def __init__(self, path):
+        #  pylint: disable=consider-using-with
+        self._file = open(path, 'wb')
+        self._lock = threading.Lock()
+        self._base = time.monotonic_ns()
+        self.start_ns = time.time_ns()
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.start_ns))
+
+    def write_frame(self, frame, sent=False):
+        """ Append a frame, timestamped now """
+        self.write_record(time.monotonic_ns() - self._base,
+                          SENT if sent else RECEIVED, frame)
+
+    def write_record(self, offset_ns, direction, frame):
+        """ Append a frame with the given time since the start in ns """
+        with self._lock:
+            self._file.write(RECORD.pack(offset_ns, direction))
+            self._file.write(frame)
+
+    def flush(self):
+        """ Write buffered records to the file """
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """ Close the capture file """
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+###############################################################################
+# RecordingTransport class
+###############################################################################
+
+class RecordingTransport(RFXtrxTransport):
+    """ Wraps any transport and records every frame it sends and receives.
+
+    Closing the transport only flushes the capture, so a reconnect keeps
+    recording to the same file; close :attr:`capture` when done.
+    """
+
+    def __init__(self, transport, path):
+        self.transport = transport
+        self.capture = CaptureWriter(path)
+        transport.frame_hook = self.capture.write_frame
+
+    def connect(self, timeout=None):
+        """ connect to device """
+        self.transport.connect(timeout)
+
+    def reset(self):
+        """ reset the rfxtrx device """
+        return self.transport.reset()
+
+    def close(self):
+        """ close connection to rfxtrx device """
+        self.transport.close()
+        self.capture.flush()
+
+    def receive_blocking(self, timeout=None):
+        """ Wait until a packet is received and return with an RFXtrxEvent """
+        return self.transport.receive_blocking(timeout=timeout)
+
+    def send(self, data):
+        """ Send the given packet """
+        return self.transport.send(data)
+
+    def track_transmits(self, timeout=2.0):
+        """ Track the transmits of the wrapped transport """
+        return self.transport.track_transmits(timeout)
+
+    @property
+    def pool(self):
+        """ The :class:`RFXtrx.ReceivePool` of the wrapped transport """
+        return self.transport.pool
+
+    @pool.setter
+    def pool(self, pool):
+        self.transport.pool = pool
+
+
+###############################################################################
+# ReplayTransport class
+###############################################################################
+
+class ReplayTransport(RFXtrxTransport):
+    """ Feeds the received frames of a capture file back through
+    :meth:`RFXtrxTransport.parse`.
+
+    With speed 1.0 the frames come at the pace they were recorded, with N
+    they come N times faster and with None as fast as possible. Sent
+    frames in the capture and packets sent to this transport are dropped.
+    At the end of the capture :meth:`receive_blocking` raises
+    RFXtrxTransportError, like a lost connection.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self._file = None
+        self._records = None
+        self._pending = None
+        self._start = None
+        self._closed = threading.Event()
+
+    def connect(self, timeout=None):
+        """ Open the capture file """
+        #  pylint: disable=consider-using-with
+        self._file = open(self.path, 'rb')
+        self._records = (
+            (offset, frame)
+            for offset, direction, frame in iter_capture(self._file)
+            if direction == RECEIVED)
+        self._pending = None
+        self._start = None
+        self._closed.clear()
+
+    def reset(self):
+        """ Nothing to reset in a capture """
+        return 0.0
+
+    def send(self, data):
+        """ Drop the given packet (except printing debug info if
+        requested) """
+        self.prepare(data)
+
+    def receive_blocking(self, timeout=None):
+        """ Wait until the next frame is due and return with an
+        RFXtrxEvent. Return None when it is not due within timeout
+        seconds. """
+        if self._closed.is_set():
+            raise RFXtrxTransportError("Transport was closed")
+        if self._pending is None:
+            self._pending = next(self._records, None)
+            if self._pending is None:
+                raise RFXtrxTransportError("End of capture")
+        offset, frame = self._pending
+        if self.speed:
+            due = offset / 1e9 / self.speed
+            if self._start is None:
+                # Play from the first frame on
+                self._start = time.monotonic() - due
+            delay = self._start + due - time.monotonic()
+            if timeout is not None and delay > timeout:
+                self._closed.wait(timeout)
+                return None
+            if delay > 0 and self._closed.wait(delay):
+                raise RFXtrxTransportError("Transport was closed")
+        self._pending = None
+        return self._received(bytearray(frame))
+
+    def close(self):
+        """ Stop replaying """
+        self._closed.set()
+        if self._file is not None:
+            self._file.close()
+
+
+###############################################################################
+# CaptureReader class
+###############################################################################
+
+class CaptureReader:
+    """ Reads a capture file through mmap and answers queries by device
+    and time from an index.
+
+    The index holds the time and file position of every received frame,
+    keyed by :func:`device_key`. It is built on the first query and
+    saved next to the capture (``<path>.idx``), so later readers load it
+    instead of scanning. A capture that grew since is indexed from where
+    the saved index stopped. Only the frames a query matches are decoded.
+    """
+
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or "{0}.idx".format(path)
+        with open(path, 'rb') as fileobj:
+            self.start_ns = read_header(fileobj)
+            self._map = mmap.mmap(fileobj.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        self._index = None
+        self._indexed = HEADER.size
+        self._devices = {}
+
+    def close(self):
+        """ Unmap the capture file """
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        """ Yield the (offset_ns, direction, frame) records """
+        data = self._map
+        pos = HEADER.size
+        while pos + RECORD.size < len(data):
+            offset, direction = RECORD.unpack_from(data, pos)
+            end = pos + RECORD.size + data[pos + RECORD.size] + 1
+            if end > len(data):
+                return
+            yield offset, direction, data[pos + RECORD.size:end]
+            pos = end
+
+    def keys(self):
+        """ Return the device keys in the capture """
+        return list(self._get_index())
+
+    def find(self, id_string, packettype=None):
+        """ Return the device keys whose frames decode to id_string """
+        found = []
+        for key, (_, positions) in self._get_index().items():
+            if packettype is not None and key[0] != packettype:
+                continue
+            if key not in self._devices:
+                pkt = lowlevel.parse(self._frame(positions[0]))
+                self._devices[key] = pkt and pkt.id_string
+            if self._devices[key] == id_string:
+                found.append(key)
+        return found
+
+    def frames(self, key, start=None, end=None):
+        """ Yield the (timestamp, frame) of a device from start up to end,
+        in seconds since the epoch """
+        offsets, positions = self._get_index().get(key, ((), ()))
+        first = 0 if start is None else \
+            bisect.bisect_left(offsets, self._offset(start))
+        last = len(offsets) if end is None else \
+            bisect.bisect_left(offsets, self._offset(end))
+        for i in range(first, last):
+            yield ((self.start_ns + offsets[i]) / 1e9,
+                   self._frame(positions[i]))
+
+    def packets(self, id_string, start=None, end=None, packettype=None):
+        """ Yield the (timestamp, packet) of a device from start up to end,
+        in seconds since the epoch """
+        for timestamp, frame in heapq.merge(
+                *(self.frames(key, start, end)
+                  for key in self.find(id_string, packettype))):
+            pkt = lowlevel.parse(frame)
+            if pkt is not None and pkt.id_string == id_string:
+                yield timestamp, pkt
+
+    def _offset(self, timestamp):
+        return max(int(timestamp * 1e9) - self.start_ns, 0)
+
+    def _frame(self, pos):
+        return bytearray(self._map[pos:pos + self._map[pos] + 1])
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = {}
+            self._load_index()
+            if self._indexed < len(self._map):
+                indexed = self._indexed
+                self._scan()
+                if self._indexed != indexed:
+                    self._save_index()
+        return self._index
+
+    def _scan(self):
+        """ Index the records after the indexed part """
+        data = self._map
+        pos = self._indexed
+        while pos + RECORD.size < len(data):
+            offset, direction = RECORD.unpack_from(data, pos)
+            frame = pos + RECORD.size
+            end = frame + data[frame] + 1
+            if end > len(data):
+                break
+            if direction == RECEIVED and data[frame] >= 3:
+                key = device_key(data[frame:end])
+                if key not in self._index:
+                    self._index[key] = (array('Q'), array('Q'))
+                self._index[key][0].append(offset)
+                self._index[key][1].append(frame)
+            pos = end
+        self._indexed = pos
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'rb') as fileobj:
+                data = fileobj.read()
+        except FileNotFoundError:
+            return
+        if len(data) < INDEX_HEADER.size:
+            return
+        magic, version, start_ns, indexed, count = \
+            INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or \
+                start_ns != self.start_ns or indexed > len(self._map):
+            return
+        self._index = _unpack_index(data, count)
+        self._indexed = indexed
+
+    def _save_index(self):
+        parts = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.start_ns,
+                                   self._indexed, len(self._index))]
+        for (packettype, subtype, ids), (offsets, positions) \
+                in self._index.items():
+            parts.append(INDEX_KEY.pack(packettype, subtype, len(ids),
+                                        len(offsets)))
+            parts.append(ids)
+            parts.append(offsets.tobytes())
+            parts.append(positions.tobytes())
+        temp = "{0}.tmp".format(self.index_path)
+        with open(temp, 'wb') as fileobj:
+            fileobj.write(b''.join(parts))
+        os.replace(temp, self.index_path)
+
+
+def _unpack_index(data, count):
+    """ Return the device keys of an index file with their (offsets,
+    positions) arrays """
+    pos = INDEX_HEADER.size
+    index = {}
+    for _ in range(count):
+        packettype, subtype, idlen, entries = INDEX_KEY.unpack_from(data, pos)
+        pos += INDEX_KEY.size
+        key = (packettype, subtype, data[pos:pos + idlen])
+        pos += idlen
+        offsets, positions = array('Q'), array('Q')
+        offsets.frombytes(data[pos:pos + 8 * entries])
+        pos += 8 * entries
+        positions.frombytes(data[pos:pos + 8 * entries])
+        pos += 8 * entries
+        index[key] = (offsets, positions)
+    return index
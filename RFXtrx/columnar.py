@@ -0,0 +1,337 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module decodes many sensor frames at once into NumPy columns, for
+the analysis of captures. The frames are grouped by (packettype, subtype)
+into 2-D uint8 arrays of one row per frame, and the fields load_receive
+sets are computed as array operations::
+
+    from RFXtrx import columnar
+    groups = columnar.decode_capture('rfxtrx.cap')
+    temphumid = groups[0x52, 0x01]
+    temphumid['time'], temphumid['id_string'], temphumid['temp']
+
+Every group is a dict of equally long columns named after the packet
+attributes, plus 'time' when the frames have timestamps. Fields that
+load_receive leaves unset for a subtype are left out, and the
+currentwatt that Cartelectronic TIC frames leave at None is NaN.
+
+NumPy is an optional dependency: pip install pyRFXtrx[numpy]
+"""
+
+try:
+    import numpy
+except ImportError as err:  # pragma: no cover
+    raise ImportError(
+        "RFXtrx.columnar requires NumPy, install pyRFXtrx[numpy]") from err
+
+from . import lowlevel
+from .capture import RECEIVED, CaptureReader
+
+
+###############################################################################
+# Column helpers
+###############################################################################
+
+def _uint(rows, index, size):
+    """ Return the big endian unsigned integers of size bytes at index """
+    value = rows[:, index].astype(numpy.int64)
+    for i in range(index + 1, index + size):
+        value = (value << 8) | rows[:, i]
+    return value
+
+
+def _temperature(word):
+    """ Return the temperatures in sign and magnitude words of tenths """
+    temp = (word & 0x7fff) / 10
+    return numpy.where(word & 0x8000, -temp, temp)
+
+
+def _set_temp(columns, rows, index):
+    temp = _uint(rows, index, 2)
+    columns['temphigh'] = temp >> 8
+    columns['templow'] = temp & 0xff
+    columns['temp'] = _temperature(temp)
+
+
+def _set_rssi(columns, rssi_byte):
+    columns['rssi_byte'] = rssi_byte
+    columns['battery'] = rssi_byte & 0x0f
+    columns['rssi'] = rssi_byte >> 4
+
+
+###############################################################################
+# Decoders by packettype
+###############################################################################
+
+def _decode_temp(columns, rows, _):
+    _set_temp(columns, rows, 6)
+    _set_rssi(columns, rows[:, 8])
+
+
+def _decode_temphumid(columns, rows, _):
+    _set_temp(columns, rows, 6)
+    columns['humidity'] = rows[:, 8]
+    columns['humidity_status'] = rows[:, 9]
+    _set_rssi(columns, rows[:, 10])
+
+
+def _decode_temphumidbaro(columns, rows, _):
+    _set_temp(columns, rows, 6)
+    columns['humidity'] = rows[:, 8]
+    columns['humidity_status'] = rows[:, 9]
+    columns['baro'] = _uint(rows, 10, 2)
+    columns['baro1'] = rows[:, 10]
+    columns['baro2'] = rows[:, 11]
+    columns['forecast'] = rows[:, 12]
+    _set_rssi(columns, rows[:, 13])
+
+
+def _decode_temprain(columns, rows, _):
+    _set_temp(columns, rows, 6)
+    columns['raintotal'] = (_uint(rows, 8, 2) & 0x7fff) / 10
+    _set_rssi(columns, rows[:, 10])
+
+
+def _decode_rain(columns, rows, subtype):
+    rainrate = _uint(rows, 6, 2)
+    columns['rainrate1'] = rows[:, 6]
+    columns['rainrate2'] = rows[:, 7]
+    if subtype == 1:
+        columns['rainrate'] = rainrate.astype(numpy.float64)
+    elif subtype == 2:
+        columns['rainrate'] = rainrate / 100
+    columns['raintotal1'] = rows[:, 8]
+    columns['raintotal2'] = rows[:, 9]
+    columns['raintotal3'] = rows[:, 10]
+    if subtype in (1, 2, 3, 4, 5, 7):
+        columns['raintotal'] = _uint(rows, 8, 3) / 10
+    elif subtype == 6:
+        columns['raintotal'] = 0.266 * rows[:, 10]
+    elif subtype == 8:
+        # cartridge can be 0.01 inch rather than 0.2mm
+        columns['raintotal'] = 0.2 * rows[:, 10]
+    elif subtype == 9:
+        columns['raintotal'] = 0.254 * _uint(rows, 9, 2)
+    _set_rssi(columns, rows[:, 11])
+
+
+def _decode_wind(columns, rows, subtype):
+    columns['direction'] = _uint(rows, 6, 2)
+    if subtype != 0x05:
+        columns['average_speed'] = _uint(rows, 8, 2) / 10.0
+    columns['gust'] = _uint(rows, 10, 2) / 10.0
+    if subtype in (0x04, 0x08, 0x09):
+        temp = _uint(rows, 12, 2)
+        columns['temphigh'] = temp >> 8
+        columns['templow'] = temp & 0xff
+        columns['temperature'] = _temperature(temp)
+        chill = _uint(rows, 14, 2)
+        columns['chillhigh'] = chill >> 8
+        columns['chilllow'] = chill & 0xff
+        columns['chill'] = _temperature(chill)
+    if subtype == 0x03:
+        columns['battery'] = rows[:, 16]
+    else:
+        _set_rssi(columns, rows[:, 16])
+
+
+def _decode_energy1(columns, rows, _):
+    columns['count'] = rows[:, 6]
+    columns['currentamps1'] = _uint(rows, 7, 2) / 10
+    columns['currentamps2'] = _uint(rows, 9, 2) / 10
+    columns['currentamps3'] = _uint(rows, 11, 2) / 10
+    _set_rssi(columns, rows[:, 13])
+
+
+def _decode_energy(columns, rows, subtype):
+    columns['count'] = rows[:, 6]
+    columns['currentwatt'] = _uint(rows, 7, 4)
+    columns['totalwatts'] = _uint(rows, 11, 6) / 223.666
+    if subtype == 0x03:
+        columns['battery'] = rows[:, 17]
+    else:
+        _set_rssi(columns, rows[:, 17])
+
+
+def _decode_energy4(columns, rows, _):
+    columns['count'] = rows[:, 6]
+    columns['currentamps1'] = _uint(rows, 7, 2) / 10
+    columns['currentamps2'] = _uint(rows, 9, 2) / 10
+    columns['currentamps3'] = _uint(rows, 11, 2) / 10
+    columns['totalwatthours'] = _uint(rows, 13, 6) / 223.666
+    _set_rssi(columns, rows[:, 19])
+
+
+def _decode_energy5(columns, rows, _):
+    columns['voltage'] = rows[:, 6]
+    columns['currentamps'] = _uint(rows, 7, 2) / 100
+    columns['currentwatt'] = _uint(rows, 9, 2) / 10
+    columns['totalwatthours'] = _uint(rows, 11, 2) * 10.0
+    columns['powerfactor'] = rows[:, 13] / 100
+    columns['frequency'] = rows[:, 14].astype(numpy.float64)
+    columns['rssi_byte'] = rows[:, 15]
+    columns['rssi'] = rows[:, 15] >> 4
+
+
+def _decode_cartelectronic(columns, rows, subtype):
+    for i in range(4):
+        columns['id{0}'.format(i + 1)] = rows[:, 4 + i]
+    columns['id_combined'] = _uint(rows, 4, 4)
+    if subtype == 0x01:
+        # TIC
+        columns['id5'] = rows[:, 8]
+        columns['id_combined'] = _uint(rows, 4, 5)
+        columns['contract_type'] = rows[:, 9]
+        columns['counter1'] = _uint(rows, 10, 4)
+        columns['counter2'] = _uint(rows, 14, 4)
+        state = rows[:, 20]
+        columns['currentwatt'] = numpy.where(
+            state & 0x02, _uint(rows, 18, 2), numpy.nan)
+        columns['state_byte'] = state
+        columns['teleinfo_ok'] = (state & 0x04) != 0x04
+        _set_rssi(columns, rows[:, 21])
+    elif subtype == 0x02:
+        # Cartelectronic Encoder
+        columns['counter1'] = _uint(rows, 8, 4)
+        columns['counter2'] = _uint(rows, 12, 4)
+        _set_rssi(columns, rows[:, 17])
+    else:
+        # Cartelectronic Linky
+        columns['conswatthours'] = _uint(rows, 8, 4)
+        columns['prodwatthours'] = _uint(rows, 12, 4)
+        columns['tarif_num'] = rows[:, 16] & 0x0f
+        columns['voltage'] = rows[:, 17].astype(numpy.int64) + 200
+        columns['currentwatt'] = _uint(rows, 18, 2)
+        state = rows[:, 20]
+        columns['state_byte'] = state
+        columns['teleinfo_ok'] = (state & 0x04) != 0x04
+        _set_rssi(columns, rows[:, 21])
+
+
+DECODERS = {
+    0x50: _decode_temp,
+    0x52: _decode_temphumid,
+    0x54: _decode_temphumidbaro,
+    0x4F: _decode_temprain,
+    0x55: _decode_rain,
+    0x56: _decode_wind,
+    0x59: _decode_energy1,
+    0x5A: _decode_energy,
+    0x5B: _decode_energy4,
+    0x5C: _decode_energy5,
+    0x60: _decode_cartelectronic,
+}
+""" Column decoders by packettype, other packet types are skipped """
+
+
+def _width(packettype, subtype):
+    """ Return the bytes load_receive reads of a frame, or None for
+    subtypes it cannot decode """
+    length = lowlevel.DISPATCH[packettype][1][subtype]
+    return length + 1 if length else None
+
+
+###############################################################################
+# Grouping and decoding
+###############################################################################
+
+def group_frames(frames):
+    """ Group the decodable frames by (packettype, subtype). Return a dict
+    of (rows, indices): a 2-D uint8 array of one row per frame, cut to the
+    width of the layout, and the positions of those frames in frames.
+    Frames too short for their layout are left out like parse does. """
+    groups = {}
+    widths = {}
+    for i, frame in enumerate(frames):
+        if len(frame) < 3 or frame[1] not in DECODERS:
+            continue
+        key = (frame[1], frame[2])
+        width = widths.get(key, 0)
+        if width == 0:
+            width = widths[key] = _width(*key)
+            groups[key] = ([], [])
+        if width is None or len(frame) < width:
+            continue
+        groups[key][0].append(bytes(frame[:width]))
+        groups[key][1].append(i)
+    result = {}
+    for key, (rows, indices) in groups.items():
+        if rows:
+            result[key] = (
+                numpy.frombuffer(b''.join(rows), numpy.uint8).reshape(
+                    len(rows), widths[key]),
+                numpy.array(indices, numpy.int64))
+    return result
+
+
+def _id_strings(packettype, subtype, rows):
+    """ Return the id_string column, formatted once per device """
+    start, end = lowlevel.id_bytes(packettype, subtype)
+    ids, first, inverse = numpy.unique(
+        rows[:, start:end], axis=0, return_index=True, return_inverse=True)
+    strings = numpy.empty(len(ids), object)
+    for i, row in enumerate(first):
+        pkt = lowlevel.PACKET_TYPES[packettype]()
+        pkt.load_receive(bytearray(rows[row].tobytes()))
+        strings[i] = pkt.id_string
+    return strings[inverse.reshape(-1)]
+
+
+def decode_rows(packettype, subtype, rows):
+    """ Decode the rows of one (packettype, subtype) group into a dict of
+    columns """
+    columns = {
+        'seqnbr': rows[:, 3],
+        'id_string': _id_strings(packettype, subtype, rows),
+    }
+    if packettype != 0x60:
+        columns['id1'] = rows[:, 4]
+        columns['id2'] = rows[:, 5]
+    DECODERS[packettype](columns, rows, subtype)
+    return columns
+
+
+def decode(frames, times=None):
+    """ Decode frames into columns, return a dict of the columns of every
+    (packettype, subtype). times, when given, holds the timestamp of every
+    frame and adds a 'time' column """
+    if times is not None:
+        times = numpy.asarray(times)
+    groups = {}
+    for key, (rows, indices) in group_frames(frames).items():
+        columns = decode_rows(key[0], key[1], rows)
+        if times is not None:
+            columns['time'] = times[indices]
+        groups[key] = columns
+    return groups
+
+
+def decode_capture(path):
+    """ Decode the received frames of a capture file into columns, with
+    their time in seconds since the epoch """
+    frames = []
+    offsets = []
+    with CaptureReader(path) as reader:
+        for offset, direction, frame in reader:
+            if direction == RECEIVED:
+                frames.append(frame)
+                offsets.append(offset)
+        start_ns = reader.start_ns
+    times = (start_ns + numpy.array(offsets, numpy.int64)) / 1e9
+    return decode(frames, times)
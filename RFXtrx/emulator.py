@@ -0,0 +1,266 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module emulates the firmware of an RFXtrx, reachable through a pty
+(which serial.Serial and PySerialTransport open like a USB device) and
+through a TCP port (for PyNetworkTransport), so the real transports can
+be tested end to end without hardware::
+
+    emulator = Emulator(traffic=[frame], interval=0.5)
+    core = RFXtrx.Connect(RFXtrx.PySerialTransport(emulator.open_pty()),
+                          print)
+"""
+
+import os
+import selectors
+import socket
+import threading
+import tty
+from time import monotonic
+
+from . import FrameBuffer
+
+COPYRIGHT = b'Copyright RFXCOM'
+
+
+###############################################################################
+# Session class
+###############################################################################
+
+class _Session:
+    """ The firmware state of one connection """
+    #  pylint: disable=too-few-public-methods
+
+    def __init__(self, write):
+        self.write = write
+        self.frames = FrameBuffer()
+        self.started = False
+        self.reset_at = None
+
+
+###############################################################################
+# Emulator class
+###############################################################################
+
+class Emulator:
+    """ Emulates RFXtrx firmware.
+
+    Like the firmware it answers the interface commands: a reset silences
+    the receiver and drops the commands sent during the next reset_time
+    seconds, get status and set mode answer with the status, and start
+    answers with the copyright message and enables the receiver. Transmit
+    packets are answered with a 0x02 transmitter response for their
+    seqnbr, ACK by default.
+
+    Once started, each connection gets the frames of traffic in turn
+    every interval seconds, and the frames passed to :meth:`inject`.
+    Responses are sent after latency seconds.
+    """
+    #  pylint: disable=too-many-instance-attributes, too-many-arguments
+
+    def __init__(self, traffic=(), interval=1.0, tranceiver_type=0x53,
+                 firmware_version=0x45, recmodes_mask=0x000C2F01,
+                 output_power=0x00, transmit_response=0x00,
+                 reset_time=0.05, latency=0.0):
+        self.traffic = [bytes(frame) for frame in traffic]
+        self.interval = interval
+        self.tranceiver_type = tranceiver_type
+        self.firmware_version = firmware_version
+        self.recmodes_mask = recmodes_mask
+        self.output_power = output_power
+        self.transmit_response = transmit_response
+        self.reset_time = reset_time
+        self.latency = latency
+        self.commands = []
+        self.transmits = []
+        self._seqnbr = 0
+        self._next_traffic = 0
+        self._next_at = None
+        self._sessions = {}
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._wakeup = socket.socketpair()
+        self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+        self._closed = False
+        self._fds = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def open_pty(self):
+        """ Open a pty and return the path of its device """
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        os.set_blocking(master, False)
+        # Keep the device open, so the pty outlives its clients
+        self._fds += [master, slave]
+
+        def write(data):
+            try:
+                os.write(master, data)
+            except BlockingIOError:
+                pass  # nobody reads the line, like an unread serial port
+        self._add(master, _Session(write))
+        return os.ttyname(slave)
+
+    def open_tcp(self, host='127.0.0.1', port=0):
+        """ Listen on a TCP port and return its (host, port) address """
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host, port))
+        server.listen(1)
+        server.setblocking(False)
+        self._add(server, None)
+        return server.getsockname()
+
+    def inject(self, frame):
+        """ Send a frame to the started connections now """
+        with self._lock:
+            for session in self._sessions.values():
+                if session is not None and session.started:
+                    session.write(bytes(frame))
+
+    def close(self):
+        """ Stop the emulator and close its endpoints """
+        self._closed = True
+        self._wakeup[1].send(b'\x00')
+        self._thread.join(5)
+        for key in list(self._selector.get_map().values()):
+            self._selector.unregister(key.fileobj)
+            if isinstance(key.fileobj, socket.socket):
+                key.fileobj.close()
+        for fd in self._fds:
+            os.close(fd)
+        self._wakeup[1].close()
+        self._selector.close()
+
+    def _add(self, fileobj, session):
+        with self._lock:
+            self._sessions[fileobj] = session
+            self._selector.register(fileobj, selectors.EVENT_READ)
+        self._wakeup[1].send(b'\x00')
+
+    def _write(self, session, data):
+        with self._lock:
+            session.write(data)
+
+    def _remove(self, fileobj):
+        with self._lock:
+            del self._sessions[fileobj]
+            self._selector.unregister(fileobj)
+        fileobj.close()
+
+    def _run(self):
+        while not self._closed:
+            timeout = None
+            if self._next_at is not None:
+                timeout = max(self._next_at - monotonic(), 0)
+            for key, _ in self._selector.select(timeout):
+                if key.fileobj is self._wakeup[0]:
+                    self._wakeup[0].recv(64)
+                elif self._sessions.get(key.fileobj, False) is None:
+                    self._accept(key.fileobj)
+                else:
+                    self._read(key.fileobj)
+            self._send_traffic()
+
+    def _accept(self, server):
+        try:
+            client, _ = server.accept()
+        except BlockingIOError:
+            return
+        self._add(client, _Session(client.sendall))
+
+    def _read(self, fileobj):
+        session = self._sessions[fileobj]
+        try:
+            if isinstance(fileobj, socket.socket):
+                data = fileobj.recv(4096)
+                if not data:
+                    self._remove(fileobj)
+                    return
+            else:
+                data = os.read(fileobj, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            if isinstance(fileobj, socket.socket):
+                self._remove(fileobj)
+            return
+        session.frames.feed(data)
+        frame = session.frames.pop_frame()
+        while frame is not None:
+            self._handle(session, frame)
+            frame = session.frames.pop_frame()
+
+    def _handle(self, session, frame):
+        """ Answer a frame written by the host """
+        if session.reset_at is not None:
+            if monotonic() - session.reset_at < self.reset_time:
+                return
+            session.reset_at = None
+        if len(frame) < 4:
+            return
+        if frame[1] == 0x00 and len(frame) == 14:
+            self._command(session, frame)
+        elif frame[1] >= 0x10:
+            self.transmits.append(bytes(frame))
+            self._respond(session, bytes([0x04, 0x02, 0x01, frame[3],
+                                          self.transmit_response]))
+
+    def _command(self, session, frame):
+        """ Answer an interface command """
+        cmnd = frame[4]
+        self.commands.append(cmnd)
+        if cmnd == 0x00:
+            session.started = False
+            session.reset_at = monotonic()
+        elif cmnd == 0x02:
+            self._respond(session, self._status(frame[3], cmnd))
+        elif cmnd == 0x03:
+            self.tranceiver_type = frame[5]
+            self.output_power = frame[6]
+            self.recmodes_mask = int.from_bytes(frame[7:11], 'big')
+            self._respond(session, self._status(frame[3], cmnd))
+        elif cmnd == 0x07:
+            self._respond(session, bytes([0x14, 0x01, 0x07, frame[3], 0x07])
+                          + COPYRIGHT)
+            session.started = True
+            if self._next_at is None and self.traffic:
+                self._next_at = monotonic() + self.interval
+
+    def _status(self, seqnbr, cmnd):
+        return bytes([0x0D, 0x01, 0x00, seqnbr, cmnd, self.tranceiver_type,
+                      self.firmware_version]) + \
+            self.recmodes_mask.to_bytes(4, 'big') + \
+            bytes([0x01, 0x00, self.output_power])
+
+    def _respond(self, session, data):
+        if self.latency:
+            threading.Timer(self.latency, self._write, (session, data)).start()
+        else:
+            self._write(session, data)
+
+    def _send_traffic(self):
+        if self._next_at is None or monotonic() < self._next_at:
+            return
+        frame = bytearray(self.traffic[self._next_traffic])
+        self._next_traffic = (self._next_traffic + 1) % len(self.traffic)
+        frame[3] = self._seqnbr
+        self._seqnbr = (self._seqnbr + 1) % 256
+        self.inject(frame)
+        self._next_at += self.interval
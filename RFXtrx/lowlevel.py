@@ -24,17 +24,97 @@ RFXtrx.
 # pylint: disable=C0302,R0902,R0903,R0911,R0913
 # pylint: disable= too-many-lines, too-many-statements
 
+import functools
+import struct
+
 ###############################################################################
 # Packet class
 ###############################################################################
 
 
+def _capability(datatype):
+    """ Return a has_<datatype> method """
+    def has_capability(self):
+        return hasattr(self, datatype)
+    has_capability.__name__ = 'has_' + datatype
+    has_capability.__doc__ = "Return True if the packet holds " + datatype
+    return has_capability
+
+
+class _LazyString:
+    """ A string attribute of a received packet, set by _set_strings on
+    first access """
+    # pylint: disable=protected-access
+
+    __slots__ = ('slot',)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj._strings_pending:
+            obj._strings_pending = False
+            obj._set_strings()
+        return self.slot.__get__(obj, objtype)
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+class _LazyTypeString(_LazyString):
+    """ The type_string of a packet, looked up in TYPE_STRINGS without
+    setting the other strings """
+    # pylint: disable=protected-access
+
+    __slots__ = ()
+
+    def __get__(self, obj, objtype=None):
+        if obj is not None and obj._strings_pending:
+            type_string = TYPE_STRINGS.get((obj.packettype, obj.subtype))
+            if type_string is not None:
+                return type_string
+        return super().__get__(obj, objtype)
+
+
+def _lazy_strings(cls):
+    """ Make the string slots of cls lazy """
+    for name in cls.__dict__.get('__slots__', ()):
+        if name.endswith('_string'):
+            lazy = _LazyTypeString if name == 'type_string' else _LazyString
+            setattr(cls, name, lazy(cls.__dict__[name]))
+
+
 class Packet():
     """ Abstract superclass for all low level packets """
 
+    __slots__ = ('data', 'packetlength', 'packettype', 'subtype', 'seqnbr',
+                 'rssi', 'rssi_byte', 'type_string', 'id_string',
+                 '_strings_pending')
+
+    CAPABILITIES = frozenset(name for name in __slots__
+                             if not name.startswith('_'))
+    """ Data types a packet of the class can hold, see has_value """
+
+    LENGTH = None
+    """ Shortest packet length, the first byte of a frame, that
+    load_receive decodes; one less than the size of LAYOUT by default """
+
     _UNKNOWN_TYPE = "Unknown type ({0:#04x}/{1:#04x})"
     _UNKNOWN_CMND = "Unknown command ({0:#04x})"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.CAPABILITIES = cls.CAPABILITIES.union(
+            cls.__dict__.get('__slots__', ()))
+        if 'LAYOUT' in cls.__dict__ and 'LENGTH' not in cls.__dict__:
+            cls.LENGTH = cls.LAYOUT.size - 1
+        for datatype in cls.CAPABILITIES:
+            if not hasattr(cls, 'has_' + datatype):
+                setattr(cls, 'has_' + datatype, _capability(datatype))
+        _lazy_strings(cls)
+
     def __init__(self):
         """Constructor"""
         self.data = None
@@ -46,13 +126,14 @@ class Packet():
         self.rssi_byte = None
         self.type_string = None
         self.id_string = None
+        self._strings_pending = False
 
     def has_value(self, datatype):
         """Return True if the sensor supports the given data type.
         sensor.has_value(RFXCOM_TEMPERATURE) is identical to calling
         sensor.has_temperature().
         """
-        return hasattr(self, datatype)
+        return datatype in self.CAPABILITIES and hasattr(self, datatype)
 
     def value(self, datatype):
         """Return the :class:`SensorValue` for the given data type.
@@ -64,7 +145,7 @@ class Packet():
     def __getattr__(self, name):
         typename = name.replace("has_", "", 1)
         if not name == typename:
-            return lambda: self.has_value(typename)
+            return functools.partial(hasattr, self, typename)
         raise AttributeError(name)
 
     def __eq__(self, other):
@@ -79,6 +160,9 @@ class Packet():
         return self.__str__()
 
 
+_lazy_strings(Packet)
+
+
 ###############################################################################
 # Status class
 ###############################################################################
@@ -88,6 +172,11 @@ class Status(Packet):
     Data class for the Status packet type
     """
 
+    __slots__ = ('tranceiver_type', 'firmware_version', 'output_power',
+                 'devices', 'recmodes_mask')
+
+    LENGTH = 0x0D
+
     TYPES = {
         0x50: '310MHz',
         0x51: '315MHz',
@@ -161,6 +250,7 @@ class Status(Packet):
         self.firmware_version = None
         self.output_power = None
         self.devices = None
+        self.recmodes_mask = None
 
     def _decode_recmodes(self, data, index):
         res = set()
@@ -186,8 +276,9 @@ class Status(Packet):
         devs.update(self._decode_recmodes(data[9], 2))
         devs.update(self._decode_recmodes(data[10], 3))
         self.devices = sorted(devs)
+        self.recmodes_mask = int.from_bytes(data[7:11], 'big')
 
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -198,16 +289,120 @@ class Status(Packet):
             self.type_string = 'Unknown'
 
 
+RECMODE_TUPLES = {
+    mode: (i, j)
+    for i, modes in enumerate(Status.RECMODES)
+    for j, mode in enumerate(modes)
+}
+"""
+Mapping of receiving mode names to (listno, sublistno), built from RECMODES
+"""
+
+
 def get_recmode_tuple(mode_name):
     """
     Look for a receiving mode in the RECMODES lists from a name.
     Return a tuple (listno, sublistno), or (None, None) if
     not found.
     """
-    for i, modes in enumerate(Status.RECMODES):
-        if mode_name in modes:
-            return (i, modes.index(mode_name))
-    return (None, None)
+    return RECMODE_TUPLES.get(mode_name, (None, None))
+
+
+def get_recmodes_mask(modenames):
+    """
+    Return the msg3-msg6 bytes enabling the given receiving modes as a
+    big-endian int, comparable with Status.recmodes_mask. Raise ValueError
+    for an unknown mode name.
+    """
+    mask = 0
+    for mode in modenames:
+        byteno, bitno = get_recmode_tuple(mode)
+        if byteno is None:
+            raise ValueError('Unknown mode name '+mode)
+        mask |= 1 << (8 * (3 - byteno) + bitno)
+    return mask
+
+
+def get_recmodes_packet(tranceiver_type, output_power, modenames):
+    """
+    Return the Set Mode interface command enabling the given receiving
+    modes. Raise ValueError for an unknown mode name.
+    """
+    data = bytearray([0x0D, 0x00, 0x00, 0x00, 0x03, tranceiver_type,
+                      output_power, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+                      0x00])
+    data[7:11] = get_recmodes_mask(modenames).to_bytes(4, 'big')
+    return data
+
+
+###############################################################################
+# RecTransMessage class
+###############################################################################
+
+class RecTransMessage(Packet):
+    """
+    Data class for the receiver/transmitter message packet type, the
+    RFXtrx response to a transmit command
+    """
+
+    __slots__ = ('response', 'response_string', 'ack')
+
+    LENGTH = 0x04
+
+    TYPES = {0x00: 'Receiver error',
+             0x01: 'Transmitter response'}
+    """
+    Mapping of numeric subtype values to strings, used in type_string
+    """
+
+    RESPONSES = {0x00: 'ACK, transmit OK',
+                 0x01: 'ACK, but transmit started after 3 seconds delay '
+                       'anyway with RF receive data',
+                 0x02: 'NAK, transmitter did not lock on the requested '
+                       'transmit frequency',
+                 0x03: 'NAK, AC address zero in id1-id4 not allowed'}
+    """
+    Mapping of transmitter response values to strings
+    """
+
+    def __str__(self):
+        return ("RecTransMessage [subtype={0}, seqnbr={1}, "
+                "response={2}]").format(self.type_string, self.seqnbr,
+                                        self.response_string)
+
+    def __init__(self):
+        """Constructor"""
+        super().__init__()
+        self.response = None
+        self.response_string = None
+        self.ack = None
+
+    def load_receive(self, data):
+        """Load data from a bytearray"""
+        self.data = data
+        self.packetlength = data[0]
+        self.packettype = data[1]
+        self.subtype = data[2]
+        self.seqnbr = data[3]
+        self.response = data[4]
+        self.ack = self.subtype == 0x01 and self.response in (0x00, 0x01)
+        self._strings_pending = True
+
+    def _set_strings(self):
+        """Translate loaded numeric values into convenience strings"""
+        self.id_string = str(self.seqnbr)
+        if self.subtype in self.TYPES:
+            self.type_string = self.TYPES[self.subtype]
+        else:
+            # Degrade nicely for yet unknown subtypes
+            self.type_string = self._UNKNOWN_TYPE.format(self.packettype,
+                                                         self.subtype)
+        if self.subtype != 0x01:
+            self.response_string = self.type_string
+        elif self.response in self.RESPONSES:
+            self.response_string = self.RESPONSES[self.response]
+        else:
+            self.response_string = self._UNKNOWN_CMND.format(self.response)
 
 
 ###############################################################################
@@ -219,6 +414,10 @@ class Lighting1(Packet):
     Data class for the Lighting1 packet type
     """
 
+    __slots__ = ('housecode', 'unitcode', 'cmnd', 'cmnd_string')
+
+    LENGTH = 0x07
+
     TYPES = {0x00: 'X10 lighting',
              0x01: 'ARC',
              0x02: 'ELRO AB400D',
@@ -298,7 +497,10 @@ class Lighting1(Packet):
             raise ValueError("Invalid id_string")
 
     def load_receive(self, data):
-        """Load data from a bytearray"""
+        """Load data from a bytearray, raise ValueError for an unknown
+        housecode"""
+        if data[4] not in self.HOUSECODES:
+            raise ValueError("Unknown housecode {0:#04x}".format(data[4]))
         self.data = data
         self.packetlength = data[0]
         self.packettype = data[1]
@@ -309,7 +511,7 @@ class Lighting1(Packet):
         self.cmnd = data[6]
         self.rssi_byte = data[7]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, housecode, unitcode, cmnd):
         """Load data from individual data fields"""
@@ -352,6 +554,11 @@ class Lighting2(Packet):
     Data class for the Lighting2 packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id3', 'id4', 'id_combined', 'unitcode', 'cmnd',
+                 'level', 'cmnd_string')
+
+    LENGTH = 0x0B
+
     TYPES = {0x00: 'AC',
              0x01: 'HomeEasy EU',
              0x02: 'ANSLUT',
@@ -435,7 +642,7 @@ class Lighting2(Packet):
         self.level = data[10]
         self.rssi_byte = data[11]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, unitcode, cmnd,
                      level):
@@ -485,6 +692,11 @@ class Lighting3(Packet):
     Data class for the Lighting3 packet type
     """
 
+    __slots__ = ('system', 'channel1', 'channel2', 'channel', 'cmnd',
+                 'battery', 'cmnd_string')
+
+    LENGTH = 0x08
+
     TYPES = {0x00: 'Ikea Koppla'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -555,7 +767,7 @@ class Lighting3(Packet):
         self.rssi_byte = data[8]
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, system, channel, cmnd):
         """Load data from individual data fields"""
@@ -602,6 +814,11 @@ class Lighting4(Packet):
     Data class for the Lighting4 packet type
     """
 
+    __slots__ = ('cmd1', 'cmd2', 'cmd3', 'cmd', 'pulsehigh', 'pulselow',
+                 'pulse', 'cmnd_string')
+
+    LENGTH = 0x09
+
     TYPES = {0x00: 'PT2262'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -668,7 +885,7 @@ class Lighting4(Packet):
         self.pulse = (self.pulsehigh << 8) + self.pulselow
         self.rssi_byte = data[9]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, cmd, pulse):
         """Load data from individual data fields"""
@@ -716,6 +933,11 @@ class Lighting5(Packet):
     Data class for the Lighting5 packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id3', 'id_combined', 'unitcode', 'cmnd',
+                 'level', 'cmnd_string')
+
+    LENGTH = 0x0A
+
     TYPES = {0x00: 'LightwaveRF, Siemens',
              0x01: 'EMW100 GAO/Everflourish',
              0x02: 'BBSB new types',
@@ -854,7 +1076,7 @@ class Lighting5(Packet):
         self.level = data[9]
         self.rssi_byte = data[10]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, unitcode, cmnd,
                      level):
@@ -916,6 +1138,11 @@ class Lighting6(Packet):
     Data class for the Lighting6 packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id_combined', 'groupcode', 'unitcode', 'cmnd',
+                 'cmndseqnbr', 'rfu', 'level', 'cmnd_string')
+
+    LENGTH = 0x0B
+
     TYPES = {0x00: 'Blyss'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -982,7 +1209,7 @@ class Lighting6(Packet):
         self.rfu = data[10]
         self.rssi_byte = data[11]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, groupcode, unitcode,
                      cmnd, cmndseqnbr):
@@ -1025,6 +1252,20 @@ class Lighting6(Packet):
                 self.cmnd_string = self._UNKNOWN_CMND.format(self.cmnd)
 
 
+def _unpack(layout, data):
+    """ Unpack a frame given as bytes, a bytearray or a list of ints """
+    try:
+        return layout.unpack_from(data)
+    except TypeError:
+        return layout.unpack_from(bytes(data))
+
+
+def _temperature(word):
+    """ Return the temperature in a sign and magnitude word of tenths """
+    temp = float(word & 0x7fff) / 10
+    return -temp if word & 0x8000 else temp
+
+
 ###############################################################################
 # SensorPacket class
 ###############################################################################
@@ -1034,6 +1275,8 @@ class SensorPacket(Packet):
     Abstract superclass for all sensor related packets
     """
 
+    __slots__ = ()
+
     HUMIDITY_TYPES = {0x00: 'dry',
                       0x01: 'comfort',
                       0x02: 'normal',
@@ -1063,6 +1306,10 @@ class Undecoded(SensorPacket):
     Data class for the Undecoded packet type
     """
 
+    __slots__ = ('payload',)
+
+    LENGTH = 0x02
+
     TYPES = {
         0x00: 'ac',
         0x01: 'arc',
@@ -1114,7 +1361,7 @@ class Undecoded(SensorPacket):
         self.subtype = data[2]
         self.payload = data[4:]
 
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1135,6 +1382,13 @@ class Temp(SensorPacket):
     Data class for the Temp1 packet type
     """
 
+    __slots__ = ('id1', 'id2', 'temphigh', 'templow', 'temp', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BHB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'THR128/138, THC138',
              0x02: 'THC238/268,THN132,THWR288,THRN122,THN122,AW129/131',
              0x03: 'THWR800',
@@ -1169,21 +1423,15 @@ class Temp(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.temphigh = data[6]
-        self.templow = data[7]
-        self.temp = float(((self.temphigh & 0x7f) << 8) + self.templow) / 10
-        if self.temphigh >= 0x80:
-            self.temp = -1 * self.temp
-        self.rssi_byte = data[8]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, temp, self.rssi_byte) = \
+            _unpack(self.LAYOUT, data)
+        self.temphigh = temp >> 8
+        self.templow = temp & 0xff
+        self.temp = _temperature(temp)
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1205,6 +1453,14 @@ class Bbq(SensorPacket):
     Data class for the Temp1 packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id3', 'id_combined', 'temp1', 'temp2',
+                 'battery')
+
+    LAYOUT = struct.Struct('>4B3BBxBB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'BBQ1 - Maverick ET-732'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -1230,20 +1486,13 @@ class Bbq(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.id3 = data[6]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.id3, self.temp1, self.temp2,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
         self.id_combined = (self.id1 << 16) + (self.id2 << 8) + self.id3
-        self.temp1 = data[7]
-        self.temp2 = data[9]
-        self.rssi_byte = data[10]
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1266,6 +1515,14 @@ class Humid(SensorPacket):
     Data class for the Humid packet type
     """
 
+    __slots__ = ('id1', 'id2', 'humidity', 'humidity_status',
+                 'humidity_status_string', 'battery')
+
+    LAYOUT = struct.Struct('>4B2B3B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'LaCrosse TX3',
              0x02: 'LaCrosse WS2300',
              0x03: 'Inovalley S80'}
@@ -1293,18 +1550,12 @@ class Humid(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.humidity = data[6]
-        self.humidity_status = data[7]
-        self.rssi_byte = data[8]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.humidity, self.humidity_status,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1331,6 +1582,14 @@ class TempHumid(SensorPacket):
     Data class for the TempHumid packet type
     """
 
+    __slots__ = ('id1', 'id2', 'temphigh', 'templow', 'temp', 'humidity',
+                 'humidity_status', 'humidity_status_string', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BH3B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'THGN122/123, THGN132, THGR122/228/238/268',
              0x02: 'THGR810, THGN800',
              0x03: 'RTGR328',
@@ -1372,23 +1631,15 @@ class TempHumid(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.temphigh = data[6]
-        self.templow = data[7]
-        self.temp = float(((self.temphigh & 0x7f) << 8) + self.templow) / 10
-        if self.temphigh >= 0x80:
-            self.temp = -1 * self.temp
-        self.humidity = data[8]
-        self.humidity_status = data[9]
-        self.rssi_byte = data[10]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, temp, self.humidity, self.humidity_status,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
+        self.temphigh = temp >> 8
+        self.templow = temp & 0xff
+        self.temp = _temperature(temp)
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1415,6 +1666,14 @@ class Baro(SensorPacket):
     Data class for the Baro packet type
     """
 
+    __slots__ = ('id1', 'id2', 'baro1', 'baro2', 'baro', 'forecast',
+                 'forecast_string', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BH2B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -1441,20 +1700,14 @@ class Baro(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.baro1 = data[6]
-        self.baro2 = data[7]
-        self.baro = (self.baro1 << 8) + self.baro2
-        self.forecast = data[8]
-        self.rssi_byte = data[9]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.baro, self.forecast,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
+        self.baro1 = self.baro >> 8
+        self.baro2 = self.baro & 0xff
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1480,6 +1733,13 @@ class RfxMeter(SensorPacket):
     Data class for the RFXMeter packet type
     """
 
+    __slots__ = ('idbyte', 'value', 'value3', 'value2', 'value1')
+
+    LAYOUT = struct.Struct('>4BB2x4B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x00: 'RFXMeter Count',
              0x01: 'RFXMeter Interval',
              0x02: 'RFXMeter Calibration',
@@ -1515,18 +1775,12 @@ class RfxMeter(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.idbyte = data[4]
-        self.value3 = data[7]
-        self.value2 = data[8]
-        self.value1 = data[9]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.idbyte, self.value3, self.value2, self.value1,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
         self.value = (self.value3 << 16) + (self.value2 << 8) + self.value1
-        self.rssi_byte = data[10]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1548,6 +1802,15 @@ class TempHumidBaro(SensorPacket):
     Data class for the TempHumidBaro packet type
     """
 
+    __slots__ = ('id1', 'id2', 'temphigh', 'templow', 'temp', 'humidity',
+                 'humidity_status', 'humidity_status_string', 'baro1', 'baro2',
+                 'baro', 'forecast', 'forecast_string', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BH2BH2B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'BTHR918',
              0x02: 'BTHR918N, BTHR968'}
     """
@@ -1583,27 +1846,18 @@ class TempHumidBaro(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.temphigh = data[6]
-        self.templow = data[7]
-        self.temp = float(((self.temphigh & 0x7f) << 8) + self.templow) / 10
-        if self.temphigh >= 0x80:
-            self.temp = -1 * self.temp
-        self.humidity = data[8]
-        self.humidity_status = data[9]
-        self.baro1 = data[10]
-        self.baro2 = data[11]
-        self.baro = (self.baro1 << 8) + self.baro2
-        self.forecast = data[12]
-        self.rssi_byte = data[13]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, temp, self.humidity, self.humidity_status,
+         self.baro, self.forecast, self.rssi_byte) = \
+            _unpack(self.LAYOUT, data)
+        self.temphigh = temp >> 8
+        self.templow = temp & 0xff
+        self.temp = _temperature(temp)
+        self.baro1 = self.baro >> 8
+        self.baro2 = self.baro & 0xff
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1633,6 +1887,15 @@ class Rain(SensorPacket):
     """
     Data class for the rain packet type
     """
+
+    __slots__ = ('id1', 'id2', 'rainrate1', 'rainrate2', 'rainrate',
+                 'raintotal1', 'raintotal2', 'raintotal3', 'raintotal',
+                 'battery')
+
+    LAYOUT = struct.Struct('>4B2BHBHB')
+    """
+    Precompiled layout of a received frame
+    """
     TYPES = {
         0x01: 'RGR126/682/918',
         0x02: 'PCR800',
@@ -1668,39 +1931,31 @@ class Rain(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.rainrate1 = data[6]
-        self.rainrate2 = data[7]
-        if self.subtype in (1, 2):
-            self.rainrate = float((self.rainrate1 << 8) + self.rainrate2)
-            if self.subtype == 2:
-                self.rainrate = float(self.rainrate) / 100
-        self.raintotal1 = data[8]
-        self.raintotal2 = data[9]
-        self.raintotal3 = data[10]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, rainrate, self.raintotal1, raintotal,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
+        self.rainrate1 = rainrate >> 8
+        self.rainrate2 = rainrate & 0xff
+        if self.subtype == 1:
+            self.rainrate = float(rainrate)
+        elif self.subtype == 2:
+            self.rainrate = float(rainrate) / 100
+        self.raintotal2 = raintotal >> 8
+        self.raintotal3 = raintotal & 0xff
 
         if self.subtype in (1, 2, 3, 4, 5, 7):
-            self.raintotal = float((self.raintotal1 << 16) +
-                                   (self.raintotal2 << 8) +
-                                   self.raintotal3) / 10
+            self.raintotal = float((self.raintotal1 << 16) + raintotal) / 10
         elif self.subtype == 6:
             self.raintotal = 0.266 * self.raintotal3
         elif self.subtype == 8:
             # cartridge can be 0.01 inch rather than 0.2mm
             self.raintotal = 0.2 * self.raintotal3
         elif self.subtype == 9:
-            self.raintotal = 0.254 * float((self.raintotal2 << 8) +
-                                           self.raintotal3)
+            self.raintotal = 0.254 * float(raintotal)
 
-        self.rssi_byte = data[11]
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1722,6 +1977,14 @@ class TempRain(SensorPacket):
     Data class for the TempRain packet type
     """
 
+    __slots__ = ('id1', 'id2', 'temphigh', 'templow', 'temp', 'raintotal',
+                 'battery')
+
+    LAYOUT = struct.Struct('>4B2BHHB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'TR1 - WS1200'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -1748,22 +2011,16 @@ class TempRain(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.temphigh = data[6]
-        self.templow = data[7]
-        self.temp = float(((self.temphigh & 0x7f) << 8) + self.templow) / 10
-        if self.temphigh >= 0x80:
-            self.temp = -1 * self.temp
-        self.raintotal = float(((data[8] & 0x7f) << 8) + data[9]) / 10
-        self.rssi_byte = data[10]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, temp, raintotal, self.rssi_byte) = \
+            _unpack(self.LAYOUT, data)
+        self.temphigh = temp >> 8
+        self.templow = temp & 0xff
+        self.temp = _temperature(temp)
+        self.raintotal = float(raintotal & 0x7fff) / 10
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1786,6 +2043,15 @@ class Wind(SensorPacket):
     Data class for the Wind packet type
     """
 
+    __slots__ = ('id1', 'id2', 'direction', 'average_speed', 'gust',
+                 'temperature', 'temphigh', 'templow', 'chill', 'chillhigh',
+                 'chilllow', 'battery')
+
+    LAYOUT = struct.Struct('>4B2B5HB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'WTGR800',
              0x02: 'WGR800',
              0x03: 'STR918, WGR918, WGR928',
@@ -1825,36 +2091,26 @@ class Wind(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.direction = data[6] * 256 + data[7]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.direction, average_speed, gust, temp,
+         chill, last) = _unpack(self.LAYOUT, data)
         if self.subtype != 0x05:
-            self.average_speed = (data[8] * 256.0 + data[9]) / 10.0
-        self.gust = (data[10] * 256.0 + data[11]) / 10.0
+            self.average_speed = average_speed / 10.0
+        self.gust = gust / 10.0
         if self.subtype in (0x04, 0x08, 0x09):
-            self.temphigh = data[12]
-            self.templow = data[13]
-            self.temperature = float(((self.temphigh & 0x7f) << 8) +
-                                     self.templow) / 10
-            if self.temphigh >= 0x80:
-                self.temperature = -1 * self.temperature
-            self.chillhigh = data[14]
-            self.chilllow = data[15]
-            self.chill = float(((self.chillhigh & 0x7f) << 8) +
-                               self.chilllow) / 10
-            if self.chillhigh >= 0x80:
-                self.chill = -1 * self.chill
+            self.temphigh = temp >> 8
+            self.templow = temp & 0xff
+            self.temperature = _temperature(temp)
+            self.chillhigh = chill >> 8
+            self.chilllow = chill & 0xff
+            self.chill = _temperature(chill)
         if self.subtype == 0x03:
-            self.battery = data[16]
+            self.battery = last
         else:
-            self.rssi_byte = data[16]
+            self.rssi_byte = last
             self.battery = self.rssi_byte & 0x0f
             self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1875,6 +2131,13 @@ class UV(SensorPacket):
     """
     Data class for the uv packet type
     """
+
+    __slots__ = ('id1', 'id2', 'uvi', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BB2xB')
+    """
+    Precompiled layout of a received frame
+    """
     TYPES = {0x01: 'UVN128, UV138',
              0x02: 'UVN800',
              0x03: 'TFA'}
@@ -1896,17 +2159,13 @@ class UV(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.uvi = float(data[6]) / 10
-        self.rssi_byte = data[9]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, uvi, self.rssi_byte) = \
+            _unpack(self.LAYOUT, data)
+        self.uvi = float(uvi) / 10
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1929,6 +2188,14 @@ class Energy1(SensorPacket):
     Data class for the Energy "ELEC1" packet type
     """
 
+    __slots__ = ('id1', 'id2', 'count', 'currentamps1', 'currentamps2',
+                 'currentamps3', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BB3HB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'ELEC1, Electrisave'}
 
     def __str__(self):
@@ -1954,20 +2221,15 @@ class Energy1(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.count = data[6]
-        self.currentamps1 = float((data[7] << 8) + data[8]) / 10
-        self.currentamps2 = float((data[9] << 8) + data[10]) / 10
-        self.currentamps3 = float((data[11] << 8) + data[12]) / 10
-        self.rssi_byte = data[13]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.count, amps1, amps2, amps3,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
+        self.currentamps1 = float(amps1) / 10
+        self.currentamps2 = float(amps2) / 10
+        self.currentamps3 = float(amps3) / 10
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -1990,6 +2252,13 @@ class Energy(SensorPacket):
     Data class for the Energy packet type
     """
 
+    __slots__ = ('id1', 'id2', 'count', 'currentwatt', 'totalwatts', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BBIHIB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'ELEC2, CM119/160',
              0x02: 'ELEC3, CM180'}
     """
@@ -2018,26 +2287,18 @@ class Energy(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.count = data[6]
-        self.currentwatt = ((data[7] * pow(2, 24)) + (data[8] << 16) +
-                            (data[9] << 8) + data[10])
-        self.totalwatts = ((data[11] * pow(2, 40)) + (data[12] * pow(2, 32)) +
-                           (data[13] * pow(2, 24)) + (data[14] << 16) +
-                           (data[15] << 8) + data[16]) / 223.666
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.count, self.currentwatt, total_high,
+         total_low, last) = _unpack(self.LAYOUT, data)
+        self.totalwatts = ((total_high << 32) + total_low) / 223.666
 
         if self.subtype == 0x03:
-            self.battery = data[17]
+            self.battery = last
         else:
-            self.rssi_byte = data[17]
+            self.rssi_byte = last
             self.battery = self.rssi_byte & 0x0f
             self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -2060,6 +2321,14 @@ class Energy4(SensorPacket):
     Data class for the Energy "ELEC4" packet type
     """
 
+    __slots__ = ('id1', 'id2', 'count', 'currentamps1', 'currentamps2',
+                 'currentamps3', 'totalwatthours', 'battery')
+
+    LAYOUT = struct.Struct('>4B2BB4HIB')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'ELEC4, CM180i'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -2090,24 +2359,16 @@ class Energy4(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.count = data[6]
-        self.currentamps1 = float((data[7] << 8) + data[8]) / 10
-        self.currentamps2 = float((data[9] << 8) + data[10]) / 10
-        self.currentamps3 = float((data[11] << 8) + data[12]) / 10
-        self.totalwatthours = ((data[13] * pow(2, 40)) +
-                               (data[14] * pow(2, 32)) +
-                               (data[15] * pow(2, 24)) + (data[16] << 16) +
-                               (data[17] << 8) + data[18]) / 223.666
-        self.rssi_byte = data[19]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.count, amps1, amps2, amps3, total_high,
+         total_low, self.rssi_byte) = _unpack(self.LAYOUT, data)
+        self.currentamps1 = float(amps1) / 10
+        self.currentamps2 = float(amps2) / 10
+        self.currentamps3 = float(amps3) / 10
+        self.totalwatthours = ((total_high << 32) + total_low) / 223.666
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -2130,6 +2391,14 @@ class Energy5(SensorPacket):
     Data class for the Energy "ELEC5" packet type
     """
 
+    __slots__ = ('id1', 'id2', 'voltage', 'currentamps', 'currentwatt',
+                 'totalwatthours', 'powerfactor', 'frequency')
+
+    LAYOUT = struct.Struct('>4B2BB3H3B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x01: 'ELEC5, Revolt'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -2160,21 +2429,16 @@ class Energy5(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.voltage = data[6]
-        self.currentamps = float((data[7] << 8) + data[8]) / 100
-        self.currentwatt = float((data[9] << 8) + data[10]) / 10
-        self.totalwatthours = float((data[11] << 8) + data[12]) * 10
-        self.powerfactor = float(data[13]) / 100
-        self.frequency = float(data[14])
-        self.rssi_byte = data[15]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.voltage, amps, watt, total, powerfactor,
+         frequency, self.rssi_byte) = _unpack(self.LAYOUT, data)
+        self.currentamps = float(amps) / 100
+        self.currentwatt = float(watt) / 10
+        self.totalwatthours = float(total) * 10
+        self.powerfactor = float(powerfactor) / 100
+        self.frequency = float(frequency)
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -2197,6 +2461,21 @@ class Cartelectronic(SensorPacket):
     Data class for the Cartelectronic packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id3', 'id4', 'id5', 'id_combined', 'counter1',
+                 'counter2', 'conswatthours', 'prodwatthours', 'tarif_num',
+                 'voltage', 'currentwatt', 'teleinfo_ok', 'state_byte',
+                 'battery', 'contract_type')
+
+    LAYOUT = struct.Struct('>4B4B')
+    LAYOUTS = {
+        0x01: struct.Struct('>4B4BBBIIHBB'),
+        0x02: struct.Struct('>4B4BIIxB'),
+        0x03: struct.Struct('>4B4BIIBBHBB'),
+    }
+    """
+    Precompiled layouts of a received frame, by subtype
+    """
+
     TYPES = {0x01: 'CARTELECTRONIC_TIC',
              0x02: 'CARTELECTRONIC_ENCODER',
              0x03: 'CARTELECTRONIC_LINKY'}
@@ -2241,52 +2520,35 @@ class Cartelectronic(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.id3 = data[6]
-        self.id4 = data[7]
+        layout = self.LAYOUTS.get(data[2], self.LAYOUT)
+        fields = _unpack(layout, data)
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.id3, self.id4) = fields[:8]
         self.id_combined = ((self.id1 << 24) + (self.id2 << 16) +
                             (self.id3 << 8) + self.id4)
         if self.subtype == 0x01:
             # TIC
-            self.id5 = data[8]
+            (self.id5, self.contract_type, self.counter1, self.counter2,
+             currentwatt, self.state_byte, self.rssi_byte) = fields[8:]
             self.id_combined = (self.id_combined << 8) + self.id5
-            self.contract_type = data[9]
-            self.counter1 = int.from_bytes(data[10:14], 'big')
-            self.counter2 = int.from_bytes(data[14:18], 'big')
-            if data[20] & 0x02:
-                self.currentwatt = int.from_bytes(data[18:20], 'big')
+            if self.state_byte & 0x02:
+                self.currentwatt = currentwatt
             else:
                 self.currentwatt = None
-            self.state_byte = data[20]
-            self.teleinfo_ok = not (data[20] & 0x04) == 0x04
-            self.rssi_byte = data[21]
+            self.teleinfo_ok = not (self.state_byte & 0x04) == 0x04
         elif self.subtype == 0x02:
             # Cartelectronic Encoder
-            self.counter1 = ((data[8] * pow(2, 24)) + (data[9] << 16) +
-                             (data[10] << 8) + data[11])
-            self.counter2 = ((data[12] * pow(2, 24)) + (data[13] << 16) +
-                             (data[14] << 8) + data[15])
-            self.rssi_byte = data[17]
+            self.counter1, self.counter2, self.rssi_byte = fields[8:]
         elif self.subtype == 0x03:
             # Cartelectronic Linky
-            self.conswatthours = ((data[8] * pow(2, 24)) + (data[9] << 16) +
-                                  (data[10] << 8) + data[11])
-            self.prodwatthours = ((data[12] * pow(2, 24)) + (data[13] << 16) +
-                                  (data[14] << 8) + data[15])
-            self.tarif_num = data[16] & 0x0f
-            self.voltage = data[17] + 200
-            self.currentwatt = (data[18] << 8) + data[19]
-            self.state_byte = data[20]
-            self.teleinfo_ok = not (data[20] & 0x04) == 0x04
-            self.rssi_byte = data[21]
+            (self.conswatthours, self.prodwatthours, tarif, voltage,
+             self.currentwatt, self.state_byte, self.rssi_byte) = fields[8:]
+            self.tarif_num = tarif & 0x0f
+            self.voltage = voltage + 200
+            self.teleinfo_ok = not (self.state_byte & 0x04) == 0x04
         self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def _set_strings(self):
         """Translate loaded numeric values into convenience strings"""
@@ -2308,6 +2570,10 @@ class Chime(Packet):
     Data class for the Chime packet type
     """
 
+    __slots__ = ('id1', 'id2', 'sound', 'cmnd', 'cmnd_string')
+
+    LENGTH = 0x07
+
     TYPES = {0x00: 'Byron SX',
              0x01: 'Byron MP001',
              0x02: 'Select Plus',
@@ -2366,7 +2632,7 @@ class Chime(Packet):
         self.sound = data[6]
         self.rssi_byte = data[7]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id1, id2, sound):
         """Load data from individual data fields"""
@@ -2405,6 +2671,14 @@ class Security1(SensorPacket):
     Data class for the Security1 packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id3', 'id_combined', 'security1_status',
+                 'battery', 'security1_status_string')
+
+    LAYOUT = struct.Struct('>4B3B2B')
+    """
+    Precompiled layout of a received frame
+    """
+
     TYPES = {0x00: 'X10 Security',
              0x01: 'X10 Security Motion Detector',
              0x02: 'X10 Security Remote',
@@ -2487,20 +2761,14 @@ class Security1(SensorPacket):
     def load_receive(self, data):
         """Load data from a bytearray"""
         self.data = data
-        self.packetlength = data[0]
-        self.packettype = data[1]
-        self.subtype = data[2]
-        self.seqnbr = data[3]
-        self.id1 = data[4]
-        self.id2 = data[5]
-        self.id3 = data[6]
+        (self.packetlength, self.packettype, self.subtype, self.seqnbr,
+         self.id1, self.id2, self.id3, self.security1_status,
+         self.rssi_byte) = _unpack(self.LAYOUT, data)
         self.id_combined = (self.id1 << 16) + (self.id2 << 8) + self.id3
-        self.security1_status = data[7]
-        self.rssi_byte = data[8]
         if self.subtype not in (0x03, 0x09, 0x0A):
             self.battery = self.rssi_byte & 0x0f
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, status):
         """Load data from individual data fields"""
@@ -2544,6 +2812,11 @@ class Rfy(Packet):
     """
     Data class for the Rfy packet type
     """
+
+    __slots__ = ('id1', 'id2', 'id3', 'id_combined', 'unitcode', 'cmnd',
+                 'cmnd_string', 'rfu1', 'rfu2', 'rfu3')
+    LENGTH = 0x07
+
     TYPES = {0x00: 'Rfy',
              0x01: 'Rfy Extended',
              0x03: 'ASA'}
@@ -2633,7 +2906,7 @@ class Rfy(Packet):
             self.rssi_byte = data[12]
             self.rssi = self.rssi_byte >> 4
 
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, unitcode, cmnd):
         """Load data from individual data fields"""
@@ -2687,6 +2960,11 @@ class RollerTrol(Packet):
     """
     Data class for the RollerTrol packet type
     """
+
+    __slots__ = ('id1', 'id2', 'id3', 'id_combined', 'unitcode', 'cmnd',
+                 'cmnd_string')
+    LENGTH = 0x09
+
     TYPES = {0x00: 'RollerTrol',
              0x01: 'BlindsT1 / Hasta old',
              0x02: 'BlindsT2 / A-OK RF01',
@@ -2762,7 +3040,7 @@ class RollerTrol(Packet):
         self.cmnd = data[8]
         self.rssi_byte = data[9]
         self.rssi = self.rssi_byte >> 4
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, unitcode, cmnd):
         """Load data from individual data fields"""
@@ -2814,11 +3092,16 @@ class DDxxxx(Packet):
     Data class for the DDXxxx packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id3', 'id4', 'id_combined', 'unitcode', 'cmnd',
+                 'cmnd_string', 'percent', 'angle', 'battery_level')
+
     PACKET_TYPE = 0x31
     """
     Packet type for DDXxxx packets
     """
 
+    LENGTH = 0x0C
+
     TYPES = {0x00: 'Brel/Dooya DDxxxx'}
     """
     Mapping of numeric subtype values to strings, used in type_string
@@ -2942,7 +3225,7 @@ class DDxxxx(Packet):
         self.battery_level = data[12] & 0x0F  # Lower 4 bits
         self.rssi = data[12] >> 4  # Upper 4 bits
 
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, unitcode,
                      cmnd, percent=0, angle=0, battery_level=0, rssi=0):
@@ -3009,11 +3292,18 @@ class Funkbus(Packet):
     Data class for the Funkbus packet type
     """
 
+    __slots__ = ('id1', 'id2', 'id_combined', 'groupcode', 'group_string',
+                 'target', 'target_string', 'cmnd', 'cmnd_string', 'time',
+                 'time_string')
+
+    __UNKNOWN_GROUP = "Unknown group ({0:#02x})"
     __UNKNOWN_TIME = "Unknown time ({0:#02x})"
     __ALL = "All"
     __MASTER = "Master"
     __SCENE = "Scene {0}"
 
+    LENGTH = 0x09
+
     TYPES = {0x00: 'Gira remote',
              0x01: 'Insta remote'}
     """
@@ -3149,7 +3439,7 @@ class Funkbus(Packet):
         self.target = data[7]
         self.cmnd = data[8]
         self.time = data[9]
-        self._set_strings()
+        self._strings_pending = True
 
     def set_transmit(self, subtype, seqnbr, id_combined, groupcode, target,
                      cmnd, time):
@@ -3213,6 +3503,7 @@ class Funkbus(Packet):
 
 PACKET_TYPES = {
     0x01: Status,
+    0x02: RecTransMessage,
     0x03: Undecoded,
     0x10: Lighting1,
     0x11: Lighting2,
@@ -3244,6 +3535,85 @@ PACKET_TYPES = {
     0x71: RfxMeter,
 }
 
+TYPE_STRINGS = {
+    (packettype, subtype): type_string
+    for packettype, cls in PACKET_TYPES.items() if cls is not Status
+    for subtype, type_string in cls.TYPES.items()
+}
+""" The type_string of every known (packettype, subtype), the TYPES of
+Status are tranceiver types """
+
+
+def _dispatch_entry(cls):
+    """ Return the (class, shortest lengths by subtype, decoder) of a
+    packet type, length 0 for the subtypes load_receive cannot decode """
+    layouts = getattr(cls, 'LAYOUTS', None)
+    if layouts is None:
+        lengths = bytes([cls.LENGTH]) * 256
+    else:
+        lengths = bytearray(256)
+        for subtype, layout in layouts.items():
+            lengths[subtype] = layout.size - 1
+        lengths = bytes(lengths)
+    return cls, lengths, cls.load_receive
+
+
+DISPATCH = tuple(
+    _dispatch_entry(PACKET_TYPES[packettype])
+    if packettype in PACKET_TYPES else None
+    for packettype in range(256))
+""" The (class, shortest lengths by subtype, decoder) of every packet type
+byte, None for unknown packet types. A frame is decoded only when its
+length is at least the one of its subtype, so short frames and subtypes
+without a layout are rejected before a packet is made. """
+
+
+def _lookup(data):
+    """ Return the dispatch entry of a frame, or None when it is not a
+    complete frame that decodes """
+    if len(data) < 3 or data[0] + 1 != len(data):
+        return None
+    entry = DISPATCH[data[1]]
+    if entry is None or not 0 < entry[1][data[2]] <= data[0]:
+        return None
+    return entry
+
+
+ID_BYTES = {
+    0x03: (4, 4),
+    0x10: (4, 6),
+    0x11: (4, 9),
+    0x12: (4, 7),
+    0x13: (4, 7),
+    0x14: (4, 8),
+    0x15: (4, 8),
+    0x19: (4, 8),
+    0x1A: (4, 8),
+    0x1E: (4, 8),
+    0x20: (4, 7),
+    0x31: (4, 9),
+    0x4E: (4, 7),
+    0x60: (4, 8),
+    0x71: (4, 5),
+}
+""" Slice of the frame that identifies the device, by packettype. Other
+packettypes use bytes 4 and 5. Frames with the same id bytes have the same
+id_string, except for Status and RecTransMessage, which are no devices. """
+
+SUBTYPE_ID_BYTES = {
+    (0x60, 0x01): (4, 9),
+}
+""" Slice of the frame that identifies the device where a subtype differs
+from ID_BYTES: a Cartelectronic TIC has five id bytes, the other
+Cartelectronic subtypes four followed by counter data """
+
+
+def id_bytes(packettype, subtype):
+    """ Return the (start, end) slice of a frame that identifies the
+    device """
+    return SUBTYPE_ID_BYTES.get((packettype, subtype)) or \
+        ID_BYTES.get(packettype, (4, 6))
+
 
 def get_packet(packettype):
     """Return a packet based on the packet type."""
@@ -3264,22 +3634,66 @@ def get_packet_with_id(packettype, subtype, id_string):
 
 def parse(data):
     """ Parse a packet from a bytearray """
-    if data[0] == 0 or len(data) < 2:
-        # null length packet - sometimes happens on initialization
+    # Also rejects null length packets - sometimes happen on initialization
+    entry = _lookup(data)
+    if entry is None:
         return None
-
-    expected_length = data[0] + 1
-    if len(data) != expected_length:
+    cls, _, decoder = entry
+    pkt = cls()
+    try:
+        decoder(pkt, data)
+    except ValueError:
+        # A value the packet type does not know, e.g. a Lighting1 housecode
         return None
+    return pkt
 
-    pkt = get_packet(data[1])
-    if pkt is None:
-        return None
 
+def parse_into(pkt, data):
+    """ Load a frame into an existing packet of its packet type, to reuse
+    packets instead of creating one per frame. Return pkt, or None when
+    the frame does not decode. Attributes load_receive does not set for the
+    subtype of the frame keep their previous values. """
+    entry = _lookup(data)
+    if entry is None or entry[0] is not type(pkt):
+        return None
     try:
-        pkt.load_receive(data)
-    except IndexError:
-        # parsing failed due to invalid packet length
+        entry[2](pkt, data)
+    except ValueError:
         return None
-
     return pkt
+
+
+def parse_many(buffer):
+    """ Parse the consecutive frames in a bytes-like object. Return the
+    list of packets, the number of trailing bytes of an incomplete frame
+    at the end and the number of malformed frames: frames of an unknown
+    packet type, too short for their subtype or holding a value their
+    packet type does not know """
+    if not isinstance(buffer, bytearray):
+        buffer = bytearray(buffer)
+    dispatch = DISPATCH
+    packets = []
+    malformed = 0
+    size = len(buffer)
+    offset = 0
+    while offset < size:
+        length = buffer[offset]
+        if length == 0:
+            # null length packet - sometimes happens on initialization
+            offset += 1
+            continue
+        end = offset + length + 1
+        if end > size:
+            break
+        entry = dispatch[buffer[offset + 1]] if length > 1 else None
+        if entry is not None and 0 < entry[1][buffer[offset + 2]] <= length:
+            pkt = entry[0]()
+            try:
+                entry[2](pkt, buffer[offset:end])
+                packets.append(pkt)
+            except ValueError:
+                malformed += 1
+        else:
+            malformed += 1
+        offset = end
+    return packets, size - offset, malformed
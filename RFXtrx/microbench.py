@@ -0,0 +1,292 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module times the decoding and encoding of every packet type:
+lowlevel.parse, the event construction of RFXtrxTransport.parse, the
+set_transmit encoders and lowlevel.parse_many over the whole corpus. Save
+a baseline and compare later runs with it::
+
+    python -m RFXtrx.microbench --save baseline.json
+    python -m RFXtrx.microbench --compare baseline.json --threshold 0.1
+
+The compare mode exits with status 1 when a benchmark got slower than the
+baseline by more than the threshold. With --memory it reports what the
+receive path allocates per packet type instead, and with --low-allocation
+what it allocates through a ReceivePool::
+
+    python -m RFXtrx.microbench --memory
+    python -m RFXtrx.microbench --memory --low-allocation
+"""
+
+import argparse
+import functools
+import gc
+import inspect
+import json
+import platform
+import sys
+import tracemalloc
+from time import perf_counter_ns
+
+from . import ReceivePool, RFXtrxTransport, lowlevel
+
+SAMPLES = {
+    0x03: '09030104280ab7660470',
+    0x10: '0710002a45050170',
+    0x11: '0b11002a0123456705020870',
+    0x12: '0812002a0134021579',
+    0x13: '0913002a123456015e70',
+    0x14: '0a14002a12345607100f70',
+    0x15: '0b15002a1234410503010070',
+    0x16: '0716002a12340170',
+    0x19: '0919002a123456010170',
+    0x1A: '0c1a002a123456010100000070',
+    0x1E: '091e00003fcc42010000',
+    0x20: '0820004dd3dc540089',
+    0x31: '0c31002a123456780101000070',
+    0x4E: '0a4e0106fcd80013001379',
+    0x4F: '0a4f0106ee090065000369',
+    0x50: '08500211700200a789',
+    0x51: '0a51011170022a01000079',
+    0x52: '0a52012a96038141600379',
+    0x53: '0953012a960304060079',
+    0x54: '105401032f0000f7002000248160825059',
+    0x55: '0b550217b6000000004d3c69',
+    0x56: '105607052c010087000400086874205269',
+    0x57: '09570202640020023c69',
+    0x59: '0d59010f860004001d0000000049',
+    0x5A: '115a0100f200020100000000000000095679',
+    0x5B: '135b01042eb20111121415171817181920212269',
+    0x5C: '0f5c0100f20002e500a0000000094c79',
+    0x60: '15600103077d20068611003a92c900000000014a0279',
+    0x71: '0a71001f21d100201fa460',
+}
+""" A received frame of every packettype that carries RF traffic, as hex """
+
+CORPUS = dict(SAMPLES)
+CORPUS[0x01] = '0d010001025345000c2f01010000'
+CORPUS[0x02] = '0402010700'
+""" A received frame of every class in lowlevel.PACKET_TYPES, as hex """
+
+TRANSMIT_ALIASES = {
+    'status': 'security1_status',
+}
+""" Packet attributes holding set_transmit arguments of another name """
+
+BASELINE_VERSION = 1
+
+
+def transmit_args(pkt):
+    """ Return the set_transmit arguments that encode pkt again """
+    params = list(inspect.signature(pkt.set_transmit).parameters.values())
+    return [getattr(pkt, TRANSMIT_ALIASES.get(param.name, param.name))
+            for param in params
+            if param.default is inspect.Parameter.empty]
+
+
+def benchmarks():
+    """ Yield the (name, function) of every benchmark """
+    for packettype in sorted(CORPUS):
+        frame = bytearray.fromhex(CORPUS[packettype])
+        cls = lowlevel.PACKET_TYPES[packettype]
+        yield ('parse/' + cls.__name__,
+               lambda frame=frame: lowlevel.parse(frame))
+        yield ('event/' + cls.__name__,
+               lambda frame=frame: RFXtrxTransport.parse(frame))
+        if hasattr(cls, 'set_transmit'):
+            args = transmit_args(lowlevel.parse(frame))
+            yield ('transmit/' + cls.__name__,
+                   lambda cls=cls, args=args: cls().set_transmit(*args))
+    stream = bytes.fromhex(''.join(CORPUS[packettype]
+                                   for packettype in sorted(CORPUS)))
+    yield ('batch/parse_many', lambda: lowlevel.parse_many(stream))
+
+
+def measure(func, repeat=3, min_time=0.05):
+    """ Return the best time of func in ns per call, out of repeat runs
+    of at least min_time seconds """
+    number = 1
+    while True:
+        start = perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter_ns() - start
+        if elapsed >= min_time * 1e9:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = perf_counter_ns()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter_ns() - start)
+    return best / number
+
+
+def run(pattern=None, repeat=3, min_time=0.05):
+    """ Run the benchmarks whose name contains pattern, return their ns
+    per call by name """
+    return {name: measure(func, repeat, min_time)
+            for name, func in benchmarks()
+            if pattern is None or pattern in name}
+
+
+def compare(results, baseline, threshold=0.1):
+    """ Return the (name, baseline ns, ns) of the results that are slower
+    than the baseline by more than threshold (a fraction) """
+    return [(name, baseline[name], value)
+            for name, value in sorted(results.items())
+            if name in baseline and value > baseline[name] * (1 + threshold)]
+
+
+def _receive(data):
+    """ Parse a copy of a frame, as framed by FrameBuffer.pop_frame """
+    return RFXtrxTransport.parse(bytearray(data))
+
+
+def measure_memory(frame, count=200, low_allocation=False):
+    """ Return the memory the receive path (framing a copy of the frame
+    and RFXtrxTransport.parse) costs per frame, see
+    :func:`measure_allocations`. With low_allocation, the frames are views
+    parsed by a ReceivePool instead. """
+    data = bytes(frame)
+    if low_allocation:
+        # The pool copies the frame out of the receive buffer itself
+        receive = functools.partial(ReceivePool().parse, memoryview(data))
+    else:
+        receive = functools.partial(_receive, data)
+    return measure_allocations(receive, count)
+
+
+def measure_allocations(func, count=200):
+    """ Return the memory of count calls of func as a dict: the blocks and
+    bytes per call that stay allocated while the results are kept, and
+    the peak bytes allocated during one call """
+    results = [None] * count
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        func()
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        for i in range(count):
+            results[i] = func()
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        func()
+        peak = tracemalloc.get_traced_memory()[1] - current
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    diff = after.compare_to(before, 'filename')
+    return {
+        'blocks': sum(stat.count_diff for stat in diff) / count,
+        'bytes': sum(stat.size_diff for stat in diff) / count,
+        'peak': peak,
+    }
+
+
+def run_memory(pattern=None, low_allocation=False):
+    """ Measure the memory of the packet types whose class name contains
+    pattern, return it by class name """
+    results = {}
+    for packettype in sorted(CORPUS):
+        name = lowlevel.PACKET_TYPES[packettype].__name__
+        if pattern is None or pattern in name:
+            results[name] = measure_memory(
+                bytearray.fromhex(CORPUS[packettype]),
+                low_allocation=low_allocation)
+    return results
+
+
+def load_baseline(path):
+    """ Return the results saved in a baseline file """
+    with open(path, encoding='utf-8') as fileobj:
+        data = json.load(fileobj)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError("Unsupported baseline version")
+    return data['results']
+
+
+def save_baseline(path, results):
+    """ Save results to a baseline file """
+    data = {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'unit': 'ns',
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as fileobj:
+        json.dump(data, fileobj, indent=2, sort_keys=True)
+        fileobj.write('\n')
+
+
+def main(argv=None):
+    """ Run the benchmarks from the command line, return the exit status """
+    parser = argparse.ArgumentParser(
+        prog='python -m RFXtrx.microbench',
+        description="Time decoding and encoding of every packet type")
+    parser.add_argument('--filter', dest='pattern',
+                        help="run the benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="seconds each timing runs at least")
+    parser.add_argument('--save', metavar='FILE',
+                        help="write the results to a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="compare the results with a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="slowdown (as a fraction) that is a regression")
+    parser.add_argument('--memory', action='store_true',
+                        help="report the memory per frame instead of time")
+    parser.add_argument('--low-allocation', action='store_true',
+                        help="measure the memory of a ReceivePool")
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        print("{0:<16}{1:>8}{2:>12}{3:>12}".format(
+            'packet', 'blocks', 'retained', 'peak'))
+        for name, value in run_memory(args.pattern,
+                                      args.low_allocation).items():
+            print("{0:<16}{1[blocks]:>8.1f}{1[bytes]:>10.0f} B"
+                  "{1[peak]:>10.0f} B".format(name, value))
+        return 0
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results = run(args.pattern, args.repeat, args.min_time)
+    for name, value in sorted(results.items()):
+        line = "{0:<32}{1:>10.0f} ns".format(name, value)
+        if name in baseline:
+            line += "  {0:+7.1%}".format(value / baseline[name] - 1)
+        print(line)
+    if args.save:
+        save_baseline(args.save, results)
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print("REGRESSION {0}: {1:.0f} ns -> {2:.0f} ns".format(
+            name, before, after))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# This file is part of pyRFXtrx, a Python library to communicate with
+# the RFXtrx family of devices from http://www.rfxcom.com/
+# See https://github.com/Danielhiversen/pyRFXtrx for the latest version.
+#
+# pyRFXtrx is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyRFXtrx is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pyRFXtrx.  See the file COPYING.txt in the distribution.
+# If not, see <http://www.gnu.org/licenses/>.
+"""
+This module decodes capture files on all cores. The capture is split at
+record boundaries into chunks, which the processes of a pool decode with
+lowlevel.parse and hand to a function::
+
+    def count_sensors(packets):
+        return collections.Counter(pkt.id_string for _, pkt in packets)
+
+    counts = sum(process_capture('fleet.rfxcap', count_sensors),
+                 collections.Counter())
+
+The function runs in the worker processes, so it has to be picklable (a
+module level function or a functools.partial of one). Returning small
+aggregates per chunk, rather than every packet, keeps the results cheap
+to send back.
+
+Records carry no sync marker, so a chunk boundary is a position where
+the next records look well formed. Every worker reports where its last
+record ended, which has to be the start of the next chunk. The first
+chunk starts at the first record, so this proves every boundary. When a
+boundary turns out wrong, the remaining chunks are decoded in this process
+instead, so there is still one result per chunk.
+"""
+
+import functools
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from . import lowlevel
+from .capture import HEADER, RECEIVED, RECORD, SENT, read_header
+
+SYNC_RECORDS = 16
+""" Records that have to look well formed after a chunk boundary """
+
+
+def _is_boundary(data, pos):
+    """ Return True if the records from pos look well formed """
+    previous = 0
+    for _ in range(SYNC_RECORDS):
+        if pos + RECORD.size >= len(data):
+            # The end of the capture or a truncated last record
+            return True
+        offset, direction = RECORD.unpack_from(data, pos)
+        length = data[pos + RECORD.size]
+        if direction not in (RECEIVED, SENT) or length == 0 or \
+                offset < previous:
+            return False
+        previous = offset
+        pos += RECORD.size + length + 1
+    return True
+
+
+def _boundaries(data, chunks):
+    """ Return the positions splitting the records of a mapped capture
+    into at most chunks parts, ending with the size of the capture """
+    size = len(data)
+    bounds = [HEADER.size]
+    for i in range(1, chunks):
+        pos = max(HEADER.size + (size - HEADER.size) * i // chunks,
+                  bounds[-1] + 1)
+        while pos < size and not _is_boundary(data, pos):
+            pos += 1
+        if pos >= size:
+            break
+        bounds.append(pos)
+    bounds.append(size)
+    return bounds
+
+
+def split_capture(path, chunks):
+    """ Return the positions splitting the records of a capture file into
+    at most chunks parts, ending with the size of the file """
+    with open(path, 'rb') as fileobj:
+        read_header(fileobj)
+        with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _boundaries(data, chunks)
+
+
+def _records(data, start_ns, pos, stop, end):
+    """ Yield the (timestamp, packet) of the received frames between pos
+    and stop, end[0] is set to where the last record ended """
+    while pos < stop and pos + RECORD.size < len(data):
+        offset, direction = RECORD.unpack_from(data, pos)
+        frame = pos + RECORD.size
+        following = frame + data[frame] + 1
+        if following > len(data):
+            break
+        pos = following
+        if direction == RECEIVED:
+            pkt = lowlevel.parse(bytearray(data[frame:following]))
+            if pkt is not None:
+                yield (start_ns + offset) / 1e9, pkt
+    end[0] = pos
+
+
+def _process_chunk(path, func, start, stop):
+    """ Return func of the packets of a chunk and where its last record
+    ended """
+    with open(path, 'rb') as fileobj:
+        start_ns = read_header(fileobj)
+        with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = [start]
+            result = func(_records(data, start_ns, start, stop, end))
+            # Walk whatever func left unread to find the end
+            for _ in _records(data, start_ns, end[0], stop, end):
+                pass
+            return result, end[0]
+
+
+def process_capture(path, func, processes=None, chunks=None):
+    """ Decode the received frames of a capture file in a process pool.
+    func is called in the workers with an iterator of the (timestamp,
+    packet) of one chunk, timestamps in seconds since the epoch. Return
+    the results of func for the chunks in capture order. When a worker
+    raises, the outstanding chunks are cancelled and the exception is
+    raised here. """
+    processes = processes or os.cpu_count() or 1
+    bounds = split_capture(path, chunks or processes * 4)
+    results = []
+    executor = ProcessPoolExecutor(processes)
+    try:
+        futures = [executor.submit(_process_chunk, path, func, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for stop, future in zip(bounds[1:], futures):
+            result, end = future.result()
+            results.append(result)
+            if stop < bounds[-1] and end != stop:
+                # The next chunk did not start at a record
+                break
+        else:
+            return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    # Decode the remaining chunks here, each from where the last one ended
+    for stop in bounds[len(results) + 1:]:
+        result, end = _process_chunk(path, func, end, stop)
+        results.append(result)
+    return results
+
+
+def _map_chunk(func, packets):
+    return [func(timestamp, pkt) for timestamp, pkt in packets]
+
+
+def map_capture(path, func, processes=None, chunks=None):
+    """ Return func(timestamp, packet) of every received packet of a
+    capture file in capture order, computed in a process pool """
+    results = []
+    for chunk in process_capture(path, functools.partial(_map_chunk, func),
+                                 processes, chunks):
+        results.extend(chunk)
+    return results
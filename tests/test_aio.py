@@ -0,0 +1,186 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+import RFXtrx
+from RFXtrx.aio import (AsyncConnect, AsyncNetworkTransport,
+                        AsyncSerialTransport)
+
+STATUS = bytes([0x0D, 0x01, 0x00, 0x01, 0x02, 0x53, 0x45, 0x00, 0x0C,
+                0x2F, 0x01, 0x01, 0x00, 0x00])
+START = bytes([0x14, 0x01, 0x07, 0x03, 0x07]) + b'Copyright RFXCOM'
+TEMP = bytes([0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])
+
+
+def respond(command):
+    """Answer an interface command like the firmware does."""
+    if command[4] in (0x02, 0x03):
+        return STATUS
+    if command[4] == 0x07:
+        return START + TEMP
+    return b''
+
+
+async def run_tcp(events):
+    async def handle(reader, writer):
+        while True:
+            try:
+                command = await reader.readexactly(14)
+            except asyncio.IncompleteReadError:
+                return
+            writer.write(respond(command))
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    conn = AsyncConnect(
+        AsyncNetworkTransport(server.sockets[0].getsockname()),
+        event_callback=events.append, modes=['arc', 'oregon'])
+    async with server:
+        await conn.connect(timeout=5)
+        while len(events) < 2:
+            await asyncio.sleep(0.01)
+        await conn.close()
+    return conn
+
+
+def test_network_connect():
+    events = []
+    conn = asyncio.run(run_tcp(events))
+
+    assert isinstance(events[0], RFXtrx.ConnectionDone)
+    assert isinstance(events[1], RFXtrx.SensorEvent)
+    assert events[1].values['Temperature'] == 16.7
+    assert list(conn.sensors()) == ['70:02']
+
+
+def test_network_connect_refused():
+    async def run():
+        server = await asyncio.start_server(
+            lambda reader, writer: None, '127.0.0.1', 0)
+        address = server.sockets[0].getsockname()
+        server.close()
+        await server.wait_closed()
+        conn = AsyncConnect(AsyncNetworkTransport(address))
+        await conn.connect(timeout=5)
+
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        asyncio.run(run())
+
+
+def test_serial_connect():
+    controller, device = os.openpty()
+    events = []
+
+    def firmware():
+        pending = b''
+        while True:
+            try:
+                pending += os.read(controller, 64)
+            except OSError:
+                return
+            while len(pending) >= 14:
+                os.write(controller, respond(pending[:14]))
+                pending = pending[14:]
+
+    thread = threading.Thread(target=firmware, daemon=True)
+    thread.start()
+
+    async def run():
+        conn = AsyncConnect(AsyncSerialTransport(os.ttyname(device)),
+                            event_callback=events.append)
+        await conn.connect(timeout=5)
+        while len(events) < 2:
+            await asyncio.sleep(0.01)
+        await conn.close()
+        return conn
+
+    try:
+        conn = asyncio.run(run())
+    finally:
+        os.close(device)
+        os.close(controller)
+
+    assert isinstance(events[0], RFXtrx.ConnectionDone)
+    assert isinstance(events[1], RFXtrx.SensorEvent)
+    assert conn.sensors()['70:02'].type_string == \
+        'THC238/268,THN132,THWR288,THRN122,THN122,AW129/131'
+
+
+def test_serial_send_does_not_block():
+    controller, device = os.openpty()
+    received = bytearray()
+    frames = 5000
+
+    def reader():
+        while len(received) < frames * 14:
+            received.extend(os.read(controller, 4096))
+
+    async def run():
+        transport = AsyncSerialTransport(os.ttyname(device))
+        await transport.connect()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(frames):
+            transport.send(b'\x0D\x00\x00\x01\x02\x00\x00'
+                           b'\x00\x00\x00\x00\x00\x00\x00')
+        assert loop.time() - start < 1
+        assert transport._outgoing
+        drain = asyncio.ensure_future(transport.drain())
+        await asyncio.sleep(0.05)
+        assert not drain.done()
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        await asyncio.wait_for(drain, 5)
+        await transport.close()
+        await asyncio.get_running_loop().run_in_executor(None, thread.join, 5)
+
+    try:
+        asyncio.run(run())
+    finally:
+        os.close(device)
+        os.close(controller)
+
+    assert len(received) == frames * 14
+
+
+async def silent_server():
+    """Server whose device never answers interface commands."""
+    async def handle(reader, writer):
+        while await reader.read(64):
+            pass
+
+    return await asyncio.start_server(handle, '127.0.0.1', 0)
+
+
+def test_handshake_times_out_without_connect_timeout():
+    async def run():
+        server = await silent_server()
+        conn = AsyncConnect(
+            AsyncNetworkTransport(server.sockets[0].getsockname()))
+        conn.RESPONSE_TIMEOUT = 0.2
+        conn.transport.RESET_TIMEOUT = 0.2
+        async with server:
+            try:
+                await conn.connect()
+            finally:
+                await conn.close()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+
+
+def test_close_fails_pending_request():
+    async def run():
+        server = await silent_server()
+        conn = AsyncConnect(
+            AsyncNetworkTransport(server.sockets[0].getsockname()))
+        async with server:
+            await conn.transport.connect(5)
+            request = asyncio.ensure_future(conn.send_get_status())
+            await asyncio.sleep(0.05)
+            await conn.close()
+            await request
+
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        asyncio.run(run())
@@ -36,6 +36,49 @@ class CoreTestCase(TestCase):
         event = core.transport.parse(bytes_array)
         self.assertIsNone(event)
 
+    def test_short_sensor_packet(self):
+        # Temp and Energy one byte short of their layout
+        for bytes_array in (
+                bytearray([0x07, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7]),
+                bytearray([0x10, 0x5a, 0x01, 0x00, 0xf2, 0x00, 0x02, 0x01,
+                           0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09,
+                           0x56])):
+            self.assertIsNone(RFXtrx.lowlevel.parse(bytes_array))
+
+    def test_slots(self):
+        bytes_array = bytearray([0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])
+        event = RFXtrx.RFXtrxTransport.parse(bytes_array)
+        for obj in (event, event.device, event.pkt):
+            self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertEqual(event.data, bytes_array)
+
+        pkt = event.pkt
+        self.assertIn('temp', RFXtrx.lowlevel.Temp.CAPABILITIES)
+        self.assertNotIn('humidity', RFXtrx.lowlevel.Temp.CAPABILITIES)
+        self.assertTrue(pkt.has_temp())
+        self.assertTrue(pkt.has_value('temp'))
+        self.assertFalse(pkt.has_humidity())
+        self.assertFalse(pkt.has_value('humidity'))
+
+    def test_lazy_strings(self):
+        bytes_array = bytearray([0x0a, 0x52, 0x01, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x2d, 0x00, 0x89])
+        pkt = RFXtrx.lowlevel.parse(bytes_array)
+        self.assertTrue(pkt._strings_pending)
+        self.assertEqual(pkt.type_string, 'THGN122/123, THGN132, THGR122/228/238/268')
+        self.assertTrue(pkt._strings_pending)
+        self.assertEqual(pkt.humidity_status_string, 'dry')
+        self.assertFalse(pkt._strings_pending)
+        self.assertEqual(pkt.id_string, '70:02')
+
+        event = RFXtrx.SensorEvent(RFXtrx.lowlevel.parse(bytes_array))
+        self.assertIsNone(event._values)
+        self.assertEqual(event.values['Humidity'], 45)
+        self.assertIs(event.values, event._values)
+
+        # Unknown Funkbus group codes
+        pkt = RFXtrx.lowlevel.parse(bytearray.fromhex('091e006588e62ca7def2'))
+        self.assertEqual(pkt.group_string, 'Unknown group (0x2c)')
+
     def test_format_packet(self):
         # Lighting1
         core = RFXtrx.Connect(RFXtrx.DummyTransport(self.path), event_callback=_callback)
@@ -0,0 +1,50 @@
+import itertools
+
+from RFXtrx import lowlevel
+from RFXtrx.benchmark import SAMPLES, LoadGenerator, main, percentile
+
+
+def test_samples_cover_receivable_packettypes():
+    assert set(SAMPLES) == set(lowlevel.PACKET_TYPES) - {0x01, 0x02}
+    for packettype, frame in SAMPLES.items():
+        pkt = lowlevel.parse(bytearray.fromhex(frame))
+        assert pkt is not None and pkt.packettype == packettype
+
+
+def test_sensors_have_distinct_ids():
+    generator = LoadGenerator(sensors=200, packettypes=[0x50, 0x52, 0x11])
+    ids = set()
+    for frame in generator.sensors:
+        pkt = lowlevel.parse(bytearray(frame))
+        ids.add((pkt.packettype, pkt.id_string))
+    assert len(ids) == 200
+
+
+def test_schedule_rate_and_bursts():
+    generator = LoadGenerator(rate=1000.0, burst=10, seed=1)
+    frames = list(itertools.islice(generator.schedule(), 5000))
+
+    assert [frame[3] for _, frame in frames[:300]] == \
+        [i % 256 for i in range(300)]
+    # Bursts share their time
+    assert len({offset for offset, _ in frames}) == 500
+    assert 4.0 < frames[-1][0] < 6.0
+
+
+def test_percentile():
+    values = list(range(1000))
+    assert percentile(values, 0.5) == 500
+    assert percentile(values, 0.999) == 999
+    assert percentile([], 0.5) is None
+
+
+def test_benchmark_run(capsys):
+    report = main(['--duration', '0.3', '--rate', '500', '--sensors', '20',
+                   '--seed', '1'])
+
+    assert report['events'] == report['sent'] > 0
+    assert report['dropped'] == 0
+    assert report['latency_p50'] <= report['latency_p99'] <= \
+        report['latency_p999']
+    assert report['cpu_per_event'] > 0
+    assert 'events/sec' in capsys.readouterr().out
@@ -0,0 +1,217 @@
+import time
+
+import pytest
+
+import RFXtrx
+from RFXtrx import capture
+
+TEMP = bytes([0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])
+LIGHT = bytes([0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70])
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def device_events(events):
+    return [event.device.packettype for event in events
+            if getattr(event, 'device', None) is not None]
+
+
+def test_record_and_replay(tmp_path):
+    path = tmp_path / 'session.rfxcap'
+    recorded = []
+    transport = capture.RecordingTransport(RFXtrx.DummyTransport2(), path)
+    core = RFXtrx.Connect(transport, recorded.append)
+    core.connect(5)
+    wait_for(lambda: len(device_events(recorded)) >= 3)
+    core.close_connection()
+    transport.capture.close()
+
+    with open(path, 'rb') as fileobj:
+        records = list(capture.iter_capture(fileobj))
+    sent = [frame for _, direction, frame in records
+            if direction == capture.SENT]
+    assert [frame[4] for frame in sent[:3]] == [0x00, 0x02, 0x07]
+    offsets = [offset for offset, _, _ in records]
+    assert offsets == sorted(offsets)
+
+    replayed = []
+    core = RFXtrx.Connect(capture.ReplayTransport(path, speed=None),
+                          replayed.append)
+    core.connect(5)
+    wait_for(lambda: isinstance(replayed[-1:] and replayed[-1],
+                                RFXtrx.ConnectionLost))
+    core.close_connection()
+
+    # Frames recorded while closing may not have reached the callback
+    expected = device_events(recorded)
+    assert device_events(replayed)[:len(expected)] == expected
+    assert core._status.device.type_string == '433.92MHz'
+
+
+def test_recording_uses_the_receive_pool(tmp_path):
+    wrapped = RFXtrx.DummyTransport2()
+    transport = capture.RecordingTransport(wrapped, tmp_path / 'pool.rfxcap')
+    recorded = []
+    core = RFXtrx.Connect(transport, recorded.append, low_allocation=True)
+
+    assert isinstance(wrapped.pool, RFXtrx.ReceivePool)
+    assert transport.pool is wrapped.pool
+
+    core.connect(5)
+    wait_for(lambda: len(device_events(recorded)) >= 3)
+    core.close_connection()
+    transport.capture.close()
+
+    # The pool hands out the same event for every frame of a subtype
+    events = [event for event in recorded
+              if isinstance(event, RFXtrx.SensorEvent)]
+    assert len(events) > len({id(event) for event in events})
+
+
+def write_capture(path, frames):
+    with capture.CaptureWriter(path) as writer:
+        for offset, frame in frames:
+            writer.write_record(offset, capture.RECEIVED, frame)
+
+
+def replay_all(transport):
+    events = []
+    transport.connect()
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        while True:
+            events.append(transport.receive_blocking())
+    transport.close()
+    return events
+
+
+def test_replay_speed(tmp_path):
+    path = tmp_path / 'paced.rfxcap'
+    write_capture(path, [(0, TEMP), (100000000, LIGHT), (200000000, TEMP)])
+
+    start = time.monotonic()
+    events = replay_all(capture.ReplayTransport(path, speed=2.0))
+    assert 0.09 <= time.monotonic() - start < 0.5
+    assert device_events(events) == [0x50, 0x10, 0x50]
+
+    start = time.monotonic()
+    replay_all(capture.ReplayTransport(path, speed=None))
+    assert time.monotonic() - start < 0.09
+
+
+def test_replay_timeout(tmp_path):
+    path = tmp_path / 'late.rfxcap'
+    write_capture(path, [(0, TEMP), (10000000000, LIGHT)])
+    transport = capture.ReplayTransport(path)
+    transport.connect()
+
+    assert transport.receive_blocking(0.5).device.packettype == 0x50
+    assert transport.receive_blocking(0.05) is None
+    transport.close()
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        transport.receive_blocking()
+
+
+def test_truncated_record_is_skipped(tmp_path):
+    path = tmp_path / 'cut.rfxcap'
+    write_capture(path, [(0, TEMP), (1, LIGHT)])
+    with open(path, 'r+b') as fileobj:
+        fileobj.truncate(len(fileobj.read()) - 2)
+
+    with open(path, 'rb') as fileobj:
+        assert [frame for _, _, frame in capture.iter_capture(fileobj)] == \
+            [TEMP]
+
+
+def test_not_a_capture(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'\x08\x50\x02\x11\x70\x02\x00\xa7\x89' * 4)
+
+    with open(path, 'rb') as fileobj:
+        with pytest.raises(ValueError):
+            list(capture.iter_capture(fileobj))
+
+
+TEMP_OTHER = bytes([0x08, 0x50, 0x02, 0x13, 0x52, 0xa3, 0x00, 0x10, 0x89])
+SECOND = 1000000000
+
+
+def test_reader_queries_by_device_and_time(tmp_path):
+    path = tmp_path / 'month.rfxcap'
+    with capture.CaptureWriter(path) as writer:
+        start = writer.start_ns / 1e9
+        for second in range(10):
+            writer.write_record(second * SECOND, capture.RECEIVED, TEMP)
+            writer.write_record(second * SECOND + SECOND // 2,
+                                capture.RECEIVED, TEMP_OTHER)
+            writer.write_record(second * SECOND + SECOND // 2,
+                                capture.SENT, LIGHT)
+
+    with capture.CaptureReader(path) as reader:
+        assert len(list(reader)) == 30
+        assert sorted(reader.keys()) == [(0x50, 0x02, b'\x52\xa3'),
+                                         (0x50, 0x02, b'\x70\x02')]
+        assert reader.find('52:a3') == [(0x50, 0x02, b'\x52\xa3')]
+        assert reader.find('52:a3', packettype=0x10) == []
+
+        packets = list(reader.packets('52:a3', start + 3, start + 6))
+        assert [round(timestamp - start, 3) for timestamp, _ in packets] == \
+            [3.5, 4.5, 5.5]
+        assert all(pkt.id_string == '52:a3' for _, pkt in packets)
+        assert len(list(reader.packets('70:02'))) == 10
+    assert (tmp_path / 'month.rfxcap.idx').exists()
+
+
+def test_reader_reuses_and_extends_index(tmp_path, monkeypatch):
+    path = tmp_path / 'live.rfxcap'
+    write_capture(path, [(0, TEMP), (SECOND, TEMP_OTHER)])
+    with capture.CaptureReader(path) as reader:
+        assert len(reader.keys()) == 2
+
+    with open(path, 'ab') as fileobj:
+        fileobj.write(capture.RECORD.pack(2 * SECOND, capture.RECEIVED))
+        fileobj.write(TEMP_OTHER)
+    scanned = []
+
+    def device_key(frame):
+        scanned.append(bytes(frame))
+        return key(frame)
+
+    key = capture.device_key
+    monkeypatch.setattr(capture, 'device_key', device_key)
+    with capture.CaptureReader(path) as reader:
+        assert len(list(reader.packets('52:a3'))) == 2
+    assert scanned == [TEMP_OTHER]
+
+    index = (tmp_path / 'live.rfxcap.idx').read_bytes()
+    with capture.CaptureReader(path) as reader:
+        assert len(list(reader.packets('52:a3'))) == 2
+    assert scanned == [TEMP_OTHER]
+    assert (tmp_path / 'live.rfxcap.idx').read_bytes() == index
+
+
+def test_reader_queries_linky_meter(tmp_path):
+    path = tmp_path / 'linky.rfxcap'
+    linky = bytearray([0x15, 0x60, 0x03, 0x5c, 0x2a, 0x29, 0xf2, 0x75, 0x00,
+                       0x19, 0x8d, 0x3a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21,
+                       0x02, 0xb9, 0x00, 0x69])
+    with capture.CaptureWriter(path) as writer:
+        for second in range(5):
+            # Byte 8 is the top byte of the index, not part of the id
+            linky[8] = second
+            writer.write_record(second * SECOND, capture.RECEIVED, linky)
+
+    with capture.CaptureReader(path) as reader:
+        assert reader.keys() == [(0x60, 0x03, b'\x2a\x29\xf2\x75')]
+        assert reader.find('2a29f275') == [(0x60, 0x03, b'\x2a\x29\xf2\x75')]
+        packets = list(reader.packets('2a29f275'))
+
+    assert len(packets) == 5
+    assert [pkt.data[8] for _, pkt in packets] == list(range(5))
+    assert capture.device_key(bytes.fromhex(
+        '15600115770d2006861100' '3a92c900000000014a0279'))[2] == \
+        bytes.fromhex('770d200686')
@@ -0,0 +1,90 @@
+import math
+import random
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from RFXtrx import capture, columnar, lowlevel  # noqa: E402
+from RFXtrx.microbench import CORPUS  # noqa: E402
+
+TEMP = bytes([0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])
+
+
+def random_frames(count=40, seed=22):
+    rng = random.Random(seed)
+    frames = []
+    for packettype in sorted(columnar.DECODERS):
+        base = bytes.fromhex(CORPUS[packettype])
+        for subtype in range(12):
+            for _ in range(count):
+                frames.append(bytes(base[:2]) + bytes([subtype]) + bytes(
+                    rng.randrange(256) for _ in range(len(base) - 3)))
+    return frames
+
+
+def test_decode_matches_parse():
+    frames = random_frames()
+    groups = columnar.decode(frames, range(len(frames)))
+
+    decoded = 0
+    for (packettype, subtype), columns in groups.items():
+        for row, index in enumerate(columns['time']):
+            pkt = lowlevel.parse(bytearray(frames[index]))
+            assert (pkt.packettype, pkt.subtype) == (packettype, subtype)
+            for name, column in columns.items():
+                if name == 'time':
+                    continue
+                expected = getattr(pkt, name)
+                if expected is None:
+                    assert math.isnan(column[row])
+                else:
+                    assert column[row] == expected, name
+            decoded += 1
+    assert decoded == sum(1 for frame in frames
+                          if lowlevel.parse(bytearray(frame)) is not None)
+
+
+def test_fields_by_subtype():
+    frames = random_frames(count=2)
+    groups = columnar.decode(frames)
+
+    assert 'rainrate' in groups[0x55, 0x01]
+    assert 'rainrate' not in groups[0x55, 0x03]
+    assert 'raintotal' not in groups[0x55, 0x0a]
+    assert 'temperature' in groups[0x56, 0x04]
+    assert 'temperature' not in groups[0x56, 0x01]
+    assert 'rssi' not in groups[0x56, 0x03]
+    assert 'counter1' in groups[0x60, 0x02]
+
+
+def test_group_frames_skips_other_frames():
+    light = bytes([0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70])
+    short = TEMP[:-1]
+    groups = columnar.group_frames([light, TEMP, short, TEMP])
+
+    rows, indices = groups[0x50, 0x02]
+    assert list(groups) == [(0x50, 0x02)]
+    assert rows.shape == (2, len(TEMP))
+    assert list(indices) == [1, 3]
+
+    # Cartelectronic subtypes without a layout
+    unknown = bytes([0x15, 0x60, 0x04]) + bytes(19)
+    assert columnar.group_frames([unknown]) == {}
+
+
+def test_decode_capture(tmp_path):
+    path = tmp_path / 'session.rfxcap'
+    light = bytes([0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70])
+    with capture.CaptureWriter(path) as writer:
+        writer.write_record(1000000000, capture.RECEIVED, TEMP)
+        writer.write_record(1500000000, capture.SENT, light)
+        writer.write_record(2000000000, capture.RECEIVED, TEMP)
+        start_ns = writer.start_ns
+
+    columns = columnar.decode_capture(path)[0x50, 0x02]
+
+    assert list(columns['time']) == [start_ns / 1e9 + 1, start_ns / 1e9 + 2]
+    assert list(columns['id_string']) == ['70:02', '70:02']
+    assert list(columns['temp']) == [16.7, 16.7]
+    assert list(columns['battery']) == [9, 9]
@@ -0,0 +1,289 @@
+import socket
+import threading
+import time
+
+import pytest
+
+import RFXtrx
+
+STATUS = bytes([0x0D, 0x01, 0x00, 0x01, 0x02, 0x53, 0x45, 0x00, 0x0C,
+                0x2F, 0x01, 0x01, 0x00, 0x00])
+START = bytes([0x14, 0x01, 0x07, 0x03, 0x07]) + b'Copyright RFXCOM'
+TEMP = bytes([0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])
+LIGHT = bytes([0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70])
+
+
+class PairTransport(RFXtrx.PyNetworkTransport):
+    """Network transport over one end of a socketpair."""
+
+    def __init__(self, sock):
+        super().__init__(None)
+        self.sock.close()
+        self.sock = sock
+
+    def connect(self, timeout=None):
+        pass
+
+
+class Firmware:
+    """Answers interface commands, sending a sensor frame before each
+    response the way a busy RFXtrx interleaves them."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.commands = []
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        pending = b''
+        while True:
+            try:
+                chunk = self.sock.recv(256)
+            except OSError:
+                return
+            if not chunk:
+                return
+            pending += chunk
+            while len(pending) >= 14:
+                command, pending = pending[:14], pending[14:]
+                self.commands.append(command[4])
+                if command[4] in (0x02, 0x03):
+                    self.sock.sendall(TEMP + STATUS)
+                elif command[4] == 0x07:
+                    self.sock.sendall(LIGHT + START)
+
+
+@pytest.fixture(name="connection")
+def fixture_connection():
+    ours, theirs = socket.socketpair()
+    firmware = Firmware(theirs)
+    events = []
+    core = RFXtrx.Connect(PairTransport(ours), events.append,
+                          modes=['arc', 'oregon'])
+    core.connect(5)
+    try:
+        yield core, firmware, events
+    finally:
+        core.close_connection()
+        theirs.close()
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_handshake_keeps_events(connection):
+    core, firmware, events = connection
+
+    wait_for(lambda: len(events) >= 5)
+    assert firmware.commands == [0x00, 0x02, 0x03, 0x02, 0x07]
+    assert isinstance(core._status, RFXtrx.StatusEvent)
+    assert isinstance(events[0], RFXtrx.ConnectionDone)
+    assert [type(event) for event in events[1:]] == \
+        [RFXtrx.SensorEvent] * 3 + [RFXtrx.ControlEvent]
+    assert not any(isinstance(event, RFXtrx.StatusEvent)
+                   for event in events)
+
+
+def test_set_recmodes_at_runtime(connection):
+    core, firmware, events = connection
+    wait_for(lambda: len(events) >= 5)
+
+    response = core.set_recmodes(['arc'])
+
+    assert isinstance(response, RFXtrx.StatusEvent)
+    assert core._modes == ['arc']
+    wait_for(lambda: len(events) >= 6)
+    assert isinstance(events[5], RFXtrx.SensorEvent)
+    assert not any(isinstance(event, RFXtrx.StatusEvent)
+                   for event in events)
+
+
+def test_concurrent_requests(connection):
+    core, firmware, events = connection
+    results = []
+
+    def request():
+        results.append(core.send_get_status())
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(results) == 4
+    assert all(isinstance(item, RFXtrx.StatusEvent) for item in results)
+
+
+def test_dummy_transport_answers_commands():
+    core = RFXtrx.Connect(RFXtrx.DummyTransport(), modes=['ac', 'x10'])
+    core.connect(5)
+
+    assert core._status.device.devices == ['ac', 'x10']
+    assert core.send_get_status().device.type_string == '433.92MHz'
+    core.close_connection()
+
+
+def test_reconnect_keeps_state():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    server.settimeout(10)
+    events = []
+    core = RFXtrx.Connect(RFXtrx.PyNetworkTransport(server.getsockname()),
+                          events.append, modes=['ac', 'hideki', 'lacrosse',
+                                                'oregon', 'x10', 'arc',
+                                                'homeeasy', 'keeloq'],
+                          auto_reconnect=True)
+    core.RECONNECT_MIN_DELAY = 0.01
+    firmwares = []
+
+    def accept():
+        connection, _ = server.accept()
+        firmwares.append(Firmware(connection))
+        return connection
+
+    thread = threading.Thread(target=core.connect, args=(5,))
+    thread.start()
+    first = accept()
+    thread.join(5)
+    wait_for(lambda: len(events) >= 3)
+    assert list(core.sensors()) == ['70:02']
+
+    first.shutdown(socket.SHUT_RDWR)
+    first.close()
+    second = accept()
+    wait_for(lambda: len(events) >= 7)
+    core.close_connection()
+    second.close()
+    server.close()
+
+    assert isinstance(events[3], RFXtrx.ConnectionLost)
+    assert isinstance(events[4], RFXtrx.ConnectionDone)
+    assert events[0].reconnect_latency is None
+    assert 0 < events[4].reconnect_latency < 5
+    assert list(core.sensors()) == ['70:02']
+    # The status reports the wanted modes, so only reset, status and start
+    assert firmwares[0].commands == [0x00, 0x02, 0x07]
+    assert firmwares[1].commands == [0x00, 0x02, 0x07]
+    assert not core._thread.is_alive()
+
+
+def test_low_allocation_dispatch():
+    events = []
+    core = RFXtrx.Connect(RFXtrx.DummyTransport(),
+                          lambda event: events.append(event.copy()),
+                          low_allocation=True)
+    core.connect(5)
+    warm = bytearray(TEMP)
+    warm[7] = 0x00
+
+    first = core.transport.receive(bytearray(TEMP))
+    core._dispatch(first)
+    second = core.transport.receive(warm)
+    core._dispatch(second)
+    core.close_connection()
+
+    assert second is first
+    assert [event.values['Temperature'] for event in events[1:]] == \
+        [16.7, 0.0]
+    assert core.sensors()['70:02'] is first.device
+
+
+class SilentTransport(RFXtrx.DummyTransport):
+    """Dummy transport whose device never answers interface commands."""
+
+    def _respond(self, pkt):
+        pass
+
+
+def test_handshake_times_out():
+    core = RFXtrx.Connect(SilentTransport())
+    core.RESPONSE_TIMEOUT = 0.2
+
+    with pytest.raises(TimeoutError):
+        core.connect(1)
+
+    assert not core._thread.is_alive()
+
+
+def test_close_during_handshake():
+    core = RFXtrx.Connect(SilentTransport())
+    errors = []
+
+    def connect():
+        try:
+            core.connect(10)
+        except TimeoutError as exception:
+            errors.append(exception)
+
+    thread = threading.Thread(target=connect)
+    thread.start()
+    time.sleep(0.2)
+
+    begin = time.monotonic()
+    core.close_connection()
+    thread.join(5)
+
+    assert time.monotonic() - begin < 1
+    assert not thread.is_alive()
+    assert len(errors) == 1
+
+
+def test_deferred_events_are_bounded():
+    transport = SilentTransport()
+    core = RFXtrx.Connect(transport)
+    core.MAX_DEFERRED = 3
+    core._thread = threading.current_thread()
+    frames = [bytearray(TEMP) for _ in range(5)]
+    for i, frame in enumerate(frames):
+        frame[3] = i
+    transport.receive_blocking = \
+        lambda timeout=None: transport.parse(frames.pop(0)) if frames \
+        else transport.parse(bytearray(STATUS))
+
+    core.send_get_status()
+
+    assert [event.device.packettype for event in core._deferred] == \
+        [0x50] * 3
+    assert [event.data[3] for event in core._deferred] == [2, 3, 4]
+
+
+def test_reconnect_backs_off_failed_handshakes():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(4)
+    server.settimeout(10)
+    events = []
+    core = RFXtrx.Connect(RFXtrx.PyNetworkTransport(server.getsockname()),
+                          events.append, auto_reconnect=True)
+    core.RECONNECT_MIN_DELAY = 0.02
+
+    thread = threading.Thread(target=core.connect, args=(5,))
+    thread.start()
+    first, _ = server.accept()
+    Firmware(first)
+    thread.join(5)
+    wait_for(lambda: len(events) >= 1)
+    first.shutdown(socket.SHUT_RDWR)
+    first.close()
+
+    # Accepts and hangs up at once, like ser2net without its USB device
+    accepted = []
+    while len(accepted) < 6:
+        connection, _ = server.accept()
+        accepted.append(time.monotonic())
+        connection.close()
+    core.close_connection()
+    server.close()
+
+    gaps = [later - earlier for earlier, later in zip(accepted, accepted[1:])]
+    assert gaps[-1] > 0.3
+    assert all(later > earlier * 0.9 for earlier, later in zip(gaps, gaps[1:]))
+    assert not any(isinstance(event, RFXtrx.ConnectionDone)
+                   for event in events[1:])
@@ -0,0 +1,117 @@
+import socket
+import time
+
+import pytest
+
+import RFXtrx
+from RFXtrx.emulator import Emulator
+
+TEMP = bytes([0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])
+LIGHT = bytes([0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70])
+GET_STATUS = bytes([0x0D, 0x00, 0x00, 0x05, 0x02, 0x00, 0x00,
+                    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
+
+
+@pytest.fixture(name="emulator")
+def fixture_emulator():
+    emulator = Emulator(traffic=[TEMP, LIGHT], interval=0.02)
+    try:
+        yield emulator
+    finally:
+        emulator.close()
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_serial_handshake_and_traffic(emulator):
+    events = []
+    core = RFXtrx.Connect(RFXtrx.PySerialTransport(emulator.open_pty()),
+                          events.append, modes=['arc', 'oregon'])
+    core.connect(5)
+    wait_for(lambda: len(events) >= 5)
+    core.close_connection()
+
+    assert emulator.commands == [0x00, 0x02, 0x03, 0x02, 0x07]
+    assert core._status.device.devices == ['arc', 'oregon']
+    assert isinstance(events[0], RFXtrx.ConnectionDone)
+    assert [event.device.packettype for event in events[1:5]] == \
+        [0x50, 0x10, 0x50, 0x10]
+
+
+def test_network_transmit_is_acked(emulator):
+    core = RFXtrx.Connect(RFXtrx.PyNetworkTransport(emulator.open_tcp()),
+                          modes=['ac', 'x10', 'arc', 'homeeasy', 'oregon',
+                                 'hideki', 'lacrosse', 'keeloq'])
+    core.transport.track_transmits()
+    core.connect(5)
+    device = RFXtrx.get_device(0x11, 0x00, '1234567:1')
+
+    response = device.send_on(core.transport).result(5)
+    core.close_connection()
+
+    assert response.ack
+    # The status already reports the modes, so there was no set mode
+    assert emulator.commands == [0x00, 0x02, 0x07]
+    assert emulator.transmits[0][1] == 0x11
+
+
+def test_transmit_nak():
+    emulator = Emulator(transmit_response=0x02)
+    transport = RFXtrx.PyNetworkTransport(emulator.open_tcp())
+    transport.connect()
+    transport.track_transmits()
+    device = RFXtrx.get_device(0x11, 0x00, '1234567:1')
+
+    future = device.send_on(transport)
+    assert transport.receive_blocking(5) is None
+    assert not future.result(5).ack
+    transport.close()
+    emulator.close()
+
+
+def test_commands_are_dropped_right_after_reset():
+    emulator = Emulator(reset_time=0.2)
+    sock = socket.create_connection(emulator.open_tcp(), timeout=5)
+    reset = bytes([0x0D] + [0x00] * 13)
+
+    sock.sendall(reset + GET_STATUS)
+    time.sleep(0.25)
+    sock.sendall(GET_STATUS)
+    status = sock.recv(14)
+    sock.close()
+    emulator.close()
+
+    assert status[:5] == bytes([0x0D, 0x01, 0x00, 0x05, 0x02])
+    assert emulator.commands == [0x00, 0x02]
+
+
+def test_connect_waits_for_a_slow_reset():
+    emulator = Emulator(reset_time=0.4)
+    transport = RFXtrx.PyNetworkTransport(emulator.open_tcp())
+    core = RFXtrx.Connect(transport)
+
+    start = time.monotonic()
+    core.connect(5)
+    core.close_connection()
+    emulator.close()
+
+    assert time.monotonic() - start < 2
+    # The status requests sent during the reset were dropped
+    assert emulator.commands == [0x00, 0x02, 0x07]
+
+
+def test_latency_delays_responses():
+    emulator = Emulator(latency=0.1)
+    sock = socket.create_connection(emulator.open_tcp(), timeout=5)
+
+    start = time.monotonic()
+    sock.sendall(GET_STATUS)
+    assert len(sock.recv(14)) == 14
+    assert time.monotonic() - start >= 0.1
+    sock.close()
+    emulator.close()
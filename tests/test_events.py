@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+import pytest
+
+import RFXtrx
+
+TEMP1 = [0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89]
+TEMP2 = [0x08, 0x50, 0x02, 0x12, 0x70, 0x02, 0x00, 0xa8, 0x89]
+OTHER = [0x08, 0x50, 0x02, 0x13, 0x52, 0xa3, 0x00, 0x10, 0x89]
+LIGHT = [0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70]
+
+
+def event(data):
+    return RFXtrx.RFXtrxTransport.parse(bytearray(data))
+
+
+async def drain(stream):
+    stream.close()
+    return [item async for item in stream]
+
+
+def test_drop_oldest():
+    async def run():
+        stream = RFXtrx.EventStream(maxsize=2)
+        for data in (TEMP1, TEMP2, OTHER):
+            assert stream.put(event(data))
+        return stream, await drain(stream)
+
+    stream, events = asyncio.run(run())
+    assert [item.pkt.seqnbr for item in events] == [0x12, 0x13]
+    assert stream.dropped == 1
+
+
+def test_coalesce():
+    async def run():
+        stream = RFXtrx.EventStream(maxsize=2, overflow='coalesce')
+        for data in (TEMP1, OTHER, TEMP2):
+            stream.put(event(data))
+        return await drain(stream)
+
+    events = asyncio.run(run())
+    assert [item.pkt.seqnbr for item in events] == [0x12, 0x13]
+    assert events[0].values['Temperature'] == 16.8
+
+
+def test_filters():
+    async def run():
+        stream = RFXtrx.EventStream(packettypes=[0x50], ids=['52:a3'])
+        for data in (TEMP1, OTHER, LIGHT):
+            stream.put(event(data))
+        stream.put(RFXtrx.ConnectionLost())
+        return await drain(stream)
+
+    events = asyncio.run(run())
+    assert len(events) == 2
+    assert events[0].device.id_string == '52:a3'
+    assert isinstance(events[1], RFXtrx.ConnectionLost)
+
+
+def test_block_without_wait_reports_full():
+    async def run():
+        stream = RFXtrx.EventStream(maxsize=1, overflow='block')
+        drained = []
+        stream.on_drained = drained.append
+        assert stream.put(event(TEMP1), wait=False)
+        assert not stream.put(event(TEMP2), wait=False)
+        events = [await stream.__anext__(), await stream.__anext__()]
+        return events, drained
+
+    events, drained = asyncio.run(run())
+    assert len(events) == 2
+    assert len(drained) == 1
+
+
+def test_block_waits_for_consumer():
+    async def run():
+        stream = RFXtrx.EventStream(maxsize=1, overflow='block')
+
+        def reader():
+            for data in (TEMP1, TEMP2, OTHER):
+                stream.put(event(data))
+            stream.close()
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        events = []
+        async for item in stream:
+            events.append(item)
+            await asyncio.sleep(0.01)
+        thread.join()
+        return stream, events
+
+    stream, events = asyncio.run(run())
+    assert [item.pkt.seqnbr for item in events] == [0x11, 0x12, 0x13]
+    assert stream.dropped == 0
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        RFXtrx.EventStream(overflow='grow', loop=object())
+
+
+def test_connect_events():
+    async def run():
+        core = RFXtrx.Connect(RFXtrx.DummyTransport2())
+        stream = core.events(packettypes=[0x51])
+        core.connect()
+        events = []
+        async for item in stream:
+            events.append(item)
+            if len(events) == 2:
+                break
+        core.close_connection()
+        return core, events
+
+    core, events = asyncio.run(run())
+    assert [item.device.packettype for item in events] == [0x51, 0x51]
+    assert core._streams == []
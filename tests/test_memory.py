@@ -0,0 +1,157 @@
+import tracemalloc
+
+import pytest
+
+import RFXtrx
+from RFXtrx import lowlevel
+from RFXtrx.microbench import CORPUS, measure_allocations, measure_memory
+
+# Blocks an event may keep allocated, and bytes as a multiple of the
+# reference, per packet type. Both hold from Python 3.9 to 3.13.
+BUDGETS = {
+    'Status': (8, 1.50),
+    'RecTransMessage': (5, 0.90),
+    'Undecoded': (8, 1.45),
+    'Lighting1': (8, 1.85),
+    'Lighting2': (10, 2.00),
+    'Lighting3': (9, 2.00),
+    'Lighting4': (11, 2.30),
+    'Lighting5': (9, 2.00),
+    'Lighting6': (10, 2.05),
+    'Chime': (8, 1.70),
+    'RollerTrol': (9, 1.85),
+    'Rfy': (9, 1.85),
+    'Funkbus': (9, 1.85),
+    'Security1': (7, 1.60),
+    'DDxxxx': (9, 1.85),
+    'Bbq': (7, 1.50),
+    'TempRain': (8, 1.55),
+    'Temp': (7, 1.45),
+    'Humid': (6, 1.35),
+    'TempHumid': (7, 1.55),
+    'Baro': (7, 1.50),
+    'TempHumidBaro': (7, 1.70),
+    'Rain': (8, 1.65),
+    'Wind': (8, 1.75),
+    'UV': (7, 1.40),
+    'Energy1': (9, 1.65),
+    'Energy': (8, 1.60),
+    'Energy4': (10, 1.80),
+    'Energy5': (11, 1.85),
+    'Cartelectronic': (9, 2.05),
+    'RfxMeter': (7, 1.45),
+}
+PEAK_BUDGET = 6
+
+
+def eager_parse(data):
+    """Parse a copy of a frame and decode its strings right away."""
+    pkt = lowlevel.parse(bytearray(data))
+    pkt.id_string
+    return pkt
+
+
+@pytest.fixture(scope='module')
+def reference():
+    """Bytes an eagerly parsed Temp packet keeps, on this interpreter."""
+    data = bytes.fromhex(CORPUS[0x50])
+    return measure_allocations(lambda: eager_parse(data))['bytes']
+
+
+def test_budgets_cover_packet_types():
+    assert set(BUDGETS) == \
+        {cls.__name__ for cls in lowlevel.PACKET_TYPES.values()}
+
+
+@pytest.mark.parametrize('packettype', sorted(CORPUS))
+def test_memory_budget(packettype, reference):
+    blocks, size = BUDGETS[lowlevel.PACKET_TYPES[packettype].__name__]
+
+    memory = measure_memory(bytearray.fromhex(CORPUS[packettype]))
+
+    assert memory['blocks'] <= blocks
+    assert memory['bytes'] <= size * reference
+    assert memory['peak'] <= PEAK_BUDGET * reference
+
+
+def test_repeated_frames_do_not_grow_memory(reference):
+    core = RFXtrx.Connect(RFXtrx.DummyTransport())
+    frame = bytearray.fromhex(CORPUS[0x50])
+    core._dispatch(RFXtrx.RFXtrxTransport.parse(bytearray(frame)))
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(1000):
+            core._dispatch(RFXtrx.RFXtrxTransport.parse(bytearray(frame)))
+        grown = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    # Only the latest device of the sensor is kept
+    assert grown < BUDGETS['Temp'][1] * reference * 2
+
+
+@pytest.mark.parametrize('packettype', sorted(set(CORPUS) - {0x01, 0x02}))
+def test_pooled_frames_keep_nothing(packettype):
+    memory = measure_memory(bytearray.fromhex(CORPUS[packettype]),
+                            low_allocation=True)
+
+    assert memory['blocks'] < 0.5
+    assert memory['bytes'] < 16
+
+
+def test_parse_into_reuses_packet():
+    first = bytearray.fromhex(CORPUS[0x50])
+    pkt = lowlevel.parse(first)
+    second = bytearray(first)
+    second[7] = 0x00
+
+    assert lowlevel.parse_into(pkt, second) is pkt
+    assert pkt.temp == 0.0
+    assert lowlevel.parse_into(pkt, second[:-1]) is None
+    assert lowlevel.parse_into(pkt, bytearray.fromhex(CORPUS[0x52])) is None
+
+
+def test_pooled_events_are_views():
+    pool = RFXtrx.ReceivePool()
+    first = bytearray.fromhex(CORPUS[0x50])
+    second = bytearray(first)
+    second[7] = 0x00
+
+    event = pool.parse(memoryview(first))
+    kept = event.copy()
+    again = pool.parse(memoryview(second))
+
+    assert again is event
+    assert again.device is kept.device
+    assert event.values['Temperature'] == 0.0
+    assert kept.values['Temperature'] == 16.7
+    assert kept.data == first
+    assert isinstance(pool.parse(bytearray.fromhex(CORPUS[0x01])),
+                      RFXtrx.StatusEvent)
+
+
+def test_device_strings_are_lazy():
+    event = RFXtrx.RFXtrxTransport.parse(bytearray.fromhex(CORPUS[0x50]))
+
+    assert event.pkt._strings_pending
+    assert event.device.id_string == '70:02'
+    assert not event.pkt._strings_pending
+
+
+def test_pool_keys_devices_by_id_bytes():
+    pool = RFXtrx.ReceivePool()
+    first = bytearray.fromhex(CORPUS[0x50])
+    other = bytearray(first)
+    other[5] = 0x03
+
+    device = pool.parse(memoryview(first)).device
+    second = pool.parse(memoryview(other))
+
+    assert second.device is not device
+    assert second.device.id_string == '70:03'
+    again = pool.parse(memoryview(first))
+    assert again.device is device
+    assert again.pkt._strings_pending
+    assert device.id_string == '70:02'
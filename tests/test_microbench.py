@@ -0,0 +1,62 @@
+import json
+import subprocess
+import sys
+
+from RFXtrx import lowlevel, microbench
+
+
+def test_corpus_covers_packet_types():
+    assert set(microbench.CORPUS) == set(lowlevel.PACKET_TYPES)
+
+
+def test_does_not_import_the_emulator():
+    # The emulator needs pty, which Windows does not have
+    code = ('import sys, RFXtrx.microbench; '
+            'print("RFXtrx.emulator" in sys.modules)')
+    output = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True).stdout
+
+    assert output.strip() == 'False'
+
+
+def test_transmit_args_encode_the_frame_again():
+    for packettype, frame in microbench.CORPUS.items():
+        cls = lowlevel.PACKET_TYPES[packettype]
+        if not hasattr(cls, 'set_transmit'):
+            continue
+        pkt = lowlevel.parse(bytearray.fromhex(frame))
+        encoded = cls()
+        encoded.set_transmit(*microbench.transmit_args(pkt))
+        assert encoded.data[1:3] == pkt.data[1:3]
+        assert lowlevel.parse(encoded.data) is not None
+
+
+def test_benchmark_names():
+    names = [name for name, _ in microbench.benchmarks()]
+    assert 'parse/Temp' in names
+    assert 'event/Status' in names
+    assert 'transmit/Lighting2' in names
+    assert 'transmit/Temp' not in names
+    assert len(names) == len(set(names))
+
+
+def test_compare():
+    baseline = {'parse/Temp': 100.0, 'parse/Wind': 100.0}
+    results = {'parse/Temp': 105.0, 'parse/Wind': 150.0, 'parse/UV': 1.0}
+    assert microbench.compare(results, baseline, 0.1) == \
+        [('parse/Wind', 100.0, 150.0)]
+
+
+def test_save_and_compare(tmp_path, capsys):
+    path = tmp_path / 'baseline.json'
+    args = ['--filter', 'Lighting1', '--repeat', '1', '--min-time', '0.001']
+
+    assert microbench.main(args + ['--save', str(path)]) == 0
+    saved = json.loads(path.read_text())
+    assert set(saved['results']) == \
+        {'parse/Lighting1', 'event/Lighting1', 'transmit/Lighting1'}
+
+    saved['results']['parse/Lighting1'] = 0.001
+    path.write_text(json.dumps(saved))
+    assert microbench.main(args + ['--compare', str(path)]) == 1
+    assert 'REGRESSION parse/Lighting1' in capsys.readouterr().out
@@ -0,0 +1,132 @@
+import collections
+import itertools
+
+import pytest
+
+from RFXtrx import capture, lowlevel, parallel
+from RFXtrx.microbench import SAMPLES
+
+LIGHT = bytes([0x07, 0x10, 0x00, 0x2a, 0x45, 0x05, 0x01, 0x70])
+
+
+def summary(timestamp, pkt):
+    return timestamp, type(pkt).__name__, pkt.id_string
+
+
+def count_types(packets):
+    return collections.Counter(type(pkt).__name__ for _, pkt in packets)
+
+
+def first_only(packets):
+    return [pkt.packettype for _, pkt in itertools.islice(packets, 1)]
+
+
+def fail_on_lighting(packets):
+    for _, pkt in packets:
+        if isinstance(pkt, lowlevel.Lighting1):
+            raise ValueError("Lighting1")
+    return 0
+
+
+def write_capture(path, count=600):
+    frames = [bytes.fromhex(frame) for frame in SAMPLES.values()]
+    with capture.CaptureWriter(path) as writer:
+        for i in range(count):
+            direction = capture.SENT if i % 7 == 0 else capture.RECEIVED
+            writer.write_record(i * 1000, direction, frames[i % len(frames)])
+        start_ns = writer.start_ns
+    return start_ns
+
+
+def expected(path):
+    with capture.CaptureReader(path) as reader:
+        records = [((reader.start_ns + offset) / 1e9,
+                    lowlevel.parse(bytearray(frame)))
+                   for offset, direction, frame in reader
+                   if direction == capture.RECEIVED]
+    return [summary(timestamp, pkt) for timestamp, pkt in records
+            if pkt is not None]
+
+
+def record_starts(path):
+    starts = []
+    pos = capture.HEADER.size
+    with open(path, 'rb') as fileobj:
+        for _, _, frame in capture.iter_capture(fileobj):
+            starts.append(pos)
+            pos += capture.RECORD.size + len(frame)
+    return starts, pos
+
+
+def test_split_at_records(tmp_path):
+    path = tmp_path / 'fleet.rfxcap'
+    write_capture(path)
+    starts, size = record_starts(path)
+
+    bounds = parallel.split_capture(path, 9)
+
+    assert len(bounds) == 10
+    assert bounds[-1] == size
+    assert set(bounds[:-1]) <= set(starts)
+    assert bounds == sorted(set(bounds))
+
+
+def test_map_capture_in_order(tmp_path):
+    path = tmp_path / 'fleet.rfxcap'
+    write_capture(path)
+
+    assert parallel.map_capture(path, summary, processes=2, chunks=7) == \
+        expected(path)
+
+
+def test_process_capture_aggregates(tmp_path):
+    path = tmp_path / 'fleet.rfxcap'
+    write_capture(path)
+
+    counts = sum(parallel.process_capture(path, count_types, processes=2),
+                 collections.Counter())
+
+    assert counts == collections.Counter(
+        name for _, name, _ in expected(path))
+
+
+def test_wrong_boundary_falls_back(tmp_path, monkeypatch):
+    path = tmp_path / 'fleet.rfxcap'
+    write_capture(path)
+    split = parallel.split_capture
+
+    def split_inside_record(path, chunks):
+        bounds = split(path, chunks)
+        bounds[2] += 3
+        return bounds
+
+    monkeypatch.setattr(parallel, 'split_capture', split_inside_record)
+
+    assert parallel.map_capture(path, summary, processes=2, chunks=5) == \
+        expected(path)
+    assert len(parallel.process_capture(path, count_types, processes=2,
+                                        chunks=5)) == 5
+
+
+def test_worker_errors_are_raised(tmp_path):
+    path = tmp_path / 'fleet.rfxcap'
+    write_capture(path)
+
+    with pytest.raises(ValueError, match="Lighting1"):
+        parallel.process_capture(path, fail_on_lighting, processes=2,
+                                 chunks=20)
+
+
+def test_partly_consumed_chunks_and_truncated_tail(tmp_path):
+    path = tmp_path / 'fleet.rfxcap'
+    write_capture(path, count=50)
+    with open(path, 'ab') as fileobj:
+        fileobj.write(capture.RECORD.pack(10 ** 9, capture.RECEIVED) +
+                      LIGHT[:4])
+
+    results = parallel.process_capture(path, first_only, processes=2,
+                                       chunks=4)
+
+    assert len(results) == 4
+    assert parallel.map_capture(path, summary, processes=2, chunks=4) == \
+        expected(path)
@@ -0,0 +1,104 @@
+from RFXtrx import lowlevel
+from RFXtrx.microbench import CORPUS
+
+
+def test_parse_many_matches_parse():
+    frames = [bytearray.fromhex(CORPUS[packettype])
+              for packettype in sorted(CORPUS)]
+    packets, trailing, malformed = lowlevel.parse_many(b''.join(frames))
+
+    assert (trailing, malformed) == (0, 0)
+    assert [pkt.data for pkt in packets] == frames
+    for pkt, frame in zip(packets, frames):
+        expected = lowlevel.parse(bytearray(frame))
+        assert type(pkt) is type(expected)
+        assert pkt.id_string == expected.id_string
+
+
+def test_parse_many_trailing_bytes():
+    frame = bytes.fromhex(CORPUS[0x50])
+    packets, trailing, malformed = lowlevel.parse_many(frame * 2 + frame[:5])
+
+    assert len(packets) == 2
+    assert trailing == 5
+    assert malformed == 0
+
+
+def test_parse_many_malformed_frames():
+    temp = bytes.fromhex(CORPUS[0x50])
+    unknown = bytes([0x03, 0xee, 0x00, 0x00])
+    short = bytes([0x04, 0x50, 0x01, 0x00, 0x00])
+    buffer = b'\x00' + unknown + temp + short + b'\x00\x00' + temp
+
+    packets, trailing, malformed = lowlevel.parse_many(memoryview(buffer))
+
+    assert [pkt.packettype for pkt in packets] == [0x50, 0x50]
+    assert trailing == 0
+    assert malformed == 2
+
+
+def test_parse_many_empty():
+    assert lowlevel.parse_many(b'') == ([], 0, 0)
+
+
+def test_dispatch_table():
+    assert len(lowlevel.DISPATCH) == 256
+    for packettype, entry in enumerate(lowlevel.DISPATCH):
+        cls = lowlevel.PACKET_TYPES.get(packettype)
+        if cls is None:
+            assert entry is None
+            continue
+        assert entry[0] is cls
+        assert entry[2] is cls.load_receive
+        layouts = getattr(cls, 'LAYOUTS', {})
+        for subtype in range(256):
+            length = entry[1][subtype]
+            if subtype in layouts:
+                assert length == layouts[subtype].size - 1
+            elif layouts:
+                assert length == 0
+            else:
+                assert length == cls.LENGTH
+
+
+def test_parse_checks_lengths():
+    for packettype, cls in lowlevel.PACKET_TYPES.items():
+        lengths = lowlevel.DISPATCH[packettype][1]
+        subtype = max(range(256), key=lengths.__getitem__)
+        length = lengths[subtype]
+        # 0x41 is housecode A of Lighting1
+        frame = bytearray([length, packettype, subtype]) + \
+            bytearray([0x41] * (length - 2))
+        assert type(lowlevel.parse(frame)) is cls
+        frame[0] -= 1
+        assert lowlevel.parse(frame[:-1]) is None
+
+    # Cartelectronic subtypes without a layout
+    assert lowlevel.parse(bytearray([0x15, 0x60, 0x04]) + bytearray(19)) \
+        is None
+    assert lowlevel.parse(bytearray([0x01, 0x50])) is None
+    assert lowlevel.parse(bytearray()) is None
+
+
+def test_parse_many_rejects_subtypes():
+    temp = bytes.fromhex(CORPUS[0x50])
+    unknown = bytes([0x15, 0x60, 0x04]) + bytes(19)
+    buffer = temp + unknown + bytes([0x01, 0x50]) + temp
+
+    packets, trailing, malformed = lowlevel.parse_many(buffer)
+
+    assert len(packets) == 2
+    assert (trailing, malformed) == (0, 2)
+
+
+def test_unknown_values_are_malformed():
+    frame = bytearray.fromhex(CORPUS[0x10])
+    frame[4] = 0x00
+
+    assert lowlevel.parse(frame) is None
+    assert lowlevel.parse_into(lowlevel.Lighting1(), frame) is None
+    packets, trailing, malformed = lowlevel.parse_many(
+        bytes(frame) + bytes.fromhex(CORPUS[0x10]))
+
+    assert [pkt.id_string for pkt in packets] == ['E5']
+    assert (trailing, malformed) == (0, 1)
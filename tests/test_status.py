@@ -34,3 +34,18 @@ class StatusTestCase(TestCase):
 
         
 
+
+    def test_recmodes_mask(self):
+        status = RFXtrx.lowlevel.parse(self.data)
+        self.assertEqual(status.recmodes_mask, 0x000C2F01)
+        self.assertEqual(
+            RFXtrx.lowlevel.get_recmodes_mask(status.devices),
+            status.recmodes_mask)
+        self.assertNotEqual(
+            RFXtrx.lowlevel.get_recmodes_mask(['ac', 'arc']),
+            status.recmodes_mask)
+        self.assertEqual(RFXtrx.lowlevel.get_recmode_tuple('oregon'), (2, 5))
+        self.assertEqual(RFXtrx.lowlevel.get_recmode_tuple('nope'),
+                         (None, None))
+        with self.assertRaises(ValueError):
+            RFXtrx.lowlevel.get_recmodes_mask(['nope'])
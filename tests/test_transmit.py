@@ -0,0 +1,156 @@
+import socket
+import threading
+
+import pytest
+
+import RFXtrx
+
+
+def test_parse_ack():
+    pkt = RFXtrx.lowlevel.parse(bytearray([0x04, 0x02, 0x01, 0x07, 0x00]))
+    assert isinstance(pkt, RFXtrx.lowlevel.RecTransMessage)
+    assert pkt.seqnbr == 7
+    assert pkt.ack
+    assert pkt.response_string == 'ACK, transmit OK'
+
+
+def test_parse_nak():
+    pkt = RFXtrx.lowlevel.parse(bytearray([0x04, 0x02, 0x01, 0x07, 0x03]))
+    assert not pkt.ack
+    assert pkt.response_string == \
+        'NAK, AC address zero in id1-id4 not allowed'
+    pkt = RFXtrx.lowlevel.parse(bytearray([0x04, 0x02, 0x00, 0x07, 0x00]))
+    assert not pkt.ack
+    assert pkt.type_string == 'Receiver error'
+
+
+def test_parse_event():
+    event = RFXtrx.RFXtrxTransport.parse(
+        bytearray([0x04, 0x02, 0x01, 0x07, 0x00]))
+    assert isinstance(event, RFXtrx.ResponseEvent)
+
+
+@pytest.fixture(name="link")
+def fixture_link():
+    """A network transport connected to the firmware end of a socketpair."""
+    ours, firmware = socket.socketpair()
+    transport = RFXtrx.PyNetworkTransport(None)
+    transport.sock.close()
+    transport.sock = ours
+    firmware.settimeout(10)
+    try:
+        yield transport, firmware
+    finally:
+        transport.close()
+        firmware.close()
+
+
+def read_frames(firmware, count):
+    frames = []
+    pending = b''
+    while len(frames) < count:
+        pending += firmware.recv(256)
+        while pending and len(pending) > pending[0]:
+            frames.append(pending[:pending[0] + 1])
+            pending = pending[pending[0] + 1:]
+    return frames
+
+
+def test_pipelined_transmits(link):
+    transport, firmware = link
+    transport.track_transmits()
+    device = RFXtrx.get_device(0x11, 0x00, '1234567:1')
+
+    futures = [device.send_on(transport) for _ in range(3)]
+    frames = read_frames(firmware, 3)
+    seqnbrs = [frame[3] for frame in frames]
+    assert len(set(seqnbrs)) == 3
+
+    # Answer out of order, with a NAK for the second transmit
+    for seqnbr, response in ((seqnbrs[2], 0x00), (seqnbrs[0], 0x00),
+                             (seqnbrs[1], 0x02)):
+        firmware.sendall(bytes([0x04, 0x02, 0x01, seqnbr, response]))
+    for _ in range(3):
+        assert transport.receive_blocking() is None
+
+    assert [future.result(1).ack for future in futures] == \
+        [True, False, True]
+    assert len(transport.tracker) == 0
+
+
+def test_unmatched_response_is_an_event(link):
+    transport, firmware = link
+    transport.track_transmits()
+    firmware.sendall(bytes([0x04, 0x02, 0x01, 0x2a, 0x00]))
+
+    event = transport.receive_blocking()
+    assert isinstance(event, RFXtrx.ResponseEvent)
+    assert event.device.seqnbr == 0x2a
+
+
+def test_interface_commands_are_not_tracked(link):
+    transport, firmware = link
+    transport.track_transmits()
+
+    assert transport.send(b'\x0D\x00\x00\x01\x02\x00\x00'
+                          b'\x00\x00\x00\x00\x00\x00\x00') is None
+    assert read_frames(firmware, 1)[0][3] == 0x01
+
+
+def test_transmit_timeout(link):
+    transport, firmware = link
+    transport.track_transmits(timeout=0.05)
+    device = RFXtrx.get_device(0x11, 0x00, '1234567:1')
+
+    future = device.send_off(transport)
+    with pytest.raises(TimeoutError):
+        future.result(5)
+    assert len(transport.tracker) == 0
+
+
+def test_close_fails_pending_transmits(link):
+    transport, firmware = link
+    transport.track_transmits()
+    device = RFXtrx.get_device(0x11, 0x00, '1234567:1')
+
+    future = device.send_on(transport)
+    transport.close()
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        future.result(5)
+
+
+def test_queued_transmit_resolves_to_response(link):
+    transport, firmware = link
+    transport.track_transmits()
+    transport.start_writer()
+    device = RFXtrx.get_device(0x11, 0x00, '1234567:1')
+
+    future = device.send_on(transport)
+    frame = read_frames(firmware, 1)[0]
+    reader = threading.Thread(target=transport.receive_blocking)
+    reader.start()
+    firmware.sendall(bytes([0x04, 0x02, 0x01, frame[3], 0x01]))
+    reader.join(5)
+
+    assert future.result(5).ack
+
+
+def test_one_timer_for_all_transmits():
+    tracker = RFXtrx.TransmitTracker(timeout=0.1)
+    before = threading.active_count()
+
+    futures = [tracker.register(bytearray(8)) for _ in range(30)]
+
+    assert threading.active_count() <= before + 1
+    answered = RFXtrx.lowlevel.parse(bytearray([0x04, 0x02, 0x01, 0x05,
+                                                0x00]))
+    assert tracker.resolve(answered)
+    tracker.timeout = 0.02
+    early = tracker.register(bytearray(8))
+    with pytest.raises(TimeoutError):
+        early.result(0.09)
+    assert futures[4].result(0).ack
+    for future in futures[:4] + futures[5:]:
+        with pytest.raises(TimeoutError):
+            future.result(5)
+    assert len(tracker) == 0
@@ -2,9 +2,11 @@
 import pytest
 import RFXtrx
 
+import os
 import socket
 import dataclasses
 import threading
+import time
 from typing import Tuple, List
 
 
@@ -97,3 +99,198 @@ def test_transport_empty_packet(server: Server):
     connection.sendall(bytes([0x00]))
 
     assert transport.receive_blocking() is None
+
+
+def test_transport_several_packets_in_one_chunk(server: Server):
+    transport, connection = connected_transport(server)
+    connection.sendall(bytes([0x09, 0x03, 0x01, 0x04, 0x28,
+                              0x0a, 0xb7, 0x66, 0x04, 0x70,
+                              0x08, 0x50, 0x02, 0x11, 0x70,
+                              0x02, 0x00, 0xa7, 0x89]))
+    connection.shutdown(socket.SHUT_RDWR)
+
+    first = transport.receive_blocking()
+    second = transport.receive_blocking()
+    assert isinstance(first.pkt, RFXtrx.lowlevel.Undecoded)
+    assert isinstance(second.pkt, RFXtrx.lowlevel.Temp)
+    assert second.values['Temperature'] == 16.7
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        transport.receive_blocking()
+
+
+def test_transport_packet_split_over_chunks(server: Server):
+    transport, connection = connected_transport(server)
+    connection.sendall(bytes([0x08, 0x50, 0x02]))
+    thread = threading.Timer(
+        0.1, connection.sendall,
+        [bytes([0x11, 0x70, 0x02, 0x00, 0xa7, 0x89])])
+    thread.start()
+
+    event = transport.receive_blocking()
+    thread.join()
+    assert isinstance(event.pkt, RFXtrx.lowlevel.Temp)
+    assert bytes(event.data) == bytes([0x08, 0x50, 0x02, 0x11, 0x70,
+                                       0x02, 0x00, 0xa7, 0x89])
+
+
+def test_transport_queued_send(server: Server):
+    server.event.clear()
+    transport = RFXtrx.PyNetworkTransport(server.address, queued_send=True)
+    transport.connect(10)
+    assert server.event.wait(10)
+    connection = server.connections[-1]
+    connection.settimeout(10)
+    packets = [bytes([0x07, 0x10, 0x00, 0x00, 0x41, index, 0x01, 0x70])
+               for index in range(1, 33)]
+
+    futures = [transport.send(pkt) for pkt in packets]
+    for future in futures:
+        assert future.result(10) is None
+
+    expected = b''.join(packets)
+    received = b''
+    while len(received) < len(expected):
+        received += connection.recv(4096)
+    assert received == expected
+    transport.close()
+
+
+def test_writer_coalesces_queued_packets():
+    writes = []
+    release = threading.Event()
+
+    def write(data):
+        release.wait(10)
+        writes.append(bytes(data))
+
+    writer = RFXtrx.TransportWriter(write)
+    futures = [writer.submit(bytes([0x01, index])) for index in range(10)]
+    release.set()
+    writer.stop(10)
+
+    assert all(future.done() for future in futures)
+    assert b''.join(writes) == b''.join(bytes([0x01, index])
+                                        for index in range(10))
+    assert len(writes) < 10
+
+
+def test_writer_reports_failed_write():
+    def write(data):
+        raise RFXtrx.RFXtrxTransportError("gone")
+
+    writer = RFXtrx.TransportWriter(write)
+    future = writer.submit(b'\x01\x02')
+    with pytest.raises(RFXtrx.RFXtrxTransportError):
+        future.result(10)
+    writer.stop(10)
+
+
+def test_reset_quiet_line(server: Server):
+    transport, connection = connected_transport(server)
+
+    duration = transport.reset()
+
+    assert transport.RESET_QUIET <= duration < 0.3
+    assert connection.recv(64)[:5] == bytes([0x0D, 0x00, 0x00, 0x00, 0x00])
+
+
+def test_reset_drains_until_quiet(server: Server):
+    transport, connection = connected_transport(server)
+
+    def noise():
+        for _ in range(5):
+            connection.sendall(bytes([0x09, 0x03, 0x01]))
+            threading.Event().wait(0.02)
+
+    thread = threading.Thread(target=noise)
+    thread.start()
+    duration = transport.reset()
+    thread.join()
+    connection.sendall(bytes([0x08, 0x50, 0x02, 0x11, 0x70,
+                              0x02, 0x00, 0xa7, 0x89]))
+
+    assert 0.08 <= duration < transport.RESET_TIMEOUT
+    assert isinstance(transport.receive_blocking().pkt, RFXtrx.lowlevel.Temp)
+
+
+def test_reset_is_bounded(server: Server):
+    transport, connection = connected_transport(server)
+    transport.RESET_TIMEOUT = 0.2
+    stop = threading.Event()
+
+    def noise():
+        while not stop.wait(0.01):
+            connection.sendall(b'\x00')
+
+    thread = threading.Thread(target=noise)
+    thread.start()
+    try:
+        duration = transport.reset()
+    finally:
+        stop.set()
+        thread.join()
+
+    assert 0.2 <= duration < 0.3
+
+
+def test_receive_timeout(server: Server):
+    transport, connection = connected_transport(server)
+
+    start = time.monotonic()
+    assert transport.receive_blocking(timeout=0.05) is None
+    assert time.monotonic() - start < 1
+
+    connection.sendall(bytes([0x08, 0x50, 0x02]))
+    assert transport.receive_blocking(timeout=0.05) is None
+    connection.sendall(bytes([0x11, 0x70, 0x02, 0x00, 0xa7, 0x89]))
+    event = transport.receive_blocking(timeout=5)
+    assert isinstance(event.pkt, RFXtrx.lowlevel.Temp)
+
+
+def test_close_wakes_up_reader(server: Server):
+    transport, connection = connected_transport(server)
+    errors = []
+
+    def reader():
+        try:
+            transport.receive_blocking()
+        except RFXtrx.RFXtrxTransportError as exception:
+            errors.append(exception)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    time.sleep(0.05)
+    start = time.monotonic()
+    transport.close()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert time.monotonic() - start < 0.5
+    assert len(errors) == 1
+
+
+def test_close_releases_selector(server: Server):
+    transport, _ = connected_transport(server)
+    transport.close()
+    before = len(os.listdir('/proc/self/fd'))
+
+    for _ in range(5):
+        transport.connect()
+        transport.close()
+    deadline = time.monotonic() + 5
+    while len(server.connections) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for connection in server.connections[1:]:
+        connection.close()
+
+    assert transport._selector is None
+    assert len(os.listdir('/proc/self/fd')) == before
+
+
+def test_transports_do_not_share_locks():
+    first = RFXtrx.PyNetworkTransport(None)
+    second = RFXtrx.PyNetworkTransport(None)
+
+    assert first._watch_lock is not second._watch_lock
+    first.sock.close()
+    second.sock.close()
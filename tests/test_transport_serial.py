@@ -0,0 +1,159 @@
+import io
+import os
+import threading
+import time
+
+import RFXtrx
+
+
+class FakeSerial:
+    """Serial port delivering the given chunks, one chunk per wakeup."""
+
+    def __init__(self, chunks):
+        self.chunks = [bytes(chunk) for chunk in chunks]
+        self.reads = []
+
+    @property
+    def in_waiting(self):
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, size=1):
+        self.reads.append(size)
+        chunk = self.chunks[0]
+        data, rest = chunk[:size], chunk[size:]
+        if rest:
+            self.chunks[0] = rest
+        else:
+            self.chunks.pop(0)
+        return data
+
+
+TEMP = [0x08, 0x50, 0x02, 0x11, 0x70, 0x02, 0x00, 0xa7, 0x89]
+UNDECODED = [0x09, 0x03, 0x01, 0x04, 0x28, 0x0a, 0xb7, 0x66, 0x04, 0x70]
+
+
+def serial_transport(chunks):
+    transport = RFXtrx.PySerialTransport('/dev/null')
+    transport.serial = FakeSerial(chunks)
+    return transport
+
+
+def test_several_frames_from_one_read():
+    transport = serial_transport([TEMP + UNDECODED + TEMP])
+
+    events = [transport.receive_blocking() for _ in range(3)]
+
+    assert transport.serial.reads == [len(TEMP + UNDECODED + TEMP)]
+    assert [event.device.type_string for event in events] == \
+        ['THC238/268,THN132,THWR288,THRN122,THN122,AW129/131',
+         'arc',
+         'THC238/268,THN132,THWR288,THRN122,THN122,AW129/131']
+
+
+def test_partial_frame_completes_on_next_read():
+    transport = serial_transport([TEMP + UNDECODED[:3], UNDECODED[3:]])
+
+    first = transport.receive_blocking()
+    second = transport.receive_blocking()
+
+    assert isinstance(first.pkt, RFXtrx.lowlevel.Temp)
+    assert isinstance(second.pkt, RFXtrx.lowlevel.Undecoded)
+    assert bytes(second.data) == bytes(UNDECODED)
+
+
+def test_stalled_frame_requests_missing_bytes():
+    transport = serial_transport([TEMP[:1], TEMP[1:4], TEMP[4:]])
+
+    event = transport.receive_blocking()
+
+    assert isinstance(event.pkt, RFXtrx.lowlevel.Temp)
+    assert transport.serial.reads == [1, 8, 5]
+
+
+def test_null_frame():
+    transport = serial_transport([[0x00] + TEMP])
+
+    assert transport.receive_blocking() is None
+    assert isinstance(transport.receive_blocking().pkt, RFXtrx.lowlevel.Temp)
+
+
+def test_frame_buffer_compacts():
+    frames = RFXtrx.FrameBuffer(size=512)
+    for _ in range(200):
+        frames.feed(bytes(TEMP[:5]))
+        assert frames.pop_frame() is None
+        frames.feed(bytes(TEMP[5:]))
+        assert frames.pop_frame() == bytearray(TEMP)
+    assert len(frames) == 0
+
+
+def test_close_connection_returns_quickly():
+    controller, device = os.openpty()
+    status = bytes([0x0D, 0x01, 0x00, 0x01, 0x02, 0x53, 0x45, 0x00, 0x0C,
+                    0x2F, 0x01, 0x01, 0x00, 0x00])
+    start = bytes([0x14, 0x01, 0x07, 0x03, 0x07]) + b'Copyright RFXCOM'
+
+    def firmware():
+        pending = b''
+        while True:
+            try:
+                pending += os.read(controller, 64)
+            except OSError:
+                return
+            while len(pending) >= 14:
+                command, pending = pending[:14], pending[14:]
+                if command[4] == 0x02:
+                    os.write(controller, status)
+                elif command[4] == 0x07:
+                    os.write(controller, start)
+
+    thread = threading.Thread(target=firmware, daemon=True)
+    thread.start()
+    try:
+        core = RFXtrx.Connect(RFXtrx.PySerialTransport(os.ttyname(device)))
+        core.connect(5)
+        begin = time.monotonic()
+        core.close_connection()
+        assert time.monotonic() - begin < 0.5
+        assert not core._thread.is_alive()
+    finally:
+        os.close(device)
+        os.close(controller)
+
+
+class WindowsSerial(FakeSerial):
+    """Serial port without a file descriptor, like serialwin32."""
+
+    def fileno(self):
+        raise io.UnsupportedOperation("fileno")
+
+    def close(self):
+        pass
+
+
+def test_connect_without_fileno(monkeypatch):
+    monkeypatch.setattr(RFXtrx, 'open_serial',
+                        lambda port: WindowsSerial([TEMP]))
+    transport = RFXtrx.PySerialTransport('COM3')
+
+    transport.connect()
+
+    assert transport._selector is None
+    assert isinstance(transport.receive_blocking().pkt, RFXtrx.lowlevel.Temp)
+    transport.close()
+
+
+def test_frame_buffer_grows_for_bursts():
+    frames = RFXtrx.FrameBuffer(size=512)
+    frames.feed(bytes(TEMP[:5]))
+    frames.feed(bytes(TEMP[5:]) + bytes(TEMP) * 1000)
+
+    assert len(frames) == len(TEMP) * 1001
+    for _ in range(1001):
+        assert frames.pop_frame() == bytearray(TEMP)
+    assert frames.pop_frame() is None
+
+    frames = RFXtrx.FrameBuffer()
+    frames.feed(bytes(TEMP[:5]))
+    frames.feed(bytes(4095))
+    assert len(frames) == 4100